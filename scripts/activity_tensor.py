@@ -0,0 +1,214 @@
+"""
+UIDAI Aadhaar Data Analytics - Activity Tensor
+===============================================
+Materializes the enrolment, demographic and biometric feeds as one dense
+float32 array of shape (activity, pincode, day), indexed by dictionary-
+encoded pincodes and dates and stored as memory-mapped ``.npy`` files.
+
+A companion uint8 presence mask (bit a set when dataset a had a record
+for that pincode-day) keeps the "record with zero activity" case that the
+outer-merged table in notebook 03 distinguishes.
+
+Co-occurrence rates, daily totals and per-pincode series become array
+reductions over the memmap, processed in pincode blocks so memory stays
+bounded, and any number of processes can open the same files zero-copy.
+
+Usage:
+    python scripts/activity_tensor.py            # build and summarize
+    python scripts/activity_tensor.py --summary  # summarize existing tensor
+
+Author: Data Science Team
+Date: October 2026
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ingest import DATASETS, iter_chunks
+
+# Configuration
+BASE_PATH = Path(__file__).parent.parent
+TENSOR_PATH = BASE_PATH / "data" / "processed" / "activity_tensor"
+
+ACTIVITIES = list(DATASETS)
+BLOCK_SIZE = 4096
+
+COOCCURRENCE_PATTERNS = {
+    "All Three Activities": 0b111,
+    "Enrolment Only": 0b001,
+    "Demo Update Only": 0b010,
+    "Bio Update Only": 0b100,
+    "Enrol + Demo": 0b011,
+    "Enrol + Bio": 0b101,
+    "Demo + Bio": 0b110,
+    "No Activity": 0b000,
+}
+
+
+def build_tensor(path=TENSOR_PATH):
+    """Two passes over the shards: build dictionaries, then scatter counts"""
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+
+    # Pass 1: pincode and date dictionaries
+    pincodes, first, last = set(), None, None
+    for dataset in ACTIVITIES:
+        for _, chunk in iter_chunks(dataset):
+            chunk = chunk.dropna(subset=["date"])
+            pincodes.update(chunk["pincode"].unique())
+            lo, hi = chunk["date"].min(), chunk["date"].max()
+            first = lo if first is None else min(first, lo)
+            last = hi if last is None else max(last, hi)
+
+    pincodes = np.array(sorted(pincodes), dtype="U6")
+    dates = np.arange(
+        np.datetime64(first, "D"), np.datetime64(last, "D") + 1, dtype="datetime64[D]"
+    )
+    np.save(path / "pincodes.npy", pincodes)
+    np.save(path / "dates.npy", dates)
+
+    # Pass 2: scatter-add activity into the memory-mapped arrays
+    values = np.lib.format.open_memmap(
+        path / "activity.npy",
+        mode="w+",
+        dtype=np.float32,
+        shape=(len(ACTIVITIES), len(pincodes), len(dates)),
+    )
+    presence = np.lib.format.open_memmap(
+        path / "presence.npy",
+        mode="w+",
+        dtype=np.uint8,
+        shape=(len(pincodes), len(dates)),
+    )
+    values[:] = 0
+    presence[:] = 0
+
+    for a, dataset in enumerate(ACTIVITIES):
+        total_col = DATASETS[dataset]["total_col"]
+        for _, chunk in iter_chunks(dataset):
+            chunk = chunk.dropna(subset=["date"])
+            p = np.searchsorted(pincodes, chunk["pincode"].to_numpy(dtype="U6"))
+            d = (chunk["date"].to_numpy(dtype="datetime64[D]") - dates[0]).astype(int)
+            np.add.at(values[a], (p, d), chunk[total_col].to_numpy(dtype=np.float32))
+            np.bitwise_or.at(presence, (p, d), np.uint8(1 << a))
+
+    values.flush()
+    presence.flush()
+    with open(path / "meta.json", "w") as f:
+        json.dump({"activities": ACTIVITIES}, f)
+    return ActivityTensor(path)
+
+
+class ActivityTensor:
+    """Memory-mapped (activity, pincode, day) tensor with array reductions"""
+
+    def __init__(self, path=TENSOR_PATH, mmap_mode="r"):
+        path = Path(path)
+        self.values = np.load(path / "activity.npy", mmap_mode=mmap_mode)
+        self.presence = np.load(path / "presence.npy", mmap_mode=mmap_mode)
+        self.pincodes = np.load(path / "pincodes.npy")
+        self.dates = np.load(path / "dates.npy")
+        with open(path / "meta.json") as f:
+            self.activities = json.load(f)["activities"]
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    def _blocks(self):
+        for start in range(0, len(self.pincodes), BLOCK_SIZE):
+            yield slice(start, start + BLOCK_SIZE)
+
+    def pincode_id(self, pincodes):
+        """Dictionary codes for pincodes (KeyError for unknown ones)"""
+        pincodes = np.asarray(pincodes, dtype="U6")
+        ids = np.searchsorted(self.pincodes, pincodes)
+        ids = np.minimum(ids, len(self.pincodes) - 1)
+        if (self.pincodes[ids] != pincodes).any():
+            raise KeyError("Unknown pincode(s) in lookup")
+        return ids
+
+    def date_id(self, dates):
+        """Day offsets for dates"""
+        return (np.asarray(dates, dtype="datetime64[D]") - self.dates[0]).astype(int)
+
+    def daily_totals(self):
+        """Total activity per day for each activity type"""
+        totals = np.zeros((len(self.activities), len(self.dates)))
+        for block in self._blocks():
+            totals += self.values[:, block, :].sum(axis=1, dtype=np.float64)
+        return pd.DataFrame(
+            totals.T,
+            index=pd.DatetimeIndex(self.dates, name="date"),
+            columns=self.activities,
+        )
+
+    def pincode_totals(self):
+        """Total activity per pincode for each activity type"""
+        totals = self.values.sum(axis=2, dtype=np.float64)
+        return pd.DataFrame(
+            totals.T,
+            index=pd.Index(self.pincodes, name="pincode"),
+            columns=self.activities,
+        )
+
+    def pincode_series(self, pincode):
+        """Daily series of one pincode, one column per activity type"""
+        row = self.pincode_id([pincode])[0]
+        return pd.DataFrame(
+            np.asarray(self.values[:, row, :]).T,
+            index=pd.DatetimeIndex(self.dates, name="date"),
+            columns=self.activities,
+        )
+
+    def cooccurrence(self):
+        """Counts and rates of activity patterns over observed pincode-days"""
+        counts = np.zeros(8, dtype=np.int64)
+        weights = (1 << np.arange(len(self.activities))).reshape(-1, 1, 1)
+        for block in self._blocks():
+            observed = self.presence[block] > 0
+            pattern = ((self.values[:, block, :] > 0) * weights).sum(axis=0)
+            counts += np.bincount(pattern[observed], minlength=8)
+
+        table = pd.DataFrame(
+            {
+                "Pattern": list(COOCCURRENCE_PATTERNS),
+                "Count": [counts[code] for code in COOCCURRENCE_PATTERNS.values()],
+            }
+        )
+        table["Rate"] = table["Count"] / max(counts.sum(), 1)
+        return table
+
+
+def main():
+    """Build the activity tensor and print its headline reductions"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--path", default=TENSOR_PATH)
+    parser.add_argument(
+        "--summary", action="store_true", help="Summarize an existing tensor"
+    )
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    tensor = ActivityTensor(args.path) if args.summary else build_tensor(args.path)
+    activities, pincodes, days = tensor.shape
+    print(
+        f"✓ Activity tensor: {activities} activities x {pincodes:,} pincodes x "
+        f"{days} days ({time.perf_counter() - start:.1f}s)"
+    )
+
+    start = time.perf_counter()
+    print("\n📊 CO-OCCURRENCE PATTERNS:")
+    print(tensor.cooccurrence().to_string(index=False))
+    print("\n📊 ACTIVITY TOTALS:")
+    print(tensor.daily_totals().sum().to_string())
+    print(f"\n✓ Reductions in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
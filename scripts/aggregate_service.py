@@ -0,0 +1,406 @@
+"""
+UIDAI Aadhaar Data Analytics - Aggregate Query Service
+=======================================================
+Small local asyncio HTTP service serving the precomputed aggregates to
+dashboards as JSON or Arrow, instead of static HTML files that embed the
+full data.
+
+Endpoints (GET):
+
+- /                      endpoint list and cache statistics
+- /states, /districts    totals and equity scores per state / district
+- /gini                  state Gini coefficients
+- /equity/<level>        equity scores (state, district, pincode_cluster)
+- /clusters, /priority   district clusters and intervention priorities
+- /forecasts             demand forecasts
+- /biometric_projection  cohort-projected mandatory biometric updates
+- /capacity              simulated centre capacity per district
+- /priority_scores, /priority_scenarios  what-if district priorities
+- /impact                simulated impact ranges of the recommendations
+- /anomalies             district-months with outlying activity
+- /change_points         detected shifts in daily activity levels
+- /hotspots              LISA enrolment cold spots and high-need clusters
+
+Query parameters filter rows on column equality (``?state=Bihar``);
+``sort=col`` / ``sort=-col`` and ``limit=N`` shape the result, and
+``format=arrow`` (or an Arrow ``Accept`` header) returns an Arrow IPC
+stream when ``pyarrow`` is installed.
+
+Sources are re-read when their file changes, so refreshing the outputs
+(e.g. ``python scripts/equity.py``) is picked up by the next request.
+Loaded frames and encoded responses sit in in-process LRU caches; misses
+are computed in a worker thread, and concurrent requests for the same
+key share one computation, so the event loop never blocks on pandas.
+
+Usage:
+    python scripts/aggregate_service.py [--port 8765] [--cache-size 256]
+
+Author: Data Science Team
+Date: October 2026
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import traceback
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from pathlib import Path
+from urllib.parse import parse_qsl, urlsplit
+
+import pandas as pd
+
+from equity import ACTIVITY_COLS, ENGINE_FILE, LEVELS, EquityEngine
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+# Configuration
+BASE_PATH = Path(__file__).parent.parent
+REPORT_PATH = BASE_PATH / "outputs" / "reports"
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_CACHE_SIZE = 256
+FRAME_CACHE_SIZE = 16
+ANOMALY_Z = 3.5
+
+JSON_TYPE = "application/json"
+ARROW_TYPE = "application/vnd.apache.arrow.stream"
+RESERVED_PARAMS = {"format", "sort", "limit"}
+
+
+def district_anomalies(path=ENGINE_FILE, threshold=ANOMALY_Z, engine=None):
+    """District-months whose activity is a robust-z outlier for the district"""
+    engine = engine or EquityEngine.load(path)
+    stats = engine.monthly_stats["district"]
+    keys = ["state", "district"]
+    frames = []
+    for col in ACTIVITY_COLS:
+        values = stats[col]
+        median = values.groupby(level=keys).transform("median")
+        mad = (values - median).abs().groupby(level=keys).transform("median")
+        robust_z = (0.6745 * (values - median) / mad).where(mad > 0)
+        hit = robust_z.abs() >= threshold
+        frames.append(
+            pd.DataFrame(
+                {
+                    "activity": col,
+                    "value": values[hit],
+                    "district_median": median[hit],
+                    "robust_z": robust_z[hit].round(2),
+                }
+            )
+        )
+    anomalies = pd.concat(frames).reset_index()
+    return anomalies.sort_values("robust_z", key=abs, ascending=False)
+
+
+def csv_endpoint(filename, description):
+    return {
+        "source": REPORT_PATH / filename,
+        "loader": pd.read_csv,
+        "description": description,
+    }
+
+
+ENDPOINTS = {
+    "states": csv_endpoint("state_equity_scores.csv", "State totals and equity scores"),
+    "districts": csv_endpoint(
+        "district_equity_scores.csv", "District totals and equity scores"
+    ),
+    "gini": csv_endpoint("gini_coefficients.csv", "State Gini coefficients"),
+    **{
+        f"equity/{level}": csv_endpoint(
+            f"{level}_equity_scores.csv", f"Equity scores per {level}"
+        )
+        for level in LEVELS
+    },
+    "clusters": csv_endpoint("district_clusters.csv", "District service clusters"),
+    "priority": csv_endpoint(
+        "priority_intervention_districts.csv", "Priority intervention districts"
+    ),
+    "forecasts": csv_endpoint("demand_forecasts.csv", "Demand forecasts"),
+    "biometric_projection": csv_endpoint(
+        "biometric_update_projection.csv", "Projected mandatory biometric updates"
+    ),
+    "capacity": csv_endpoint(
+        "capacity_recommendations.csv", "Recommended centres and mobile units"
+    ),
+    "priority_scores": csv_endpoint(
+        "district_priority_scores.csv", "Multi-criteria district priorities"
+    ),
+    "priority_scenarios": csv_endpoint(
+        "priority_scenarios.csv", "Top-K share of districts across weightings"
+    ),
+    "impact": csv_endpoint("impact_simulation.csv", "Simulated impact ranges"),
+    "change_points": csv_endpoint("change_points.csv", "Daily activity level shifts"),
+    "hotspots": csv_endpoint("district_hotspots.csv", "Spatial hotspots per district"),
+    "anomalies": {
+        "source": ENGINE_FILE,
+        "loader": district_anomalies,
+        "description": f"District-months with |robust z| >= {ANOMALY_Z}",
+    },
+}
+
+
+class QueryError(Exception):
+    """Request that cannot be answered, with its HTTP status"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class AsyncLRUCache:
+    """LRU cache whose misses run in an executor, one computation per key"""
+
+    def __init__(self, maxsize, executor=None):
+        self.maxsize = maxsize
+        self.executor = executor
+        self.entries = OrderedDict()
+        self.pending = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key, compute, *args):
+        if key in self.entries:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return self.entries[key]
+        if key in self.pending:
+            self.hits += 1
+            return await asyncio.shield(self.pending[key])
+
+        self.misses += 1
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self.executor, compute, *args)
+        self.pending[key] = future
+        try:
+            value = await future
+        finally:
+            del self.pending[key]
+
+        self.entries[key] = value
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+        return value
+
+    def stats(self):
+        return {
+            "entries": len(self.entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def select(frame, params):
+    """Filter, sort and limit a frame by query parameters"""
+    for column, value in params.items():
+        if column in RESERVED_PARAMS:
+            continue
+        if column not in frame:
+            raise QueryError(HTTPStatus.BAD_REQUEST, f"Unknown column: {column}")
+        frame = frame[frame[column].astype(str) == value]
+
+    sort = params.get("sort")
+    if sort:
+        column = sort.lstrip("-")
+        if column not in frame:
+            raise QueryError(HTTPStatus.BAD_REQUEST, f"Unknown sort column: {column}")
+        frame = frame.sort_values(column, ascending=not sort.startswith("-"))
+
+    if "limit" in params:
+        try:
+            frame = frame.head(int(params["limit"]))
+        except ValueError:
+            raise QueryError(HTTPStatus.BAD_REQUEST, "limit must be an integer")
+    return frame
+
+
+def encode(frame, fmt):
+    """Serialize a frame as JSON records or an Arrow IPC stream"""
+    if fmt == "arrow":
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        sink = io.BytesIO()
+        with pa.ipc.new_stream(sink, table.schema) as stream:
+            stream.write_table(table)
+        return sink.getvalue()
+    return frame.to_json(orient="records").encode()
+
+
+def render(frame, params, fmt):
+    return encode(select(frame, params), fmt)
+
+
+def error_body(message):
+    return json.dumps({"error": message}).encode()
+
+
+def write_response(writer, status, content_type, body, keep_alive):
+    """Write one HTTP/1.1 response to a connection"""
+    writer.write(
+        (
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Access-Control-Allow-Origin: *\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+            "\r\n"
+        ).encode("latin-1")
+        + body
+    )
+
+
+class AggregateService:
+    """HTTP front end over the aggregate endpoints"""
+
+    def __init__(self, cache_size=DEFAULT_CACHE_SIZE, workers=None):
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.frames = AsyncLRUCache(FRAME_CACHE_SIZE, self.executor)
+        self.responses = AsyncLRUCache(cache_size, self.executor)
+
+    def index(self):
+        return {
+            "endpoints": {
+                f"/{name}": {
+                    "description": endpoint["description"],
+                    "available": endpoint["source"].exists(),
+                }
+                for name, endpoint in ENDPOINTS.items()
+            },
+            "cache": {
+                "frames": self.frames.stats(),
+                "responses": self.responses.stats(),
+            },
+            "arrow": pa is not None,
+        }
+
+    async def query(self, path, params, accept=""):
+        """Encoded body and content type for one GET request"""
+        name = path.strip("/")
+        if not name:
+            return json.dumps(self.index()).encode(), JSON_TYPE
+        if name not in ENDPOINTS:
+            raise QueryError(HTTPStatus.NOT_FOUND, f"Unknown endpoint: /{name}")
+
+        fmt = params.get("format") or ("arrow" if ARROW_TYPE in accept else "json")
+        if fmt not in ("json", "arrow"):
+            raise QueryError(HTTPStatus.BAD_REQUEST, f"Unknown format: {fmt}")
+        if fmt == "arrow" and pa is None:
+            raise QueryError(HTTPStatus.NOT_ACCEPTABLE, "pyarrow is not installed")
+
+        endpoint = ENDPOINTS[name]
+        source = endpoint["source"]
+        try:
+            version = source.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise QueryError(
+                HTTPStatus.NOT_FOUND, f"/{name} has not been generated yet"
+            )
+
+        frame = await self.frames.get((name, version), endpoint["loader"], source)
+        key = (name, version, tuple(sorted(params.items())), fmt)
+        body = await self.responses.get(key, render, frame, params, fmt)
+        return body, ARROW_TYPE if fmt == "arrow" else JSON_TYPE
+
+    async def respond(self, method, target, headers):
+        """Status, content type and body for one request"""
+        if method != "GET":
+            return HTTPStatus.METHOD_NOT_ALLOWED, JSON_TYPE, b'{"error": "GET only"}'
+        url = urlsplit(target)
+        params = dict(parse_qsl(url.query))
+        try:
+            body, content_type = await self.query(
+                url.path, params, headers.get("accept", "")
+            )
+        except QueryError as e:
+            return e.status, JSON_TYPE, error_body(str(e))
+        return HTTPStatus.OK, content_type, body
+
+    async def safe_respond(self, method, target, headers):
+        """``respond``, with unexpected failures logged and answered with 500"""
+        try:
+            return await self.respond(method, target, headers)
+        except Exception:
+            print(f"⚠️ {method} {target} failed:")
+            traceback.print_exc()
+            return (
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                JSON_TYPE,
+                error_body("Internal server error"),
+            )
+
+    async def handle(self, reader, writer):
+        """Serve HTTP/1.1 requests on one connection until it closes"""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                request = request_line.decode("latin-1").split()
+                if len(request) != 3:
+                    write_response(
+                        writer,
+                        HTTPStatus.BAD_REQUEST,
+                        JSON_TYPE,
+                        error_body("Malformed request line"),
+                        keep_alive=False,
+                    )
+                    await writer.drain()
+                    break
+                method, target, version = request
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    field, _, value = line.decode("latin-1").partition(":")
+                    headers[field.strip().lower()] = value.strip()
+
+                status, content_type, body = await self.safe_respond(
+                    method, target, headers
+                )
+                keep_alive = (
+                    version == "HTTP/1.1"
+                    and headers.get("connection", "").lower() != "close"
+                )
+                write_response(writer, status, content_type, body, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        server = await asyncio.start_server(self.handle, host, port)
+        print(f"✓ Serving aggregates on http://{host}:{port}/")
+        async with server:
+            await server.serve_forever()
+
+
+def main():
+    """Run the aggregate service until interrupted"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--cache-size", type=int, default=DEFAULT_CACHE_SIZE)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    service = AggregateService(args.cache_size, args.workers)
+    try:
+        asyncio.run(service.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print("\n✓ Service stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+UIDAI Aadhaar Data Analytics - Calendar Dimension
+==================================================
+One precomputed row per day, keyed by an integer date id (days since
+1970-01-01), carrying the temporal features the notebooks derive row by
+row through ``.dt`` accessors:
+
+- year, month, quarter, month_name, day_of_week, day_name,
+  week_of_year (ISO), is_weekend
+- is_public_holiday / holiday_name: central government gazetted holidays
+- is_school_term: inside a school term of the academic session
+- is_working_day: not a weekend and not a public holiday
+
+Holidays and school terms come from the bundled local table
+data/reference/calendar_events.csv (``start_date, end_date, event_type,
+name``; event_type is public_holiday or school_term), which can be
+extended with state-specific rows without touching the code.
+
+Datasets join through integer date codes: each row is mapped to its date
+id once and every feature is a gather from the calendar arrays.
+
+Usage:
+    python scripts/calendar_dim.py
+
+Author: Data Science Team
+Date: October 2026
+"""
+
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ingest import DATASETS, iter_chunks
+
+# Configuration
+BASE_PATH = Path(__file__).parent.parent
+REFERENCE_PATH = BASE_PATH / "data" / "reference"
+EVENTS_FILE = REFERENCE_PATH / "calendar_events.csv"
+CALENDAR_FILE = BASE_PATH / "data" / "processed" / "calendar_dim.csv"
+
+EVENT_TYPES = ("public_holiday", "school_term")
+CALENDAR_FEATURES = [
+    "year",
+    "month",
+    "quarter",
+    "month_name",
+    "day_of_week",
+    "day_name",
+    "week_of_year",
+    "is_weekend",
+    "is_public_holiday",
+    "holiday_name",
+    "is_school_term",
+    "is_working_day",
+]
+
+
+def date_ids(dates):
+    """Integer date id (days since epoch) per date; -1 for missing dates"""
+    days = pd.to_datetime(pd.Series(dates)).to_numpy().astype("datetime64[D]")
+    ids = days.astype(np.int64)
+    ids[np.isnat(days)] = -1
+    return ids
+
+
+def load_events(path=EVENTS_FILE):
+    """Holiday and school-term ranges from the bundled reference table"""
+    events = pd.read_csv(path, parse_dates=["start_date", "end_date"])
+    unknown = set(events["event_type"]) - set(EVENT_TYPES)
+    if unknown:
+        raise ValueError(f"Unknown calendar event types: {sorted(unknown)}")
+    return events
+
+
+def build_calendar(start, end, events=None):
+    """Calendar dimension for every day in [start, end], indexed by date id"""
+    events = load_events() if events is None else events
+    dates = pd.date_range(pd.Timestamp(start).normalize(), pd.Timestamp(end), freq="D")
+    calendar = pd.DataFrame(
+        {
+            "date": dates,
+            "year": dates.year,
+            "month": dates.month,
+            "quarter": dates.quarter,
+            "month_name": dates.strftime("%b"),
+            "day_of_week": dates.dayofweek,
+            "day_name": dates.day_name(),
+            "week_of_year": dates.isocalendar().week.to_numpy().astype(int),
+        },
+        index=pd.Index(date_ids(dates), name="date_id"),
+    )
+    calendar["is_weekend"] = calendar["day_of_week"].isin([5, 6]).astype(int)
+
+    # Expand event ranges into per-day flags
+    day = date_ids(dates)
+    flags = {kind: np.zeros(len(dates), bool) for kind in EVENT_TYPES}
+    names = pd.Series("", index=calendar.index)
+    for row in events.itertuples(index=False):
+        lo, hi = date_ids([row.start_date, row.end_date])
+        hit = (day >= lo) & (day <= hi)
+        flags[row.event_type] |= hit
+        if row.event_type == "public_holiday" and hit.any():
+            names[hit] = np.where(
+                names[hit] == "", row.name, names[hit] + " / " + row.name
+            )
+
+    calendar["is_public_holiday"] = flags["public_holiday"].astype(int)
+    calendar["holiday_name"] = names.replace("", None)
+    calendar["is_school_term"] = flags["school_term"].astype(int)
+    calendar["is_working_day"] = (
+        (calendar["is_weekend"] == 0) & (calendar["is_public_holiday"] == 0)
+    ).astype(int)
+    return calendar
+
+
+def add_calendar_features(df, features=CALENDAR_FEATURES, calendar=None):
+    """Join calendar features onto a frame with a ``date`` column via date ids"""
+    ids = date_ids(df["date"])
+    valid = ids >= 0
+    if calendar is None:
+        calendar = build_calendar(
+            pd.Timestamp(ids[valid].min(), unit="D"),
+            pd.Timestamp(ids[valid].max(), unit="D"),
+        )
+    offset = ids - calendar.index[0]
+    if (offset[valid] < 0).any() or (offset[valid] >= len(calendar)).any():
+        raise ValueError("Dates fall outside the calendar range")
+
+    df = df.copy()
+    df["date_id"] = ids
+    rows = np.where(valid, offset, 0)
+    for feature in features:
+        values = calendar[feature].to_numpy()[rows]
+        df[feature] = pd.Series(values, index=df.index).where(valid)
+    return df
+
+
+def main():
+    """Build the calendar dimension over the raw data date range"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--events", default=EVENTS_FILE)
+    args = parser.parse_args()
+
+    first, last = None, None
+    for dataset in DATASETS:
+        for _, chunk in iter_chunks(dataset):
+            lo, hi = chunk["date"].min(), chunk["date"].max()
+            first = lo if first is None else min(first, lo)
+            last = hi if last is None else max(last, hi)
+
+    calendar = build_calendar(first, last, load_events(args.events))
+    CALENDAR_FILE.parent.mkdir(parents=True, exist_ok=True)
+    calendar.to_csv(CALENDAR_FILE)
+    print(
+        f"✓ Calendar {first:%Y-%m-%d} to {last:%Y-%m-%d}: {len(calendar)} days, "
+        f"{calendar['is_public_holiday'].sum()} public holidays, "
+        f"{calendar['is_school_term'].sum()} school-term days"
+    )
+
+
+if __name__ == "__main__":
+    main()
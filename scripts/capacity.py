@@ -0,0 +1,315 @@
+"""
+UIDAI Aadhaar Data Analytics - Centre Capacity Simulator
+=========================================================
+Simulates queues at candidate enrolment-centre and mobile-unit
+configurations per district, so recommendations on new centres rest on
+wait times and utilization rather than rules of thumb.
+
+Demand per district and open day comes from the observed daily totals
+(enrolments and updates) or from the demand forecasts (forecasting.py),
+shaped by the national day-of-week profile of the enrolment data.
+
+A configuration is a number of permanent centres (COUNTERS_PER_CENTRE
+counters each, open every open day) plus mobile units (one counter,
+visiting on the MOBILE_DAYS busiest weekdays). Each simulated day:
+
+- arrivals are Poisson in number and uniform over the opening hours
+- service times are lognormal (mean SERVICE_MINUTES, CV SERVICE_CV)
+- customers are served first come first served by the earliest free
+  counter; those who cannot start before closing are turned away
+
+All scenario-days of a batch advance together, one arrival index at a
+time across arrays of counters, and batches run in parallel processes.
+Every district x configuration x weekday is replicated REPLICATES times.
+
+Outputs (outputs/reports/):
+
+- capacity_simulation.csv: wait and utilization distribution per
+  district and configuration
+- capacity_recommendations.csv: smallest configuration per district
+  whose typical 90th-percentile wait is within TARGET_WAIT_MINUTES and
+  which turns away at most MAX_UNSERVED of arrivals
+
+Usage:
+    python scripts/capacity.py [--source observed|forecast] [--replicates 20]
+
+Author: Data Science Team
+Date: October 2026
+"""
+
+import argparse
+import os
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from forecasting import FORECAST_FILE
+from geography import DIMENSION_FILE, GeographyDimension
+from ingest import DATASETS, ingest
+
+# Configuration
+BASE_PATH = Path(__file__).parent.parent
+REPORT_PATH = BASE_PATH / "outputs" / "reports"
+SIMULATION_FILE = REPORT_PATH / "capacity_simulation.csv"
+RECOMMENDATION_FILE = REPORT_PATH / "capacity_recommendations.csv"
+
+TOTAL_COLS = [config["total_col"] for config in DATASETS.values()]
+OPEN_DAYS = [0, 1, 2, 3, 4, 5]  # Monday to Saturday
+OPEN_MINUTES = 8 * 60
+SERVICE_MINUTES = 10.0
+SERVICE_CV = 0.5
+COUNTERS_PER_CENTRE = 2
+MOBILE_DAYS = 3
+
+CENTRE_OPTIONS = [1, 2, 3, 4, 6, 8]
+MOBILE_OPTIONS = [0, 1, 2]
+REPLICATES = 20
+BATCH_SIZE = 4096
+TARGET_WAIT_MINUTES = 30
+MAX_UNSERVED = 0.01
+DEFAULT_SEED = 42
+
+
+class DistrictDailyDemand:
+    """Ingestion consumer summing daily service demand per district"""
+
+    def __init__(self):
+        self.parts = []
+
+    def update(self, chunk):
+        totals = chunk[[col for col in TOTAL_COLS if col in chunk]].sum(axis=1)
+        self.parts.append(
+            totals.groupby([chunk["district_id"], chunk["date"].dt.normalize()]).sum()
+        )
+        return self
+
+    def totals(self):
+        daily = pd.concat(self.parts).groupby(level=[0, 1]).sum()
+        return daily.rename_axis(["district_id", "date"]).rename("demand")
+
+
+def weekday_shares(daily):
+    """Share of weekly demand falling on each open weekday"""
+    national = daily.groupby(level="date").sum()
+    by_weekday = national.groupby(national.index.dayofweek).mean()
+    by_weekday = by_weekday.reindex(OPEN_DAYS, fill_value=0)
+    if by_weekday.sum() == 0:
+        by_weekday[:] = 1
+    return by_weekday / by_weekday.sum()
+
+
+def observed_weekly_demand(daily):
+    """Mean weekly demand per district over the observed calendar span"""
+    dates = daily.index.get_level_values("date")
+    weeks = ((dates.max() - dates.min()).days + 1) / 7
+    return daily.groupby(level="district_id").sum() / weeks
+
+
+def forecast_weekly_demand(forecasts, geography, horizon=1):
+    """Weekly demand per district from the month-``horizon`` forecasts"""
+    rows = forecasts[
+        (forecasts["level"] == "district") & (forecasts["horizon"] == horizon)
+    ]
+    # Forecasts carry raw names; resolve them to the dimension's district ids
+    monthly = geography.canonicalize(rows).groupby("district_id")["forecast"].sum()
+    days = pd.PeriodIndex(rows["month"].iloc[:1], freq="M").days_in_month[0]
+    return (monthly * 7 / days).rename("demand")
+
+
+def scenario_grid(weekly, shares, centres=CENTRE_OPTIONS, mobile=MOBILE_OPTIONS):
+    """One row per district x configuration x open weekday"""
+    busiest = shares.sort_values(ascending=False).index[:MOBILE_DAYS]
+    grid = pd.MultiIndex.from_product(
+        [weekly.index, centres, mobile, shares.index],
+        names=["district_id", "centres", "mobile_units", "weekday"],
+    ).to_frame(index=False)
+    grid["arrival_rate"] = (
+        weekly.reindex(grid["district_id"]).to_numpy()
+        * shares.reindex(grid["weekday"]).to_numpy()
+    )
+    grid["counters"] = grid["centres"] * COUNTERS_PER_CENTRE + grid[
+        "mobile_units"
+    ] * grid["weekday"].isin(busiest)
+    return grid
+
+
+def simulate_days(rates, counters, rng):
+    """Simulate one day per scenario; returns per-day queue metrics
+
+    ``rates`` are expected arrivals, ``counters`` open counters per day.
+    """
+    n_days = len(rates)
+    rows = np.arange(n_days)
+    arrivals_per_day = rng.poisson(rates)
+    n_max = max(int(arrivals_per_day.max()), 1)
+
+    # Padding slots arrive at +inf so each day's arrival times are the sorted
+    # times of its own arrivals, whatever the batch's largest day is
+    present = np.arange(n_max) < arrivals_per_day[:, None]
+    arrivals = np.where(present, rng.uniform(0, OPEN_MINUTES, (n_days, n_max)), np.inf)
+    arrivals.sort(axis=1)
+    sigma = np.sqrt(np.log1p(SERVICE_CV**2))
+    service = rng.lognormal(
+        np.log(SERVICE_MINUTES) - sigma**2 / 2, sigma, (n_days, n_max)
+    )
+
+    free_at = np.where(np.arange(counters.max()) < counters[:, None], 0.0, np.inf)
+    waits = np.full((n_days, n_max), np.nan)
+    busy = np.zeros(n_days)
+    turned_away = np.zeros(n_days)
+    for i in range(n_max):
+        counter = free_at.argmin(axis=1)
+        start = np.maximum(arrivals[:, i], free_at[rows, counter])
+        served = present[:, i] & (start < OPEN_MINUTES)
+        waits[:, i] = np.where(
+            present[:, i], np.minimum(start, OPEN_MINUTES) - arrivals[:, i], np.nan
+        )
+        finish = start + service[:, i]
+        free_at[rows[served], counter[served]] = finish[served]
+        busy += np.where(served, np.minimum(finish, OPEN_MINUTES) - start, 0)
+        turned_away += present[:, i] & ~served
+
+    # Days without arrivals have no waits and get NaN wait metrics
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return {
+            "arrivals": arrivals_per_day,
+            "wait_mean": np.nanmean(waits, axis=1),
+            "wait_p90": np.nanquantile(waits, 0.9, axis=1),
+            "utilization": busy / (np.maximum(counters, 1) * OPEN_MINUTES),
+            "turned_away": turned_away,
+        }
+
+
+def _simulate_batch(args):
+    rates, counters, seed = args
+    return simulate_days(rates, counters, np.random.default_rng(seed))
+
+
+def simulate(grid, replicates=REPLICATES, workers=None, seed=DEFAULT_SEED):
+    """Per-day metrics for every scenario row x replicate, in parallel"""
+    days = grid.loc[grid.index.repeat(replicates)].reset_index(drop=True)
+    # Similar arrival rates in one batch keep the per-arrival loop short
+    order = np.argsort(days["arrival_rate"].to_numpy(), kind="stable")
+    batches = [order[i : i + BATCH_SIZE] for i in range(0, len(order), BATCH_SIZE)]
+    seeds = np.random.SeedSequence(seed).spawn(len(batches))
+    tasks = [
+        (
+            days["arrival_rate"].to_numpy()[batch],
+            days["counters"].to_numpy()[batch],
+            batch_seed,
+        )
+        for batch, batch_seed in zip(batches, seeds)
+    ]
+
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        results = list(pool.map(_simulate_batch, tasks))
+    for name in results[0]:
+        values = np.empty(len(days))
+        values[order] = np.concatenate([result[name] for result in results])
+        days[name] = values
+    return days
+
+
+def summarize(days):
+    """Wait and utilization distribution per district and configuration"""
+    keys = ["district_id", "centres", "mobile_units"]
+    grouped = days.groupby(keys)
+    summary = grouped.agg(
+        weekly_demand=("arrival_rate", "sum"),
+        wait_p90_typical=("wait_p90", "median"),
+        wait_p90_bad_day=("wait_p90", lambda w: w.quantile(0.9)),
+        utilization_mean=("utilization", "mean"),
+        utilization_p10=("utilization", lambda u: u.quantile(0.1)),
+        utilization_p90=("utilization", lambda u: u.quantile(0.9)),
+    )
+    summary["weekly_demand"] /= grouped["weekday"].size() / grouped["weekday"].nunique()
+    weighted = days.assign(wait_total=days["wait_mean"].fillna(0) * days["arrivals"])
+    totals = weighted.groupby(keys)[["wait_total", "arrivals", "turned_away"]].sum()
+    summary["wait_mean"] = totals["wait_total"] / totals["arrivals"]
+    summary["unserved_share"] = totals["turned_away"] / totals["arrivals"]
+    return summary.fillna(0).round(3).reset_index()
+
+
+def recommend(summary):
+    """Smallest configuration per district meeting the service targets"""
+    ok = summary[
+        (summary["wait_p90_typical"] <= TARGET_WAIT_MINUTES)
+        & (summary["unserved_share"] <= MAX_UNSERVED)
+    ]
+    ok = ok.assign(counters=ok["centres"] * COUNTERS_PER_CENTRE + ok["mobile_units"])
+    best = ok.sort_values(["counters", "mobile_units"]).drop_duplicates("district_id")
+    missing = set(summary["district_id"]) - set(best["district_id"])
+    largest = summary[summary["district_id"].isin(missing)].sort_values(
+        ["centres", "mobile_units"]
+    )
+    best = pd.concat(
+        [
+            best.assign(meets_target=True),
+            largest.drop_duplicates("district_id", keep="last").assign(
+                meets_target=False
+            ),
+        ]
+    )
+    return best.drop(columns="counters").sort_values("district_id")
+
+
+def main():
+    """Simulate candidate configurations and recommend capacity per district"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--source", choices=["observed", "forecast"], default="observed"
+    )
+    parser.add_argument("--horizon", type=int, default=1, help="Forecast month")
+    parser.add_argument("--replicates", type=int, default=REPLICATES)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if DIMENSION_FILE.exists():
+        geography = GeographyDimension.load(DIMENSION_FILE)
+    else:
+        geography = GeographyDimension()
+    demand = DistrictDailyDemand()
+    for dataset in DATASETS:
+        ingest(dataset, [demand], geography=geography)
+    geography.save(DIMENSION_FILE)
+
+    daily = demand.totals()
+    districts = geography.districts()[["district_id", "state", "district"]]
+    if args.source == "forecast":
+        weekly = forecast_weekly_demand(
+            pd.read_csv(FORECAST_FILE), geography, args.horizon
+        )
+    else:
+        weekly = observed_weekly_demand(daily)
+
+    grid = scenario_grid(weekly, weekday_shares(daily))
+    days = simulate(grid, args.replicates, args.workers, args.seed)
+    summary = districts.merge(summarize(days), on="district_id")
+    recommendations = recommend(summary)
+
+    REPORT_PATH.mkdir(parents=True, exist_ok=True)
+    summary.to_csv(SIMULATION_FILE, index=False)
+    recommendations.to_csv(RECOMMENDATION_FILE, index=False)
+
+    print(
+        f"✓ Simulated {len(days):,} centre-days ({len(grid):,} scenarios x "
+        f"{args.replicates} replicates) in {time.perf_counter() - start:.1f}s"
+    )
+    print(f"\n📊 CAPACITY NEEDED FOR p90 WAIT <= {TARGET_WAIT_MINUTES} MIN:")
+    print(f"   Permanent centres: {recommendations['centres'].sum():,}")
+    print(f"   Mobile units:      {recommendations['mobile_units'].sum():,}")
+    print(
+        f"   Districts short even at the largest option: "
+        f"{(~recommendations['meets_target']).sum():,}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""
+UIDAI Aadhaar Data Analytics - Cohort Projection
+=================================================
+Projects mandatory biometric update (MBU) demand by ageing the child
+enrolment counts forward.
+
+Children enrolled at 0-5 are due updates at ages 5 and 15, those
+enrolled at 5-17 at age 15 if they are younger. Enrolment age is taken
+as uniform within its band, which turns each band into a kernel over
+month lags (the probability that an enrolment falls due k months
+later). Convolving the pincode x month enrolment matrix with the
+kernels gives the due updates for every pincode and month, in one
+vectorized pass over all pincodes.
+
+The feed only shows enrolments inside its window, while children
+enrolled earlier also fall due. The projection is therefore reconciled
+with the observed ``bio_age_5_17`` counts per district: the observed
+excess over the cohort load in the last BASELINE_MONTHS months is
+carried forward as a flat baseline, and the projection is
+
+    projected MBUs = baseline + COMPLIANCE x cohort load
+
+Outputs (outputs/reports/):
+
+- biometric_update_projection.csv: district x month projected updates
+  for PROJECTION_MONTHS after the last observed month
+- biometric_update_reconciliation.csv: observed vs cohort-projected
+  updates over the observed window, per district
+
+Usage:
+    python scripts/cohorts.py [--months 180] [--compliance 1.0]
+
+Author: Data Science Team
+Date: October 2026
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy.signal import oaconvolve
+
+from geography import DIMENSION_FILE, GeographyDimension
+from ingest import ingest
+
+# Configuration
+BASE_PATH = Path(__file__).parent.parent
+REPORT_PATH = BASE_PATH / "outputs" / "reports"
+PROJECTION_FILE = REPORT_PATH / "biometric_update_projection.csv"
+RECONCILIATION_FILE = REPORT_PATH / "biometric_update_reconciliation.csv"
+
+# Enrolment age band (years, half-open) and the ages an MBU falls due
+MANDATORY_UPDATES = {
+    "age_0_5": ((0, 5), (5, 15)),
+    "age_5_17": ((5, 17), (15,)),
+}
+OBSERVED_UPDATES = "bio_age_5_17"
+PROJECTION_MONTHS = 180
+BASELINE_MONTHS = 3
+COMPLIANCE = 1.0
+
+
+def update_kernel(band, due_ages, max_lag):
+    """Expected MBUs per enrolment at each month lag (uniform enrolment age)"""
+    ages = np.arange(band[0] * 12, band[1] * 12)
+    kernel = np.zeros(max_lag)
+    for due in due_ages:
+        lag = due * 12 - ages
+        lag = lag[(lag > 0) & (lag < max_lag)]
+        np.add.at(kernel, lag, 1 / len(ages))
+    return kernel
+
+
+class PincodeMonthCounts:
+    """Ingestion consumer summing count columns per pincode id and month"""
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        self.parts = []
+
+    def update(self, chunk):
+        self.parts.append(
+            chunk.assign(month=chunk["date"].dt.to_period("M"))
+            .groupby(["district_id", "pincode_id", "month"])[self.columns]
+            .sum()
+        )
+        return self
+
+    def totals(self):
+        if not self.parts:
+            index = pd.MultiIndex.from_arrays(
+                [[], [], pd.PeriodIndex([], freq="M")],
+                names=["district_id", "pincode_id", "month"],
+            )
+            return pd.DataFrame(columns=self.columns, index=index, dtype=float)
+        return pd.concat(self.parts).groupby(level=[0, 1, 2]).sum()
+
+
+def pincode_matrix(counts, column, pincodes, months):
+    """Dense (district pincode x month) matrix of one count column"""
+    matrix = np.zeros((len(pincodes), len(months)))
+    values = counts[column]
+    rows = pincodes.get_indexer(values.index.droplevel("month"))
+    cols = months.get_indexer(values.index.get_level_values("month"))
+    np.add.at(matrix, (rows, cols), values.to_numpy())
+    return matrix
+
+
+def project(enrolments, updates, horizon=PROJECTION_MONTHS, compliance=COMPLIANCE):
+    """Cohort load, reconciliation and district projection
+
+    ``enrolments`` / ``updates`` are pincode x month count frames indexed
+    by (district_id, pincode_id, month).
+    """
+    index = enrolments.index.union(updates.index)
+    pincodes = index.droplevel("month").unique()
+    observed = index.get_level_values("month")
+    months = pd.period_range(observed.min(), observed.max() + horizon, freq="M")
+    n_observed = len(months) - horizon
+
+    # Due updates per pincode and month: enrolments convolved with kernels
+    cohort = np.zeros((len(pincodes), len(months)))
+    for column, (band, due_ages) in MANDATORY_UPDATES.items():
+        kernel = update_kernel(band, due_ages, len(months))
+        matrix = pincode_matrix(enrolments, column, pincodes, months)
+        cohort += oaconvolve(matrix, kernel[None, :], axes=1)[:, : len(months)]
+    cohort *= compliance
+
+    # Roll pincodes up to districts
+    districts, district_rows = np.unique(
+        pincodes.get_level_values("district_id"), return_inverse=True
+    )
+    district_cohort = np.zeros((len(districts), len(months)))
+    np.add.at(district_cohort, district_rows, cohort)
+    observed_updates = np.zeros((len(districts), len(months)))
+    np.add.at(
+        observed_updates,
+        district_rows,
+        pincode_matrix(updates, OBSERVED_UPDATES, pincodes, months),
+    )
+
+    window = slice(max(n_observed - BASELINE_MONTHS, 0), n_observed)
+    baseline = (
+        (observed_updates[:, window] - district_cohort[:, window])
+        .mean(axis=1)
+        .clip(min=0)
+    )
+    reconciliation = pd.DataFrame(
+        {
+            "district_id": districts,
+            "observed_updates": observed_updates[:, :n_observed].sum(axis=1),
+            "cohort_updates": district_cohort[:, :n_observed].sum(axis=1).round(1),
+            "baseline_per_month": baseline.round(1),
+        }
+    )
+    reconciliation["cohort_share"] = (
+        (reconciliation["cohort_updates"] / reconciliation["observed_updates"])
+        .replace(np.inf, np.nan)
+        .round(3)
+    )
+
+    future = slice(n_observed, None)
+    projection = pd.DataFrame(
+        {
+            "district_id": np.repeat(districts, horizon),
+            "month": np.tile(months[future].astype(str), len(districts)),
+            "months_ahead": np.tile(np.arange(1, horizon + 1), len(districts)),
+            "cohort_updates": district_cohort[:, future].ravel().round(1),
+            "baseline_updates": np.repeat(baseline, horizon).round(1),
+        }
+    )
+    projection["projected_updates"] = (
+        projection["cohort_updates"] + projection["baseline_updates"]
+    )
+    return projection, reconciliation
+
+
+def main():
+    """Build pincode x month counts and write the MBU projection"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--months", type=int, default=PROJECTION_MONTHS)
+    parser.add_argument("--compliance", type=float, default=COMPLIANCE)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if DIMENSION_FILE.exists():
+        geography = GeographyDimension.load(DIMENSION_FILE)
+    else:
+        geography = GeographyDimension()
+    enrolments = PincodeMonthCounts(MANDATORY_UPDATES)
+    updates = PincodeMonthCounts([OBSERVED_UPDATES])
+    ingest("enrolment", [enrolments], geography=geography)
+    ingest("biometric", [updates], geography=geography)
+    geography.save(DIMENSION_FILE)
+
+    projection, reconciliation = project(
+        enrolments.totals(), updates.totals(), args.months, args.compliance
+    )
+    districts = geography.districts()[["district_id", "state", "district"]]
+    projection = districts.merge(projection, on="district_id")
+    reconciliation = districts.merge(reconciliation, on="district_id")
+
+    REPORT_PATH.mkdir(parents=True, exist_ok=True)
+    projection.to_csv(PROJECTION_FILE, index=False)
+    reconciliation.to_csv(RECONCILIATION_FILE, index=False)
+
+    yearly = (
+        projection.assign(year=projection["month"].str[:4])
+        .groupby("year")[["cohort_updates", "projected_updates"]]
+        .sum()
+    )
+    print(
+        f"✓ Projected {len(reconciliation):,} districts x {args.months} months "
+        f"in {time.perf_counter() - start:.1f}s"
+    )
+    print(
+        f"   Cohort load explains {reconciliation['cohort_updates'].sum():,.0f} of "
+        f"{reconciliation['observed_updates'].sum():,.0f} observed bio_age_5_17 updates"
+    )
+    print("\n📊 PROJECTED MANDATORY BIOMETRIC UPDATES BY YEAR:")
+    for year, row in yearly.head(6).iterrows():
+        print(
+            f"   {year}: {row['projected_updates']:>14,.0f} "
+            f"(cohort {row['cohort_updates']:,.0f})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+"""
+UIDAI Aadhaar Data Analytics - Equity Score Engine
+===================================================
+Equity Score = Normalized Activity × (1 - Gini Coefficient), computed at
+state, district and pincode-cluster (first three pincode digits) level,
+over the whole period and month by month.
+
+The engine keeps the shared pincode x month aggregates and per-pincode
+running totals. When new shards arrive, only the groups they touch have
+their Gini (the expensive per-pincode sort) re-derived, and only the
+months they touch are re-scored. Gini is taken over pincode totals, i.e.
+xᵢ = enrollment count for pincode i as in the methodology.
+
+Usage:
+    python scripts/equity.py             # fold in new shards and refresh
+    python scripts/equity.py --rebuild   # start from an empty engine
+
+Author: Data Science Team
+Date: October 2026
+"""
+
+import argparse
+import pickle
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ingest import DATASETS, iter_chunks, list_shards, pincode_month_aggregates
+from inequality import grouped_gini
+
+# Configuration
+BASE_PATH = Path(__file__).parent.parent
+OUTPUT_PATH = BASE_PATH / "outputs"
+REPORT_PATH = OUTPUT_PATH / "reports"
+SKETCH_PATH = OUTPUT_PATH / "sketches"
+ENGINE_FILE = SKETCH_PATH / "equity_engine.pkl"
+
+LEVELS = {
+    "state": ["state"],
+    "district": ["state", "district"],
+    "pincode_cluster": ["pincode_cluster"],
+}
+PINCODE_KEYS = ["state", "district", "pincode", "pincode_cluster"]
+ACTIVITY_COLS = [config["activity_col"] for config in DATASETS.values()]
+
+
+def group_stats(rows, keys):
+    """Activity sums, pincode count and enrollment Gini per group"""
+    grouped = rows.groupby(keys, sort=True)
+    stats = grouped[ACTIVITY_COLS].sum()
+    stats["pincodes"] = grouped.size()
+    stats["gini_coefficient"] = grouped_gini(
+        grouped.ngroup().to_numpy(), rows["enrollments"], len(stats)
+    )
+    return stats
+
+
+def equity_scores(stats, by=None):
+    """Score table from group stats; min-max normalization within ``by``"""
+    scores = stats.copy()
+    for col, ratio in [
+        ("demographic_updates", "demo_to_enrol_ratio"),
+        ("biometric_updates", "bio_to_enrol_ratio"),
+    ]:
+        scores[ratio] = (
+            (scores[col] / scores["enrollments"])
+            .replace([np.inf, -np.inf], 0)
+            .fillna(0)
+        )
+    scores["total_activity"] = scores[ACTIVITY_COLS].sum(axis=1)
+
+    activity = scores["total_activity"]
+    gini = scores["gini_coefficient"]
+    if by is None:
+        low, high = activity.min(), activity.max()
+        gini = gini.fillna(gini.median())
+    else:
+        low = activity.groupby(level=by).transform("min")
+        high = activity.groupby(level=by).transform("max")
+        gini = gini.fillna(gini.groupby(level=by).transform("median"))
+
+    scores["gini_coefficient"] = gini
+    scores["norm_activity"] = ((activity - low) / (high - low)).fillna(0)
+    scores["equity_score"] = (scores["norm_activity"] * (1 - gini)).round(3)
+
+    columns = [
+        *ACTIVITY_COLS,
+        "demo_to_enrol_ratio",
+        "bio_to_enrol_ratio",
+        "total_activity",
+        "gini_coefficient",
+        "norm_activity",
+        "equity_score",
+        "pincodes",
+    ]
+    scores = scores[columns].reset_index()
+    if by is None:
+        return scores.sort_values("equity_score", ascending=False)
+    return scores.sort_values([by, "equity_score"], ascending=[True, False])
+
+
+class EquityEngine:
+    """Incrementally maintained equity scores at several geographic levels"""
+
+    def __init__(self):
+        self.pincode_month = None
+        self.pincode_totals = None
+        self.stats = {level: None for level in LEVELS}
+        self.monthly_stats = {level: None for level in LEVELS}
+        self.shards = set()
+
+    def update(self, agg):
+        """Fold in new pincode x month aggregates and refresh touched groups"""
+        agg = agg.copy()
+        for col in ACTIVITY_COLS:
+            agg[col] = agg[col].fillna(0) if col in agg else 0.0
+        agg["pincode_cluster"] = agg["pincode"].str[:3]
+        agg = agg.groupby([*PINCODE_KEYS, "month"], as_index=False)[ACTIVITY_COLS].sum()
+
+        # Shared aggregates: pincode x month table and running pincode totals
+        pincode_month = pd.concat([self.pincode_month, agg], ignore_index=True)
+        self.pincode_month = pincode_month.groupby(
+            [*PINCODE_KEYS, "month"], as_index=False
+        )[ACTIVITY_COLS].sum()
+        delta = agg.groupby(PINCODE_KEYS)[ACTIVITY_COLS].sum()
+        self.pincode_totals = (
+            delta
+            if self.pincode_totals is None
+            else self.pincode_totals.add(delta, fill_value=0)
+        )
+
+        # Re-derive only the groups and months the new rows touch
+        totals = self.pincode_totals.reset_index()
+        months = self.pincode_month[self.pincode_month["month"].isin(agg["month"])]
+        for level, keys in LEVELS.items():
+            affected = agg[keys].drop_duplicates()
+            self.stats[level] = self._merge_stats(
+                self.stats[level], group_stats(totals.merge(affected, on=keys), keys)
+            )
+            self.monthly_stats[level] = self._merge_stats(
+                self.monthly_stats[level], group_stats(months, ["month", *keys])
+            )
+        return self
+
+    def _merge_stats(self, old, fresh):
+        if old is None:
+            return fresh
+        return pd.concat([old.drop(fresh.index, errors="ignore"), fresh]).sort_index()
+
+    def scores(self, level):
+        """Whole-period equity scores for a level"""
+        return equity_scores(self.stats[level])
+
+    def monthly_scores(self, level):
+        """Month-level equity scores, normalized within each month"""
+        return equity_scores(self.monthly_stats[level], by="month")
+
+    def write_outputs(self, path=REPORT_PATH):
+        """Write <level>_equity_scores.csv and their monthly siblings"""
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        for level in LEVELS:
+            self.scores(level).to_csv(path / f"{level}_equity_scores.csv", index=False)
+            self.monthly_scores(level).to_csv(
+                path / f"{level}_monthly_equity_scores.csv", index=False
+            )
+
+    def save(self, path=ENGINE_FILE):
+        """Persist the engine state for the next incremental refresh"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            pickle.dump(self, f)
+
+    @staticmethod
+    def load(path=ENGINE_FILE):
+        """Load a previously saved engine"""
+        with open(path, "rb") as f:
+            return pickle.load(f)
+
+
+def refresh(engine):
+    """Ingest shards the engine has not seen yet and update it"""
+    frames, new_shards = [], []
+    for dataset in DATASETS:
+        for shard in list_shards(dataset):
+            shard_key = f"{dataset}/{shard.name}"
+            if shard_key in engine.shards:
+                continue
+            for _, chunk in iter_chunks(dataset, shards=[shard]):
+                frames.append(pincode_month_aggregates(chunk, dataset))
+            new_shards.append(shard_key)
+
+    if frames:
+        engine.update(pd.concat(frames, ignore_index=True))
+        engine.shards.update(new_shards)
+    return new_shards
+
+
+def main():
+    """Refresh equity scores at every level from new shards"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--rebuild", action="store_true")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.rebuild or not ENGINE_FILE.exists():
+        engine = EquityEngine()
+    else:
+        engine = EquityEngine.load(ENGINE_FILE)
+
+    new_shards = refresh(engine)
+    if not new_shards:
+        print("✓ Equity scores are up to date")
+        return
+
+    engine.save(ENGINE_FILE)
+    engine.write_outputs(REPORT_PATH)
+    print(
+        f"✓ Folded in {len(new_shards)} shard(s) and refreshed equity scores "
+        f"in {time.perf_counter() - start:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
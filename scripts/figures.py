@@ -0,0 +1,103 @@
+"""
+UIDAI Aadhaar Data Analytics - Report Figures
+==============================================
+Turns matplotlib figures into reportlab flowables at their print size.
+
+Figures are created at the exact size they occupy on the page
+(``new_figure(width, height)`` in points, e.g. ``5.5 * inch``), so
+nothing is rasterized larger than needed or rescaled on embedding. Each
+figure is then embedded in one of three formats:
+
+- ``png``: full-colour PNG at RASTER_DPI, for charts with gradients
+- ``palette``: PNG quantized to at most PALETTE_COLORS colours, for flat
+  bar and pie charts (a fraction of the full-colour size)
+- ``vector``: SVG converted to a reportlab Drawing through the optional
+  ``svglib`` package; falls back to a raster format when it is missing
+
+Author: Data Science Team
+Date: October 2026
+"""
+
+import io
+import warnings
+
+import matplotlib.pyplot as plt
+from PIL import Image as PILImage
+from reportlab.lib.units import inch
+from reportlab.platypus import Image
+
+try:
+    from svglib.svglib import svg2rlg
+except ImportError:
+    svg2rlg = None
+
+FIGURE_FORMATS = ("png", "palette", "vector")
+RASTER_DPI = 200
+PALETTE_COLORS = 32
+
+# Font sizes for figures drawn at print size
+FIGURE_RC = {
+    "font.size": 7,
+    "axes.titlesize": 8,
+    "axes.labelsize": 7,
+    "xtick.labelsize": 6.5,
+    "ytick.labelsize": 6.5,
+    "legend.fontsize": 6.5,
+}
+
+
+def new_figure(width, height, nrows=1, ncols=1, **kwargs):
+    """Figure and axes sized exactly to a width x height slot in points"""
+    return plt.subplots(
+        nrows,
+        ncols,
+        figsize=(width / inch, height / inch),
+        layout="constrained",
+        **kwargs,
+    )
+
+
+def _raster(fig, palette):
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", dpi=RASTER_DPI)
+    if palette:
+        image = PILImage.open(buffer).convert("RGB")
+        quantized = image.quantize(
+            colors=PALETTE_COLORS, method=PILImage.Quantize.MEDIANCUT
+        )
+        buffer = io.BytesIO()
+        quantized.save(buffer, format="png", optimize=True)
+    buffer.seek(0)
+    return buffer
+
+
+def _vector(fig, width, height):
+    buffer = io.BytesIO()
+    # Keep text as text instead of glyph outlines
+    with plt.rc_context({"svg.fonttype": "none"}):
+        fig.savefig(buffer, format="svg")
+    buffer.seek(0)
+    drawing = svg2rlg(buffer)
+    drawing.scale(width / drawing.width, height / drawing.height)
+    drawing.width, drawing.height = width, height
+    return drawing
+
+
+def figure_flowable(fig, fmt="png"):
+    """Embed a figure at its own size as an Image or vector Drawing
+
+    The figure is closed afterwards.
+    """
+    if fmt not in FIGURE_FORMATS:
+        raise ValueError(f"Unknown figure format {fmt!r}, expected {FIGURE_FORMATS}")
+    width, height = (size * inch for size in fig.get_size_inches())
+    if fmt == "vector" and svg2rlg is None:
+        warnings.warn("svglib is not installed, embedding figures as palette PNGs")
+        fmt = "palette"
+
+    try:
+        if fmt == "vector":
+            return _vector(fig, width, height)
+        return Image(_raster(fig, fmt == "palette"), width=width, height=height)
+    finally:
+        plt.close(fig)
@@ -0,0 +1,246 @@
+"""
+UIDAI Aadhaar Data Analytics - Demand Forecasting
+==================================================
+Forecasts the next 1-12 months of enrolment, demographic-update and
+biometric-update demand for every state and district in one batch.
+
+All series (level x activity x area) are stacked into one matrix of
+log1p monthly totals and smoothed together with damped-trend exponential
+smoothing, ETS(A,Ad,N):
+
+    l_t = l_{t-1} + φ b_{t-1} + α e_t
+    b_t = φ b_{t-1} + β e_t
+    ŷ_{t+h} = l_t + (φ + φ² + ... + φ^h) b_t
+
+Each series picks (α, β) from a small grid by one-step-ahead squared
+error; the grid is evaluated as one array operation per month. Series
+start at their first observed month, so datasets that begin later do
+not read as zero demand.
+
+Prediction intervals are quantiles of the one-step residuals scaled by
+the ETS h-step variance factor 1 + Σ_{j<h} (α + β φ_j)². Series with
+fewer than MIN_RESIDUALS residuals use the residual quantiles pooled
+over their level and activity. Forecasts and bounds are transformed back
+from the log scale, so they stay non-negative.
+
+Input is the monthly state / district aggregates of the equity engine
+(equity.py), refreshed with any new shards before forecasting. When the
+cohort projection (cohorts.py) exists, biometric rows also carry the
+projected mandatory updates for the month.
+
+Usage:
+    python scripts/forecasting.py [--horizon 12]
+
+Author: Data Science Team
+Date: October 2026
+"""
+
+import argparse
+import time
+import warnings
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from cohorts import PROJECTION_FILE
+from equity import ACTIVITY_COLS, ENGINE_FILE, LEVELS, EquityEngine, refresh
+
+# Configuration
+BASE_PATH = Path(__file__).parent.parent
+REPORT_PATH = BASE_PATH / "outputs" / "reports"
+FORECAST_FILE = REPORT_PATH / "demand_forecasts.csv"
+
+FORECAST_LEVELS = ["state", "district"]
+MAX_HORIZON = 12
+INTERVALS = (0.8, 0.95)
+MIN_RESIDUALS = 6
+
+PHI = 0.9
+ALPHAS = np.array([0.1, 0.3, 0.5, 0.8])
+BETAS = np.array([0.0, 0.05, 0.2])
+
+
+def monthly_panel(engine, levels=FORECAST_LEVELS):
+    """Series keys and a (series x month) matrix of monthly totals
+
+    Months before an activity's first national record are NaN.
+    """
+    observed = engine.monthly_stats["state"].index.get_level_values("month")
+    months = pd.period_range(observed.min(), observed.max(), freq="M")
+    keys, rows = [], []
+    for level in levels:
+        stats = engine.monthly_stats[level][ACTIVITY_COLS]
+        areas = LEVELS[level]
+        wide = stats.unstack("month")
+        for activity in ACTIVITY_COLS:
+            values = (
+                wide[activity]
+                .reindex(columns=months)
+                .fillna(0)
+                .to_numpy(float, copy=True)
+            )
+            national = values.sum(axis=0)
+            if not national.any():
+                continue
+            values[:, : np.flatnonzero(national)[0]] = np.nan
+
+            key = wide.index.to_frame(index=False)[areas]
+            key.insert(0, "level", level)
+            key["activity"] = activity
+            keys.append(key)
+            rows.append(values)
+
+    keys = pd.concat(keys, ignore_index=True).reindex(
+        columns=["level", "state", "district", "activity"]
+    )
+    return keys, months, np.vstack(rows)
+
+
+def damped_trend(h, phi=PHI):
+    """φ + φ² + ... + φ^h"""
+    return phi * (1 - phi**h) / (1 - phi)
+
+
+def fit_smoothing(y):
+    """Fit ETS(A,Ad,N) to every row of a log-scale matrix over the grid"""
+    alpha, beta = np.meshgrid(ALPHAS, BETAS, indexing="ij")
+    valid_grid = beta <= alpha
+    alpha, beta = alpha[valid_grid][:, None], beta[valid_grid][:, None]
+    n_grid, (n_series, n_months) = len(alpha), y.shape
+
+    level = np.broadcast_to(y[:, 0], (n_grid, n_series)).copy()
+    trend = np.zeros((n_grid, n_series))
+    errors = np.full((n_grid, n_series, n_months), np.nan)
+    for t in range(1, n_months):
+        predicted = level + PHI * trend
+        error = y[:, t] - predicted
+        observed = ~np.isnan(error)
+        step = np.where(observed, error, 0)
+        level = np.where(np.isnan(level), y[:, t], predicted + alpha * step)
+        trend = PHI * trend + beta * step
+        errors[:, :, t] = np.where(observed, error, np.nan)
+
+    # Pick the grid point with the lowest mean squared one-step error
+    counts = (~np.isnan(errors)).sum(axis=2)
+    mse = np.where(
+        counts > 0, np.nansum(errors**2, axis=2) / np.maximum(counts, 1), np.inf
+    )
+    best = mse.argmin(axis=0)
+    rows = np.arange(n_series)
+    return {
+        "level": level[best, rows],
+        "trend": trend[best, rows],
+        "alpha": alpha[best, 0],
+        "beta": beta[best, 0],
+        "residuals": errors[best, rows],
+    }
+
+
+def forecast_quantiles(fit, groups, horizon, probabilities):
+    """Log-scale point forecasts and quantiles, shape (series, horizon[, p])"""
+    steps = np.arange(1, horizon + 1)
+    point = fit["level"][:, None] + damped_trend(steps) * fit["trend"][:, None]
+
+    # ETS h-step variance factor: 1 + Σ_{j=1}^{h-1} (α + β φ_j)²
+    weights = (fit["alpha"][:, None] + fit["beta"][:, None] * damped_trend(steps)) ** 2
+    factor = np.sqrt(
+        1
+        + np.concatenate(
+            [np.zeros((len(point), 1)), weights[:, :-1].cumsum(axis=1)], axis=1
+        )
+    )
+
+    # Series without any residual (single month of history) get NaN bounds
+    residuals = fit["residuals"]
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        own = np.nanquantile(residuals, probabilities, axis=1).T
+        pooled = np.empty_like(own)
+        for group in np.unique(groups):
+            members = groups == group
+            pooled[members] = np.nanquantile(residuals[members], probabilities)
+    enough = (~np.isnan(residuals)).sum(axis=1) >= MIN_RESIDUALS
+    spread = np.where(enough[:, None], own, pooled)
+    return point, point[:, :, None] + factor[:, :, None] * spread[:, None, :]
+
+
+def forecast_table(engine, horizon=MAX_HORIZON, intervals=INTERVALS):
+    """Long table of forecasts with interval bounds per series and horizon"""
+    keys, months, history = monthly_panel(engine)
+    probabilities = [p for c in intervals for p in ((1 - c) / 2, (1 + c) / 2)]
+
+    fit = fit_smoothing(np.log1p(history))
+    groups = (keys["level"] + "/" + keys["activity"]).to_numpy()
+    point, quantiles = forecast_quantiles(fit, groups, horizon, probabilities)
+
+    steps = np.arange(1, horizon + 1)
+    table = keys.loc[keys.index.repeat(horizon)].reset_index(drop=True)
+    table["horizon"] = np.tile(steps, len(keys))
+    table["month"] = (months[-1] + table["horizon"]).astype(str)
+    table["forecast"] = np.expm1(point).ravel().round(1)
+    for i, coverage in enumerate(intervals):
+        label = f"{coverage:.0%}".rstrip("%")
+        for j, bound in enumerate(["lower", "upper"]):
+            values = np.expm1(quantiles[:, :, 2 * i + j]).clip(min=0)
+            table[f"{bound}_{label}"] = values.ravel().round(1)
+    table["last_actual"] = np.repeat(history[:, -1], horizon)
+    return table
+
+
+def add_mandatory_updates(table, projection):
+    """Attach cohort-projected mandatory updates to biometric forecast rows"""
+    keys = ["level", "state", "district", "month", "activity"]
+    projected = pd.concat(
+        [
+            projection.groupby(["state", "district", "month"], as_index=False)[
+                "projected_updates"
+            ]
+            .sum()
+            .assign(level="district"),
+            projection.groupby(["state", "month"], as_index=False)["projected_updates"]
+            .sum()
+            .assign(level="state"),
+        ]
+    ).assign(activity="biometric_updates")
+    projected = projected.rename(columns={"projected_updates": "mandatory_updates"})
+    return table.merge(projected[[*keys, "mandatory_updates"]], on=keys, how="left")
+
+
+def main():
+    """Fold in new shards and forecast every state and district"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--horizon", type=int, default=MAX_HORIZON)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    engine = EquityEngine.load(ENGINE_FILE) if ENGINE_FILE.exists() else EquityEngine()
+    if refresh(engine):
+        engine.save(ENGINE_FILE)
+
+    table = forecast_table(engine, args.horizon)
+    if PROJECTION_FILE.exists():
+        table = add_mandatory_updates(table, pd.read_csv(PROJECTION_FILE))
+    REPORT_PATH.mkdir(parents=True, exist_ok=True)
+    table.to_csv(FORECAST_FILE, index=False)
+
+    series = table.drop_duplicates(["level", "state", "district", "activity"])
+    print(
+        f"✓ {len(series):,} series x {args.horizon} months forecast in "
+        f"{time.perf_counter() - start:.1f}s -> {FORECAST_FILE.name}"
+    )
+    national = (
+        table[(table["level"] == "state") & (table["horizon"] == 1)]
+        .groupby("activity")[["forecast", "last_actual"]]
+        .sum()
+    )
+    print("\n📊 NEXT-MONTH NATIONAL DEMAND (sum of state forecasts):")
+    for activity, row in national.iterrows():
+        print(
+            f"   {activity:<22} {row['forecast']:>14,.0f} "
+            f"(last month {row['last_actual']:,.0f})"
+        )
+
+
+if __name__ == "__main__":
+    main()
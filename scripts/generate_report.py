@@ -7,11 +7,20 @@ Author: Data Science Team
 Date: January 2026
 """
 
+import argparse
 import subprocess
 import sys
 
 # Install required packages
-required_packages = ["reportlab", "pandas", "numpy", "matplotlib", "seaborn", "Pillow"]
+required_packages = [
+    "reportlab",
+    "pypdf",
+    "pandas",
+    "numpy",
+    "matplotlib",
+    "seaborn",
+    "Pillow",
+]
 for package in required_packages:
     try:
         __import__(package.replace("-", "_").lower())
@@ -25,7 +34,11 @@ import seaborn as sns
 from pathlib import Path
 from datetime import datetime
 import io
+import multiprocessing
+import re
+import tempfile
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 
 warnings.filterwarnings("ignore")
 
@@ -40,11 +53,30 @@ from reportlab.platypus import (
     Table,
     TableStyle,
     PageBreak,
-    Image,
     ListFlowable,
     ListItem,
 )
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
+from reportlab.pdfgen import canvas as pdf_canvas
+from pypdf import PdfReader, PdfWriter
+
+from calendar_dim import add_calendar_features
+from changepoints import CHANGE_POINTS_FILE
+from figures import FIGURE_RC, figure_flowable, new_figure, svg2rlg
+from geography import GeographyDimension
+from impact import IMPACT_FILE
+from ingest import DATASETS, DEFAULT_CHUNKSIZE
+from gini_trends import GiniTrendEngine, daily_aggregates
+from inequality import gini_by_group, inequality_by_group
+from quantiles import DEFAULT_K, QuantileEngine
+from sampling import (
+    DEFAULT_SEED,
+    estimate_total,
+    format_estimate,
+    scale_to_population,
+    stratified_sample,
+)
+from summary_stats import SummaryStatistics
 
 # Configuration
 BASE_PATH = Path(__file__).parent.parent
@@ -52,19 +84,126 @@ DATA_PATH = BASE_PATH / "data" / "processed"
 OUTPUT_PATH = BASE_PATH / "outputs"
 REPORT_PATH = OUTPUT_PATH / "reports"
 
+plt.rcParams.update(FIGURE_RC)
+
 # Ensure directories exist
 REPORT_PATH.mkdir(parents=True, exist_ok=True)
 (OUTPUT_PATH / "visualizations").mkdir(parents=True, exist_ok=True)
 
+PAGE_LAYOUT = {
+    "pagesize": A4,
+    "rightMargin": 0.75 * inch,
+    "leftMargin": 0.75 * inch,
+    "topMargin": 0.75 * inch,
+    "bottomMargin": 0.75 * inch,
+}
+HEADING_STYLES = ("SectionHeader", "SubSection")
+SERVICE_LEVELS = [
+    "Severely Underserved",
+    "Underserved",
+    "Moderately Served",
+    "Well Served",
+]
+
+GINI_REPLICATES = 1000
+# Draft samples are drawn per ingestion chunk and district (geography ids, so
+# spelling variants of one district share a stratum)
+DRAFT_STRATA = ("chunk", "district_id")
+
+# District appendix: page-sized table chunks sharing one precompiled style
+APPENDIX_ROWS_PER_CHUNK = 48
+APPENDIX_COLUMNS = [
+    ("State", 1.15),
+    ("District", 1.35),
+    ("Enrollments", 0.8),
+    ("Pincodes", 0.6),
+    ("Gini", 0.45),
+    ("Service Mix S/U/M/W %", 1.15),
+    ("Cluster", 0.95),
+    ("Priority", 0.5),
+]
+APPENDIX_TABLE_STYLE = TableStyle(
+    [
+        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#1E3A8A")),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, -1), 6.5),
+        ("ALIGN", (2, 0), (-1, -1), "RIGHT"),
+        ("ALIGN", (5, 1), (5, -1), "CENTER"),
+        ("TOPPADDING", (0, 0), (-1, -1), 1.5),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 1.5),
+        ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
+        (
+            "ROWBACKGROUNDS",
+            (0, 1),
+            (-1, -1),
+            [colors.white, colors.HexColor("#F3F4F6")],
+        ),
+    ]
+)
+
+# Generator shared with forked fragment workers (data loaded once in the parent)
+_FRAGMENT_GENERATOR = None
+
+
+class FragmentDocTemplate(SimpleDocTemplate):
+    """Document template that records the page of every numbered heading"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.headings = []
+
+    def afterFlowable(self, flowable):
+        if isinstance(flowable, Paragraph) and flowable.style.name in HEADING_STYLES:
+            text = flowable.getPlainText().strip()
+            if re.match(r"^\d+\.", text):
+                self.headings.append((flowable.style.name, text, self.page))
+
+
+def _build_fragment(args):
+    """Lay out one report section into its own PDF (runs in a worker process)"""
+    section, path, options = args
+    generator = _FRAGMENT_GENERATOR
+    if generator is None:
+        # Spawn-based platforms do not inherit the parent's data
+        generator = AadhaarReportGenerator(**options)
+        generator.load_data()
+    return generator.build_fragment(section, path)
+
 
 class AadhaarReportGenerator:
     """Generates comprehensive PDF report for UIDAI Hackathon submission"""
 
-    def __init__(self):
+    # Numbered sections, each laid out as its own PDF fragment
+    SECTIONS = [
+        "add_problem_statement",
+        "add_datasets_section",
+        "add_methodology_section",
+        "add_analysis_section",
+        "add_equity_analysis",
+        "add_modeling_section",
+        "add_findings_section",
+        "add_recommendations",
+        "add_code_section",
+        "add_district_appendix",
+    ]
+
+    def __init__(
+        self,
+        quantile_mode="exact",
+        sample_fraction=None,
+        seed=DEFAULT_SEED,
+        figure_format="raster",
+    ):
         self.styles = getSampleStyleSheet()
         self._setup_custom_styles()
         self.story = []
         self.data = {}
+        self.quantile_mode = quantile_mode
+        self.sample_fraction = sample_fraction
+        self.seed = seed
+        self.figure_format = figure_format
+        self.estimates = {}
 
     def _setup_custom_styles(self):
         """Setup custom paragraph styles"""
@@ -167,35 +306,124 @@ class AadhaarReportGenerator:
         )
 
     def load_data(self):
-        """Load all datasets"""
+        """Load all datasets (sampled chunk by chunk in draft mode)"""
         print("Loading datasets...")
-        self.data["enrolment"] = pd.read_csv(DATA_PATH / "enrolment_clean.csv")
-        self.data["demographic"] = pd.read_csv(DATA_PATH / "demographic_clean.csv")
-        self.data["biometric"] = pd.read_csv(DATA_PATH / "biometric_clean.csv")
-
-        # Preprocess
-        for name, df in self.data.items():
-            df["date"] = pd.to_datetime(df["date"], errors="coerce")
-
-        # Add totals
-        self.data["enrolment"]["total_enrollments"] = (
-            self.data["enrolment"]["age_0_5"]
-            + self.data["enrolment"]["age_5_17"]
-            + self.data["enrolment"]["age_18_greater"]
-        )
-        self.data["demographic"]["total_demo_updates"] = (
-            self.data["demographic"]["demo_age_5_17"]
-            + self.data["demographic"]["demo_age_17_"]
-        )
-        self.data["biometric"]["total_bio_updates"] = (
-            self.data["biometric"]["bio_age_5_17"]
-            + self.data["biometric"]["bio_age_17_"]
-        )
+        geography = GeographyDimension()
+        seeds = np.random.SeedSequence(self.seed)
+        for name, config in DATASETS.items():
+            parts = []
+            for i, chunk in enumerate(
+                pd.read_csv(
+                    DATA_PATH / f"{name}_clean.csv", chunksize=DEFAULT_CHUNKSIZE
+                )
+            ):
+                # Preprocess: canonical geography (junk keys quarantined),
+                # dates and totals
+                chunk = geography.encode(chunk)
+                chunk["date"] = pd.to_datetime(chunk["date"], errors="coerce")
+                chunk[config["total_col"]] = chunk[config["count_cols"]].sum(axis=1)
+                # Draft mode: stratified sample of each chunk, so only the
+                # sample is kept; strata are (chunk, state, district)
+                if self.sample_fraction:
+                    chunk = stratified_sample(
+                        chunk.assign(chunk=i),
+                        self.sample_fraction,
+                        strata=DRAFT_STRATA,
+                        seed=seeds.spawn(1)[0],
+                    )
+                parts.append(chunk)
+            df = pd.concat(parts, ignore_index=True)
+
+            # Counts scaled to population totals
+            if self.sample_fraction:
+                self.estimates[name] = estimate_total(
+                    df, config["total_col"], DRAFT_STRATA
+                )
+                df = scale_to_population(
+                    df.drop(columns="chunk"),
+                    [*config["count_cols"], config["total_col"]],
+                )
+            self.data[name] = df
+
+        # Display names are final only once every chunk has been resolved
+        for df in self.data.values():
+            df["state"] = np.array(geography.state_names, dtype=object)[df["state_id"]]
+            df["district"] = np.array(geography.district_names, dtype=object)[
+                df["district_id"]
+            ]
+        self.geography = geography
+        quarantined = geography.quarantine_report()["rows"].sum()
+        if quarantined:
+            print(f"⚠️ Quarantined {quarantined:,} rows with invalid geography keys")
+        if self.sample_fraction:
+            print(
+                f"✓ Draft mode: {self.sample_fraction:.0%} stratified sample "
+                f"(seed {self.seed})"
+            )
 
         print(f"✓ Loaded {len(self.data['enrolment']):,} enrollment records")
         print(f"✓ Loaded {len(self.data['demographic']):,} demographic records")
         print(f"✓ Loaded {len(self.data['biometric']):,} biometric records")
 
+    def _record_count(self, name):
+        """Records of a dataset (population estimate in draft mode)"""
+        df = self.data[name]
+        return df["sample_weight"].sum() if self.sample_fraction else len(df)
+
+    def _headline_total(self, name):
+        """Total activity of a dataset, with its 95% margin in draft mode"""
+        if self.sample_fraction:
+            return format_estimate(*self.estimates[name])
+        return f"{self.data[name][DATASETS[name]['total_col']].sum():,.0f}"
+
+    def _add_figure(self, fig, flat=False):
+        """Embed a print-size figure; flat bar/pie charts use a palette PNG"""
+        if self.figure_format == "vector":
+            fmt = "vector"
+        else:
+            fmt = "palette" if flat else "png"
+        self.story.append(figure_flowable(fig, fmt))
+
+    def _service_levels(self, df):
+        """Classify records against their district median enrollment"""
+        district_medians = (
+            QuantileEngine(group_cols=("district_id",), mode=self.quantile_mode)
+            .update(df)
+            .medians()[["district_id", "median"]]
+            .rename(columns={"median": "district_median"})
+        )
+
+        df_classified = df.merge(district_medians, on="district_id", how="left")
+
+        total = df_classified["total_enrollments"]
+        median = df_classified["district_median"]
+        df_classified["service_level"] = np.select(
+            [
+                (total == 0) | (total < median * 0.25),
+                total < median * 0.5,
+                total < median * 0.75,
+            ],
+            SERVICE_LEVELS[:3],
+            default=SERVICE_LEVELS[3],
+        )
+        return df_classified
+
+    def _draw_watermark(self, canvas, doc):
+        """Diagonal DRAFT watermark for sampled previews"""
+        canvas.saveState()
+        canvas.translate(A4[0] / 2, A4[1] / 2)
+        canvas.rotate(45)
+        canvas.setFillColor(colors.Color(0.86, 0.15, 0.15, alpha=0.15))
+        canvas.setFont("Helvetica-Bold", 96)
+        canvas.drawCentredString(0, 0, "DRAFT")
+        canvas.setFont("Helvetica-Bold", 16)
+        canvas.drawCentredString(
+            0,
+            -40,
+            f"{self.sample_fraction:.0%} stratified sample - figures are estimates",
+        )
+        canvas.restoreState()
+
     def add_title_page(self):
         """Add title page"""
         self.story.append(Spacer(1, 2 * inch))
@@ -256,32 +484,11 @@ class AadhaarReportGenerator:
         self.story.append(summary_table)
         self.story.append(PageBreak())
 
-    def add_table_of_contents(self):
-        """Add table of contents"""
+    def add_table_of_contents(self, toc_items):
+        """Add table of contents from (heading, page) pairs"""
         self.story.append(Paragraph("Table of Contents", self.styles["SectionHeader"]))
         self.story.append(Spacer(1, 0.3 * inch))
 
-        toc_items = [
-            ("1. Problem Statement & Approach", "3"),
-            ("2. Datasets & Data Dictionary", "4"),
-            ("3. Methodology", "5"),
-            ("4. Data Analysis & Visualizations", "7"),
-            ("   4.1 Univariate Analysis", "7"),
-            ("   4.2 State-wise Analysis", "8"),
-            ("   4.3 Temporal Trends", "9"),
-            ("   4.4 Bivariate & Multivariate Analysis", "10"),
-            ("5. Geospatial Equity Analysis", "11"),
-            ("   5.1 Gini Coefficient Analysis", "11"),
-            ("   5.2 Service Level Classification", "12"),
-            ("   5.3 Equity Score Framework", "13"),
-            ("6. Predictive Modeling", "14"),
-            ("   6.1 Demand Forecasting", "14"),
-            ("   6.2 Clustering Analysis", "15"),
-            ("7. Key Findings & Insights", "16"),
-            ("8. Recommendations & Impact", "17"),
-            ("9. Code & Technical Implementation", "18"),
-        ]
-
         toc_data = [[item[0], item[1]] for item in toc_items]
         toc_table = Table(toc_data, colWidths=[5 * inch, 0.5 * inch])
         toc_table.setStyle(
@@ -366,29 +573,24 @@ class AadhaarReportGenerator:
             Paragraph("<b>2.1 Dataset Overview</b>", self.styles["SubSection"])
         )
 
-        # Calculate statistics
-        total_enrol = self.data["enrolment"]["total_enrollments"].sum()
-        total_demo = self.data["demographic"]["total_demo_updates"].sum()
-        total_bio = self.data["biometric"]["total_bio_updates"].sum()
-
         dataset_info = [
             ["Dataset", "Records", "Total Activity", "Date Range"],
             [
                 "Enrolment",
-                f"{len(self.data['enrolment']):,}",
-                f"{total_enrol:,.0f}",
+                f"{self._record_count('enrolment'):,.0f}",
+                self._headline_total("enrolment"),
                 f"{self.data['enrolment']['date'].min().strftime('%Y-%m-%d')} to {self.data['enrolment']['date'].max().strftime('%Y-%m-%d')}",
             ],
             [
                 "Demographic Updates",
-                f"{len(self.data['demographic']):,}",
-                f"{total_demo:,.0f}",
+                f"{self._record_count('demographic'):,.0f}",
+                self._headline_total("demographic"),
                 f"{self.data['demographic']['date'].min().strftime('%Y-%m-%d')} to {self.data['demographic']['date'].max().strftime('%Y-%m-%d')}",
             ],
             [
                 "Biometric Updates",
-                f"{len(self.data['biometric']):,}",
-                f"{total_bio:,.0f}",
+                f"{self._record_count('biometric'):,.0f}",
+                self._headline_total("biometric"),
                 f"{self.data['biometric']['date'].min().strftime('%Y-%m-%d')} to {self.data['biometric']['date'].max().strftime('%Y-%m-%d')}",
             ],
         ]
@@ -418,6 +620,20 @@ class AadhaarReportGenerator:
         )
 
         self.story.append(dataset_table)
+        if self.sample_fraction:
+            self.story.append(
+                Paragraph(
+                    f"<i>Draft preview: {self.sample_fraction:.0%} stratified sample "
+                    "by state and district. Records and totals are scaled-up "
+                    "estimates; ± values are 95% margins of error.</i>",
+                    ParagraphStyle(
+                        "Caption",
+                        alignment=TA_CENTER,
+                        fontSize=8,
+                        textColor=colors.grey,
+                    ),
+                )
+            )
         self.story.append(Spacer(1, 0.3 * inch))
 
         self.story.append(
@@ -562,47 +778,31 @@ class AadhaarReportGenerator:
             )
         )
 
-        # Calculate statistics
+        # Calculate statistics in one streaming pass over the frame
         df = self.data["enrolment"]
-        stats_data = [
-            ["Statistic", "Age 0-5", "Age 5-17", "Age 18+", "Total"],
-            ["Count", f"{len(df):,}", f"{len(df):,}", f"{len(df):,}", f"{len(df):,}"],
-            [
-                "Mean",
-                f"{df['age_0_5'].mean():.1f}",
-                f"{df['age_5_17'].mean():.1f}",
-                f"{df['age_18_greater'].mean():.1f}",
-                f"{df['total_enrollments'].mean():.1f}",
-            ],
-            [
-                "Median",
-                f"{df['age_0_5'].median():.1f}",
-                f"{df['age_5_17'].median():.1f}",
-                f"{df['age_18_greater'].median():.1f}",
-                f"{df['total_enrollments'].median():.1f}",
-            ],
-            [
-                "Std Dev",
-                f"{df['age_0_5'].std():.1f}",
-                f"{df['age_5_17'].std():.1f}",
-                f"{df['age_18_greater'].std():.1f}",
-                f"{df['total_enrollments'].std():.1f}",
-            ],
-            [
-                "Min",
-                f"{df['age_0_5'].min():.0f}",
-                f"{df['age_5_17'].min():.0f}",
-                f"{df['age_18_greater'].min():.0f}",
-                f"{df['total_enrollments'].min():.0f}",
-            ],
-            [
-                "Max",
-                f"{df['age_0_5'].max():.0f}",
-                f"{df['age_5_17'].max():.0f}",
-                f"{df['age_18_greater'].max():.0f}",
-                f"{df['total_enrollments'].max():.0f}",
-            ],
-        ]
+        cols = ["age_0_5", "age_5_17", "age_18_greater", "total_enrollments"]
+        values = df[cols]
+        if self.sample_fraction:
+            # Per-record statistics use the unscaled sampled counts
+            values = values.div(df["sample_weight"], axis=0)
+        summary = SummaryStatistics(cols).update(values).summary()
+        # The streaming median is a KLL sketch estimate; the frame is in memory
+        median = "Median (approx.)"
+        if self.quantile_mode == "exact":
+            summary.loc["median"] = values.median()
+            median = "Median"
+        stats_data = [["Statistic", "Age 0-5", "Age 5-17", "Age 18+", "Total"]]
+        for label, stat, fmt in [
+            ("Count", "count", "{:,.0f}"),
+            ("Mean", "mean", "{:.1f}"),
+            (median, "median", "{:.1f}"),
+            ("Std Dev", "std", "{:.1f}"),
+            ("Min", "min", "{:.0f}"),
+            ("Max", "max", "{:.0f}"),
+            ("Skewness", "skew", "{:.2f}"),
+            ("Kurtosis", "kurtosis", "{:.2f}"),
+        ]:
+            stats_data.append([label, *[fmt.format(v) for v in summary.loc[stat]]])
 
         stats_table = Table(
             stats_data,
@@ -628,7 +828,7 @@ class AadhaarReportGenerator:
         self.story.append(Spacer(1, 0.2 * inch))
 
         # Add distribution plot
-        fig, axes = plt.subplots(1, 4, figsize=(12, 3))
+        fig, axes = new_figure(6 * inch, 1.8 * inch, 1, 4)
         colors_list = ["#1E3A8A", "#3B82F6", "#10B981", "#6366F1"]
         titles = ["Children (0-5)", "Youth (5-17)", "Adults (18+)", "Total"]
         cols = ["age_0_5", "age_5_17", "age_18_greater", "total_enrollments"]
@@ -640,19 +840,11 @@ class AadhaarReportGenerator:
                 color=color,
                 alpha=0.7,
             )
-            axes[i].set_title(title, fontsize=10)
+            axes[i].set_title(title)
             axes[i].set_xlabel("Count")
             axes[i].axvline(df[col].mean(), color="red", linestyle="--", linewidth=1)
 
-        plt.tight_layout()
-
-        # Save and add to PDF
-        img_buffer = io.BytesIO()
-        plt.savefig(img_buffer, format="png", dpi=150, bbox_inches="tight")
-        img_buffer.seek(0)
-        plt.close()
-
-        self.story.append(Image(img_buffer, width=6 * inch, height=1.8 * inch))
+        self._add_figure(fig, flat=True)
         self.story.append(
             Paragraph(
                 "<i>Figure 1: Distribution of enrollments by age group (95th percentile clipped)</i>",
@@ -669,14 +861,16 @@ class AadhaarReportGenerator:
         )
 
         state_summary = (
-            df.groupby("state")
+            df.groupby("state_id")
             .agg(
                 {
+                    "state": "first",
                     "total_enrollments": "sum",
                     "pincode": "nunique",
-                    "district": "nunique",
+                    "district_id": "nunique",
                 }
             )
+            .set_index("state")
             .sort_values("total_enrollments", ascending=False)
             .head(10)
         )
@@ -688,7 +882,7 @@ class AadhaarReportGenerator:
                     state,
                     f"{row['total_enrollments']:,.0f}",
                     f"{row['pincode']:,}",
-                    f"{row['district']}",
+                    f"{row['district_id']}",
                 ]
             )
 
@@ -726,7 +920,7 @@ class AadhaarReportGenerator:
         )
 
         # State bar chart
-        fig, ax = plt.subplots(figsize=(10, 4))
+        fig, ax = new_figure(5.5 * inch, 2.5 * inch)
         top_states = state_summary.head(15)
         bars = ax.barh(
             range(len(top_states)),
@@ -745,17 +939,10 @@ class AadhaarReportGenerator:
                 i,
                 f"{v:,.0f}",
                 va="center",
-                fontsize=8,
+                fontsize=6,
             )
 
-        plt.tight_layout()
-
-        img_buffer = io.BytesIO()
-        plt.savefig(img_buffer, format="png", dpi=150, bbox_inches="tight")
-        img_buffer.seek(0)
-        plt.close()
-
-        self.story.append(Image(img_buffer, width=5.5 * inch, height=2.5 * inch))
+        self._add_figure(fig, flat=True)
 
         self.story.append(PageBreak())
 
@@ -764,12 +951,13 @@ class AadhaarReportGenerator:
             Paragraph("<b>4.3 Temporal Trends</b>", self.styles["SubSection"])
         )
 
-        df["year"] = df["date"].dt.year
-        df["month"] = df["date"].dt.month
+        df = add_calendar_features(
+            df, ["year", "month", "is_working_day", "is_weekend", "is_public_holiday"]
+        )
         monthly = df.groupby(["year", "month"])["total_enrollments"].sum().reset_index()
         monthly["date"] = pd.to_datetime(monthly[["year", "month"]].assign(day=1))
 
-        fig, ax = plt.subplots(figsize=(10, 4))
+        fig, ax = new_figure(5.5 * inch, 2.5 * inch)
         ax.plot(
             monthly["date"],
             monthly["total_enrollments"],
@@ -785,14 +973,7 @@ class AadhaarReportGenerator:
         ax.set_ylabel("Total Enrollments")
         ax.set_title("Monthly Enrollment Trends", fontweight="bold")
         plt.xticks(rotation=45)
-        plt.tight_layout()
-
-        img_buffer = io.BytesIO()
-        plt.savefig(img_buffer, format="png", dpi=150, bbox_inches="tight")
-        img_buffer.seek(0)
-        plt.close()
-
-        self.story.append(Image(img_buffer, width=5.5 * inch, height=2.5 * inch))
+        self._add_figure(fig)
         self.story.append(
             Paragraph(
                 "<i>Figure 2: Monthly enrollment trends over the analysis period</i>",
@@ -802,6 +983,26 @@ class AadhaarReportGenerator:
             )
         )
 
+        # Daily volume by day type from the calendar dimension
+        day_flags = ["is_working_day", "is_weekend", "is_public_holiday"]
+        daily = (
+            df.groupby(["date", *day_flags])["total_enrollments"].sum().reset_index()
+        )
+        day_text = ", ".join(
+            f"{name}: {daily.loc[daily[flag] == 1, 'total_enrollments'].mean():,.0f}"
+            for name, flag in zip(
+                ["working days", "weekends", "public holidays"], day_flags
+            )
+            if (daily[flag] == 1).any()
+        )
+        self.story.append(Spacer(1, 0.1 * inch))
+        self.story.append(
+            Paragraph(
+                f"<b>Average daily enrollments by day type</b> - {day_text}.",
+                self.styles["CustomBody"],
+            )
+        )
+
         self.story.append(PageBreak())
 
     def add_equity_analysis(self):
@@ -814,26 +1015,26 @@ class AadhaarReportGenerator:
             Paragraph("<b>5.1 Gini Coefficient Analysis</b>", self.styles["SubSection"])
         )
 
-        # Calculate Gini for each state
-        def calculate_gini(data):
-            sorted_data = np.sort(data)
-            n = len(sorted_data)
-            if n == 0 or sorted_data.sum() == 0:
-                return 0
-            cumsum = np.cumsum(sorted_data)
-            return (2 * np.sum((np.arange(1, n + 1) * sorted_data))) / (
-                n * np.sum(sorted_data)
-            ) - (n + 1) / n
-
+        # Gini for each state with bootstrap intervals (all states at once)
         df = self.data["enrolment"]
-        state_gini = []
-        for state in df["state"].unique():
-            state_data = df[df["state"] == state]["total_enrollments"].values
-            if len(state_data) > 1 and state_data.sum() > 0:
-                gini = calculate_gini(state_data)
-                state_gini.append({"state": state, "gini": gini})
-
-        gini_df = pd.DataFrame(state_gini).sort_values("gini", ascending=False)
+        gini_df = (
+            inequality_by_group(
+                df,
+                ["state"],
+                "total_enrollments",
+                replicates=GINI_REPLICATES,
+                seed=self.seed,
+            )
+            .rename(
+                columns={
+                    "gini_coefficient": "gini",
+                    "gini_coefficient_lower": "gini_lower",
+                    "gini_coefficient_upper": "gini_upper",
+                }
+            )
+            .dropna(subset=["gini"])
+            .sort_values("gini", ascending=False)
+        )
 
         gini_text = f"""
         The Gini coefficient measures inequality in enrollment distribution within each state.
@@ -847,17 +1048,25 @@ class AadhaarReportGenerator:
         self.story.append(Paragraph(gini_text, self.styles["CustomBody"]))
 
         # Gini table
-        gini_table_data = [["State", "Gini Coefficient", "Inequality Level"]]
+        gini_table_data = [["State", "Gini Coefficient", "95% CI", "Inequality Level"]]
         for _, row in gini_df.head(10).iterrows():
             level = (
                 "High"
                 if row["gini"] > 0.4
                 else ("Medium" if row["gini"] > 0.3 else "Low")
             )
-            gini_table_data.append([row["state"], f"{row['gini']:.3f}", level])
+            gini_table_data.append(
+                [
+                    row["state"],
+                    f"{row['gini']:.3f}",
+                    f"{row['gini_lower']:.3f} - {row['gini_upper']:.3f}",
+                    level,
+                ]
+            )
 
         gini_table = Table(
-            gini_table_data, colWidths=[2.5 * inch, 1.5 * inch, 1.5 * inch]
+            gini_table_data,
+            colWidths=[2.2 * inch, 1.2 * inch, 1.3 * inch, 1.2 * inch],
         )
         gini_table.setStyle(
             TableStyle(
@@ -875,31 +1084,80 @@ class AadhaarReportGenerator:
         self.story.append(gini_table)
 
         # Gini visualization
-        fig, ax = plt.subplots(figsize=(10, 4))
+        fig, ax = new_figure(5.5 * inch, 2.5 * inch)
         top_gini = gini_df.head(15)
         colors_gini = [
             "#EF4444" if g > 0.4 else "#F59E0B" if g > 0.3 else "#10B981"
             for g in top_gini["gini"]
         ]
-        bars = ax.barh(range(len(top_gini)), top_gini["gini"].values, color=colors_gini)
+        errors = [
+            top_gini["gini"] - top_gini["gini_lower"],
+            top_gini["gini_upper"] - top_gini["gini"],
+        ]
+        bars = ax.barh(
+            range(len(top_gini)),
+            top_gini["gini"].values,
+            color=colors_gini,
+            xerr=np.clip(errors, 0, None),
+            error_kw={"elinewidth": 0.8, "capsize": 2, "ecolor": "#374151"},
+        )
         ax.set_yticks(range(len(top_gini)))
         ax.set_yticklabels(top_gini["state"])
-        ax.set_xlabel("Gini Coefficient")
+        ax.set_xlabel("Gini Coefficient (bars: 95% bootstrap interval)")
         ax.set_title(
             "Enrollment Inequality by State (Gini Coefficient)", fontweight="bold"
         )
         ax.axvline(0.4, color="red", linestyle="--", label="High Inequality Threshold")
         ax.invert_yaxis()
         ax.legend()
-        plt.tight_layout()
-
-        img_buffer = io.BytesIO()
-        plt.savefig(img_buffer, format="png", dpi=150, bbox_inches="tight")
-        img_buffer.seek(0)
-        plt.close()
-
         self.story.append(Spacer(1, 0.2 * inch))
-        self.story.append(Image(img_buffer, width=5.5 * inch, height=2.5 * inch))
+        self._add_figure(fig, flat=True)
+
+        # Gini trend over time for the largest states
+        trend_engine = GiniTrendEngine(windows=(30,)).update(daily_aggregates(df))
+        trends = trend_engine.trend("state", "rolling_30d")
+        period_label = "rolling 30-day"
+        if trends["period_end"].nunique() < 2:
+            trends = trend_engine.trend("state", "month")
+            period_label = "monthly"
+
+        if trends["period_end"].nunique() >= 2:
+            top_states = (
+                df.groupby("state")["total_enrollments"].sum().nlargest(6).index
+            )
+            fig, ax = new_figure(5.5 * inch, 2.5 * inch)
+            for state in top_states:
+                state_trend = trends[trends["state"] == state]
+                ax.plot(
+                    state_trend["period_end"],
+                    state_trend["gini_coefficient"],
+                    marker="o",
+                    markersize=3,
+                    linewidth=1.5,
+                    label=state,
+                )
+            ax.axhline(0.4, color="red", linestyle="--", linewidth=1)
+            ax.set_ylabel("Gini Coefficient")
+            ax.set_title(
+                f"Enrollment Inequality Trend ({period_label} Gini, top 6 states)",
+                fontweight="bold",
+            )
+            ax.legend(ncol=3)
+            plt.xticks(rotation=45)
+            self.story.append(Spacer(1, 0.2 * inch))
+            self._add_figure(fig)
+            self.story.append(
+                Paragraph(
+                    f"<i>Figure: {period_label.capitalize()} Gini across pincode "
+                    "totals for the six largest states</i>",
+                    ParagraphStyle(
+                        "Caption",
+                        alignment=TA_CENTER,
+                        fontSize=8,
+                        textColor=colors.grey,
+                    ),
+                )
+            )
 
         self.story.append(PageBreak())
 
@@ -919,35 +1177,20 @@ class AadhaarReportGenerator:
         <br/>• <b>Moderately Served:</b> 50-75% of district median
         <br/>• <b>Well Served:</b> > 75% of district median
         """
+        if self.quantile_mode == "approx":
+            service_text += f"""
+        <br/><br/><i>District medians are approximate: they come from KLL
+        quantile sketches with a rank error of about {1.7 / DEFAULT_K:.1%}, so
+        records close to a threshold may be classified one level off.</i>
+        """
         self.story.append(Paragraph(service_text, self.styles["CustomBody"]))
 
-        # Calculate service levels
-        district_medians = (
-            df.groupby(["state", "district"])["total_enrollments"]
-            .median()
-            .reset_index()
-        )
-        district_medians.columns = ["state", "district", "district_median"]
-
-        df_classified = df.merge(district_medians, on=["state", "district"], how="left")
-
-        def classify(row):
-            if (
-                row["total_enrollments"] == 0
-                or row["total_enrollments"] < row["district_median"] * 0.25
-            ):
-                return "Severely Underserved"
-            elif row["total_enrollments"] < row["district_median"] * 0.5:
-                return "Underserved"
-            elif row["total_enrollments"] < row["district_median"] * 0.75:
-                return "Moderately Served"
-            return "Well Served"
-
-        df_classified["service_level"] = df_classified.apply(classify, axis=1)
+        # Calculate service levels (district medians from the quantile engine)
+        df_classified = self._service_levels(df)
         service_summary = df_classified["service_level"].value_counts()
 
         # Pie chart
-        fig, ax = plt.subplots(figsize=(8, 5))
+        fig, ax = new_figure(4.5 * inch, 3 * inch)
         colors_pie = ["#10B981", "#F59E0B", "#EF4444", "#7F1D1D"]
         explode = (0.05, 0.05, 0.05, 0.1)
 
@@ -963,14 +1206,7 @@ class AadhaarReportGenerator:
             "Distribution of Service Levels Across Pincodes", fontweight="bold"
         )
 
-        plt.tight_layout()
-
-        img_buffer = io.BytesIO()
-        plt.savefig(img_buffer, format="png", dpi=150, bbox_inches="tight")
-        img_buffer.seek(0)
-        plt.close()
-
-        self.story.append(Image(img_buffer, width=4.5 * inch, height=3 * inch))
+        self._add_figure(fig, flat=True)
 
         self.story.append(PageBreak())
 
@@ -1053,22 +1289,15 @@ class AadhaarReportGenerator:
         ]
         importance = [0.28, 0.24, 0.18, 0.12, 0.08, 0.04, 0.03, 0.02, 0.01]
 
-        fig, ax = plt.subplots(figsize=(8, 4))
+        fig, ax = new_figure(5 * inch, 2.5 * inch)
         bars = ax.barh(features, importance, color="#3B82F6")
         ax.set_xlabel("Importance Score")
         ax.set_title("Feature Importance (Random Forest)", fontweight="bold")
 
         for i, v in enumerate(importance):
-            ax.text(v + 0.005, i, f"{v:.2f}", va="center", fontsize=9)
-
-        plt.tight_layout()
-
-        img_buffer = io.BytesIO()
-        plt.savefig(img_buffer, format="png", dpi=150, bbox_inches="tight")
-        img_buffer.seek(0)
-        plt.close()
+            ax.text(v + 0.005, i, f"{v:.2f}", va="center", fontsize=6)
 
-        self.story.append(Image(img_buffer, width=5 * inch, height=2.5 * inch))
+        self._add_figure(fig, flat=True)
 
         feature_text = """
         <b>Key Observation:</b> Age group distributions (5-17 and 18+ years) are the most important 
@@ -1086,17 +1315,20 @@ class AadhaarReportGenerator:
         )
 
         df = self.data["enrolment"]
-        total_enrol = df["total_enrollments"].sum()
-        total_demo = self.data["demographic"]["total_demo_updates"].sum()
-        total_bio = self.data["biometric"]["total_bio_updates"].sum()
+        if self.sample_fraction:
+            totals, stderrs = zip(*self.estimates.values())
+            combined = format_estimate(sum(totals), np.hypot.reduce(stderrs))
+        else:
+            totals = [self.data[n][DATASETS[n]["total_col"]].sum() for n in DATASETS]
+            combined = f"{sum(totals):,.0f}"
 
         # Key metrics summary
         metrics_text = f"""
         <b>Volume Metrics:</b>
-        <br/>• Total Enrollments Analyzed: <b>{total_enrol:,.0f}</b>
-        <br/>• Total Demographic Updates: <b>{total_demo:,.0f}</b>
-        <br/>• Total Biometric Updates: <b>{total_bio:,.0f}</b>
-        <br/>• Combined Activity: <b>{(total_enrol + total_demo + total_bio):,.0f}</b>
+        <br/>• Total Enrollments Analyzed: <b>{self._headline_total("enrolment")}</b>
+        <br/>• Total Demographic Updates: <b>{self._headline_total("demographic")}</b>
+        <br/>• Total Biometric Updates: <b>{self._headline_total("biometric")}</b>
+        <br/>• Combined Activity: <b>{combined}</b>
         
         <b>Geographic Coverage:</b>
         <br/>• States/UTs: <b>{df['state'].nunique()}</b>
@@ -1161,8 +1393,78 @@ class AadhaarReportGenerator:
         )
         self.story.append(findings_table)
 
+        if CHANGE_POINTS_FILE.exists():
+            self._add_level_shifts()
+
         self.story.append(PageBreak())
 
+    def _add_level_shifts(self, n=10):
+        """Table of the largest detected district level shifts"""
+        shifts = pd.read_csv(CHANGE_POINTS_FILE, parse_dates=["date"])
+        shifts = shifts[shifts["level"] == "district"]
+        if shifts.empty:
+            return
+        shifts = shifts.assign(
+            delta=(shifts["mean_after"] - shifts["mean_before"]).abs()
+        ).nlargest(n, "delta")
+
+        self.story.append(Spacer(1, 0.2 * inch))
+        self.story.append(
+            Paragraph("<b>Detected Level Shifts</b>", self.styles["SubSection"])
+        )
+        self.story.append(
+            Paragraph(
+                "Largest shifts in daily district activity found by change-point "
+                "detection (PELT), e.g. centres opening or closing or enrollment "
+                "drives starting or ending.",
+                self.styles["CustomBody"],
+            )
+        )
+        rows = [
+            ["District", "State", "Activity", "From", "Daily before", "Daily after"]
+        ]
+        rows += [
+            [
+                row.district,
+                row.state,
+                row.activity.replace("_", " ").capitalize(),
+                row.date.strftime("%Y-%m-%d"),
+                f"{row.mean_before:,.0f}",
+                f"{row.mean_after:,.0f}",
+            ]
+            for row in shifts.itertuples()
+        ]
+        table = Table(
+            rows,
+            colWidths=[
+                1.3 * inch,
+                1.3 * inch,
+                1.4 * inch,
+                0.9 * inch,
+                0.8 * inch,
+                0.8 * inch,
+            ],
+        )
+        table.setStyle(
+            TableStyle(
+                [
+                    ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#1E3A8A")),
+                    ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+                    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+                    ("FONTSIZE", (0, 0), (-1, -1), 8),
+                    ("ALIGN", (4, 0), (-1, -1), "RIGHT"),
+                    ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
+                    (
+                        "ROWBACKGROUNDS",
+                        (0, 1),
+                        (-1, -1),
+                        [colors.white, colors.HexColor("#F3F4F6")],
+                    ),
+                ]
+            )
+        )
+        self.story.append(table)
+
     def add_recommendations(self):
         """Add recommendations section"""
         self.story.append(
@@ -1211,12 +1513,11 @@ class AadhaarReportGenerator:
             Paragraph("<b>8.2 Impact Assessment</b>", self.styles["SubSection"])
         )
 
-        impact_text = """
+        impact_text = f"""
         <b>Potential Impact of Recommendations:</b>
         
-        If underserved districts achieve average service levels:
-        <br/>• <b>30-40% increase</b> in enrollments in targeted districts
-        <br/>• <b>2-3 million additional enrollments</b> annually
+        If underserved districts move towards well-served service levels:
+        {self._impact_bullets()}
         <br/>• <b>Reduced inequality:</b> Target Gini coefficient reduction from 0.35 to 0.28
         
         <b>Resource Requirements:</b>
@@ -1228,6 +1529,24 @@ class AadhaarReportGenerator:
 
         self.story.append(PageBreak())
 
+    def _impact_bullets(self):
+        """Impact ranges from the Monte Carlo simulation, if it has been run"""
+        if not IMPACT_FILE.exists():
+            return (
+                "<br/>• <b>30-40% increase</b> in enrollments in targeted districts"
+                "<br/>• <b>2-3 million additional enrollments</b> annually"
+            )
+        impact = pd.read_csv(IMPACT_FILE).set_index("metric")
+        gain, increase = impact.loc["additional_annual"], impact.loc["increase_pct"]
+        return (
+            f"<br/>• <b>{increase['p05']:.0f}-{increase['p95']:.0f}% increase</b> in "
+            f"enrollments in targeted districts (median {increase['p50']:.0f}%)"
+            f"<br/>• <b>{gain['p05'] / 1e6:.1f}-{gain['p95'] / 1e6:.1f} million additional "
+            f"enrollments</b> annually (90% interval of {gain['draws']:,.0f} simulated "
+            f"scenarios of demand, uptake and deployment; the all-districts-reach-average "
+            f"point estimate is {gain['point_estimate'] / 1e6:.1f} million)"
+        )
+
     def add_code_section(self):
         """Add code implementation section"""
         self.story.append(
@@ -1344,53 +1663,268 @@ UIDAI/
         """
         self.story.append(Paragraph(structure, self.styles["CodeText"]))
 
-    def generate_report(self, output_filename="UIDAI_Hackathon_Report.pdf"):
-        """Generate the complete PDF report"""
+    def _district_appendix_rows(self):
+        """Formatted appendix rows, one per district"""
+        df = self._service_levels(self.data["enrolment"])
+        summary = df.groupby("district_id").agg(
+            state=("state", "first"),
+            district=("district", "first"),
+            enrollments=("total_enrollments", "sum"),
+            pincodes=("pincode", "nunique"),
+        )
+        summary["gini"] = gini_by_group(
+            df, ["district_id"], "total_enrollments"
+        ).set_index("district_id")["gini_coefficient"]
+        mix = (
+            pd.crosstab(df["district_id"], df["service_level"], normalize="index")
+            .reindex(columns=SERVICE_LEVELS, fill_value=0)
+            .mul(100)
+            .round()
+            .astype(int)
+            .astype(str)
+        )
+        summary["service_mix"] = mix.agg("/".join, axis=1)
+
+        clusters_file = REPORT_PATH / "district_clusters.csv"
+        priority_file = REPORT_PATH / "priority_intervention_districts.csv"
+        # The notebook outputs carry raw names; resolve them like the data
+        for path, column in [
+            (clusters_file, "cluster_name"),
+            (priority_file, "priority_score"),
+        ]:
+            if path.exists():
+                table = self.geography.canonicalize(
+                    pd.read_csv(path, usecols=["state", "district", column])
+                )
+                summary = summary.join(
+                    table.drop_duplicates("district_id").set_index("district_id")[
+                        column
+                    ]
+                )
+
+        summary = summary.reset_index().sort_values(
+            ["state", "enrollments"], ascending=[True, False]
+        )
+        for column in ["cluster_name", "priority_score"]:
+            if column not in summary:
+                summary[column] = np.nan
+        decimals = "{:.3f}".format
+        rows = pd.DataFrame(
+            {
+                "state": summary["state"],
+                "district": summary["district"],
+                "enrollments": summary["enrollments"].map("{:,.0f}".format),
+                "pincodes": summary["pincodes"].map("{:,}".format),
+                "gini": summary["gini"].map(decimals, na_action="ignore"),
+                "service_mix": summary["service_mix"],
+                "cluster": summary["cluster_name"],
+                "priority": summary["priority_score"].map(decimals, na_action="ignore"),
+            }
+        )
+        return rows.fillna("-").to_numpy().tolist()
+
+    def add_district_appendix(self):
+        """Add the full district appendix as page-sized table chunks"""
+        self.story.append(
+            Paragraph("10. Appendix: District Summary", self.styles["SectionHeader"])
+        )
+        median = (
+            "approximate (KLL sketch) district median"
+            if self.quantile_mode == "approx"
+            else "district median"
+        )
+        self.story.append(
+            Paragraph(
+                "All districts, ordered by state and enrollment volume. Service mix "
+                "gives the share of records that are Severely underserved / "
+                "Underserved / Moderately served / Well served against the "
+                f"{median}; cluster and priority score come from the "
+                "clustering and prioritization outputs.",
+                self.styles["CustomBody"],
+            )
+        )
+
+        header = [name for name, _ in APPENDIX_COLUMNS]
+        widths = [width * inch for _, width in APPENDIX_COLUMNS]
+        rows = self._district_appendix_rows()
+        for start in range(0, len(rows), APPENDIX_ROWS_PER_CHUNK):
+            chunk = Table(
+                [header, *rows[start : start + APPENDIX_ROWS_PER_CHUNK]],
+                colWidths=widths,
+                repeatRows=1,
+            )
+            chunk.setStyle(APPENDIX_TABLE_STYLE)
+            self.story.append(chunk)
+
+    def build_fragment(self, section, path, *args):
+        """Lay out one section into a PDF -> (path, page count, headings)"""
+        self.story = []
+        getattr(self, section)(*args)
+        while self.story and isinstance(self.story[-1], PageBreak):
+            self.story.pop()
+
+        doc = FragmentDocTemplate(str(path), **PAGE_LAYOUT)
+        if self.sample_fraction:
+            doc.build(
+                self.story,
+                onFirstPage=self._draw_watermark,
+                onLaterPages=self._draw_watermark,
+            )
+        else:
+            doc.build(self.story)
+        return str(path), doc.page, doc.headings
+
+    def _options(self):
+        return {
+            "quantile_mode": self.quantile_mode,
+            "sample_fraction": self.sample_fraction,
+            "seed": self.seed,
+            "figure_format": self.figure_format,
+        }
+
+    def _build_sections(self, tmp_dir, workers):
+        """Build the title page and numbered sections, in parallel if allowed"""
+        tasks = [
+            (section, Path(tmp_dir) / f"{i:02d}_{section}.pdf", self._options())
+            for i, section in enumerate(["add_title_page", *self.SECTIONS])
+        ]
+        if workers == 1:
+            return [self.build_fragment(section, path) for section, path, _ in tasks]
+
+        global _FRAGMENT_GENERATOR
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("fork" if "fork" in methods else None)
+        _FRAGMENT_GENERATOR = self if "fork" in methods else None
+        try:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+                return list(pool.map(_build_fragment, tasks))
+        finally:
+            _FRAGMENT_GENERATOR = None
+
+    def _build_toc(self, tmp_dir, fragments):
+        """Table of contents from real fragment page counts"""
+        title_pages = fragments[0][1]
+        toc_pages = 1
+        while True:
+            toc_items, offset = [], title_pages + toc_pages
+            for _, pages, headings in fragments[1:]:
+                for style, text, page in headings:
+                    indent = "   " if style == "SubSection" else ""
+                    toc_items.append((indent + text, str(offset + page)))
+                offset += pages
+            toc = self.build_fragment(
+                "add_table_of_contents", Path(tmp_dir) / "toc.pdf", toc_items
+            )
+            if toc[1] == toc_pages:
+                return toc
+            toc_pages = toc[1]
+
+    def _merge_fragments(self, paths, output_path):
+        """Concatenate fragments and stamp 'Page i of N' on every page after the first"""
+        writer = PdfWriter()
+        for path in paths:
+            writer.append(path)
+
+        total = len(writer.pages)
+        numbers = io.BytesIO()
+        stamp = pdf_canvas.Canvas(numbers, pagesize=A4)
+        for page in range(1, total + 1):
+            if page > 1:
+                stamp.setFont("Helvetica", 8)
+                stamp.setFillColor(colors.grey)
+                stamp.drawCentredString(
+                    A4[0] / 2, 0.4 * inch, f"Page {page} of {total}"
+                )
+            stamp.showPage()
+        stamp.save()
+
+        overlay = PdfReader(numbers)
+        for page, number in zip(writer.pages, overlay.pages):
+            page.merge_page(number)
+        with open(output_path, "wb") as f:
+            writer.write(f)
+        return total
+
+    def generate_report(
+        self, output_filename="UIDAI_Hackathon_Report.pdf", workers=None
+    ):
+        """Generate the complete PDF report
+
+        Each numbered section is laid out into its own PDF fragment in a
+        worker process; the fragments are merged, the table of contents is
+        built from their real page counts and pages are numbered at the end.
+        """
         print("\n" + "=" * 60)
         print("📄 GENERATING PDF REPORT")
         print("=" * 60)
 
         # Load data
         self.load_data()
+        output_path = REPORT_PATH / output_filename
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            print("\nBuilding report sections...")
+            fragments = self._build_sections(tmp_dir, workers)
+            toc = self._build_toc(tmp_dir, fragments)
+
+            print("\nMerging PDF fragments...")
+            paths = [fragments[0][0], toc[0], *[f[0] for f in fragments[1:]]]
+            total = self._merge_fragments(paths, output_path)
 
-        # Build document
-        doc = SimpleDocTemplate(
-            str(REPORT_PATH / output_filename),
-            pagesize=A4,
-            rightMargin=0.75 * inch,
-            leftMargin=0.75 * inch,
-            topMargin=0.75 * inch,
-            bottomMargin=0.75 * inch,
-        )
-
-        # Add sections
-        print("\nBuilding report sections...")
-        self.add_title_page()
-        self.add_table_of_contents()
-        self.add_problem_statement()
-        self.add_datasets_section()
-        self.add_methodology_section()
-        self.add_analysis_section()
-        self.add_equity_analysis()
-        self.add_modeling_section()
-        self.add_findings_section()
-        self.add_recommendations()
-        self.add_code_section()
-
-        # Build PDF
-        print("\nGenerating PDF...")
-        doc.build(self.story)
-
-        print(f"\n✅ Report generated: {REPORT_PATH / output_filename}")
+        print(f"\n✅ Report generated: {output_path} ({total} pages)")
         print("=" * 60)
 
-        return str(REPORT_PATH / output_filename)
+        return str(output_path)
 
 
 def main():
     """Main function to generate the report"""
-    generator = AadhaarReportGenerator()
-    report_path = generator.generate_report()
+    parser = argparse.ArgumentParser(description="UIDAI PDF report generator")
+    parser.add_argument(
+        "--sample",
+        type=float,
+        default=None,
+        metavar="FRACTION",
+        help="Draft preview on a stratified sample (e.g. 0.05)",
+    )
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument(
+        "--quantiles",
+        choices=["exact", "approx"],
+        default="exact",
+        help="District medians from exact values or from KLL sketches",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Processes for section layout (1 builds in-process)",
+    )
+    parser.add_argument(
+        "--figures",
+        choices=["raster", "vector"],
+        default="raster",
+        help="Embed charts as print-size PNGs or as vector drawings (needs svglib)",
+    )
+    args = parser.parse_args()
+
+    if args.figures == "vector" and svg2rlg is None:
+        print("⚠️ svglib is not installed - embedding charts as palette PNGs")
+
+    generator = AadhaarReportGenerator(
+        quantile_mode=args.quantiles,
+        sample_fraction=args.sample,
+        seed=args.seed,
+        figure_format=args.figures,
+    )
+    if args.sample:
+        report_path = generator.generate_report(
+            "UIDAI_Hackathon_Report_draft.pdf", workers=args.workers
+        )
+        print(f"\n📁 Draft preview saved to: {report_path}")
+        return
+
+    report_path = generator.generate_report(workers=args.workers)
     print(f"\n📁 Report saved to: {report_path}")
     print("\nThis report is ready for hackathon submission!")
 
@@ -0,0 +1,279 @@
+"""
+UIDAI Aadhaar Data Analytics - Geography Dimension
+===================================================
+Resolves the free-text state, district and pincode strings of the raw
+feeds to canonical names and small integer ids.
+
+- Names are matched on a normalized key (case, spacing, punctuation and
+  "&" vs "and" ignored, trailing "*" markers dropped), then through the
+  bundled alias table data/reference/geography_aliases.csv
+  (e.g. Orissa -> Odisha, Rangareddi -> Rangareddy, Bangalore ->
+  Bengaluru); district aliases with a blank state apply in every state
+- A district's display name is its alias target, else its most frequent
+  raw spelling (ties broken alphabetically), so it does not depend on the
+  order shards are read in; group on the integer ids and attach names last
+- States must resolve to one of the 36 states / union territories in the
+  alias table; districts must contain letters; pincodes must be six digits
+  not starting with 0
+- Rows failing any check (e.g. state "100000") are quarantined and counted
+  per reason and raw value instead of leaking into the outputs
+
+Every distinct raw string is resolved once and cached, so encoding a chunk
+costs one factorize per column plus array lookups.
+
+Usage:
+    python scripts/geography.py
+
+Author: Data Science Team
+Date: October 2026
+"""
+
+import argparse
+import pickle
+import re
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ingest import DATASETS, ingest
+
+# Configuration
+BASE_PATH = Path(__file__).parent.parent
+REFERENCE_PATH = BASE_PATH / "data" / "reference"
+ALIASES_FILE = REFERENCE_PATH / "geography_aliases.csv"
+OUTPUT_PATH = BASE_PATH / "outputs"
+REPORT_PATH = OUTPUT_PATH / "reports"
+SKETCH_PATH = OUTPUT_PATH / "sketches"
+DIMENSION_FILE = SKETCH_PATH / "geography.pkl"
+
+PINCODE_PATTERN = re.compile(r"^[1-9]\d{5}$")
+
+
+def name_key(name):
+    """Matching key: lowercase alphanumerics with '&' read as 'and'"""
+    return re.sub(r"[^a-z0-9]", "", str(name).lower().replace("&", "and"))
+
+
+def clean_name(name):
+    """Display form: no '*' markers, single spaces, title case if unstyled"""
+    name = re.sub(r"\s+", " ", str(name).replace("*", "")).strip()
+    return name.title() if name.isupper() or name.islower() else name
+
+
+class GeographyDimension:
+    """Cached canonicalization of state / district / pincode to integer ids"""
+
+    def __init__(self, aliases_file=ALIASES_FILE):
+        aliases = pd.read_csv(aliases_file, dtype=str, keep_default_na=False)
+        states = aliases[aliases["level"] == "state"]
+        districts = aliases[aliases["level"] == "district"]
+        self.state_aliases = {
+            name_key(alias): canonical
+            for alias, canonical in zip(states["alias"], states["canonical"])
+        }
+        self.district_aliases = {
+            (state, name_key(alias)): canonical
+            for state, alias, canonical in zip(
+                districts["state"], districts["alias"], districts["canonical"]
+            )
+        }
+
+        self.state_names = []
+        self.state_ids = {}
+        self.district_names = []
+        self.district_states = []
+        self.district_ids = {}
+        self.district_aliased = {}
+        self.district_variants = []
+        self.pincode_names = []
+        self.pincode_ids = {}
+        self.cache = {"state": {}, "district": {}, "pincode": {}}
+        self.quarantine = Counter()
+
+    def _state_id(self, raw):
+        canonical = self.state_aliases.get(name_key(raw))
+        if canonical is None:
+            return -1
+        if canonical not in self.state_ids:
+            self.state_ids[canonical] = len(self.state_names)
+            self.state_names.append(canonical)
+        return self.state_ids[canonical]
+
+    def _district_id(self, state_id, raw):
+        display = clean_name(raw)
+        key = name_key(display)
+        if state_id < 0 or not re.search("[a-z]", key):
+            return -1
+        state = self.state_names[state_id]
+        alias = self.district_aliases.get(
+            (state, key), self.district_aliases.get(("", key))
+        )
+        if alias is not None:
+            key = name_key(alias)
+        if (state_id, key) not in self.district_ids:
+            self.district_ids[(state_id, key)] = len(self.district_names)
+            self.district_names.append(display)
+            self.district_states.append(state_id)
+            self.district_variants.append(Counter())
+        district_id = self.district_ids[(state_id, key)]
+        if alias is not None:
+            self.district_aliased[district_id] = alias
+            self.district_names[district_id] = alias
+        return district_id
+
+    def _count_variants(self, district_id, districts):
+        """Row counts of each raw spelling, to pick the display names"""
+        spellings = pd.DataFrame({"id": district_id, "raw": districts})
+        touched = set()
+        for (i, raw), rows in spellings[district_id >= 0].value_counts().items():
+            self.district_variants[i][clean_name(raw)] += rows
+            touched.add(i)
+        for i in touched:
+            if i not in self.district_aliased:
+                self.district_names[i] = min(
+                    self.district_variants[i].items(), key=lambda kv: (-kv[1], kv[0])
+                )[0]
+
+    def _pincode_id(self, raw):
+        if not PINCODE_PATTERN.match(raw):
+            return -1
+        if raw not in self.pincode_ids:
+            self.pincode_ids[raw] = len(self.pincode_names)
+            self.pincode_names.append(raw)
+        return self.pincode_ids[raw]
+
+    def _resolve(self, kind, values, resolver):
+        """Integer ids for an array of raw values via the per-kind cache"""
+        codes, uniques = pd.factorize(values)
+        cache = self.cache[kind]
+        lookup = np.empty(len(uniques) + 1, dtype=np.int32)
+        lookup[-1] = -1
+        for i, value in enumerate(uniques):
+            if value not in cache:
+                cache[value] = (
+                    resolver(*value) if kind == "district" else resolver(value)
+                )
+            lookup[i] = cache[value]
+        return lookup[codes]
+
+    def _district_codes(self, states, districts):
+        """State and district ids for raw name columns"""
+        state_id = self._resolve("state", states, self._state_id)
+        district_id = self._resolve(
+            "district",
+            pd.MultiIndex.from_arrays([state_id, districts]),
+            self._district_id,
+        )
+        return state_id, district_id
+
+    def encode(self, df):
+        """Canonical names and ids for a chunk; quarantined rows are removed"""
+        raw = {
+            "state": df["state"].astype(str).str.strip(),
+            "district": df["district"].astype(str).str.strip(),
+            "pincode": df["pincode"].astype(str).str.strip(),
+        }
+        state_id, district_id = self._district_codes(raw["state"], raw["district"])
+        pincode_id = self._resolve("pincode", raw["pincode"], self._pincode_id)
+        self._count_variants(district_id, raw["district"].to_numpy())
+
+        for reason, column, bad in [
+            ("invalid_state", "state", state_id < 0),
+            ("invalid_district", "district", (state_id >= 0) & (district_id < 0)),
+            ("invalid_pincode", "pincode", pincode_id < 0),
+        ]:
+            for value, rows in raw[column][bad].value_counts().items():
+                self.quarantine[(reason, value)] += rows
+
+        valid = (state_id >= 0) & (district_id >= 0) & (pincode_id >= 0)
+        df = df[valid].copy()
+        df["state"] = np.array(self.state_names, dtype=object)[state_id[valid]]
+        df["district"] = np.array(self.district_names, dtype=object)[district_id[valid]]
+        df["state_id"] = state_id[valid]
+        df["district_id"] = district_id[valid]
+        df["pincode_id"] = pincode_id[valid]
+        return df
+
+    def canonicalize(self, df):
+        """Canonical state / district names and ids for a table keyed by raw
+        names (e.g. notebook outputs); rows with invalid names are dropped"""
+        state_id, district_id = self._district_codes(
+            df["state"].astype(str).str.strip(), df["district"].astype(str).str.strip()
+        )
+        valid = (state_id >= 0) & (district_id >= 0)
+        df = df[valid].copy()
+        df["state"] = np.array(self.state_names, dtype=object)[state_id[valid]]
+        df["district"] = np.array(self.district_names, dtype=object)[district_id[valid]]
+        df["state_id"] = state_id[valid]
+        df["district_id"] = district_id[valid]
+        return df
+
+    def update(self, df):
+        """Ingestion consumer: resolve a chunk to grow the dimension"""
+        self.encode(df)
+        return self
+
+    def districts(self):
+        """District dimension table with ids and canonical names"""
+        return pd.DataFrame(
+            {
+                "district_id": np.arange(len(self.district_names)),
+                "state_id": self.district_states,
+                "state": [self.state_names[s] for s in self.district_states],
+                "district": self.district_names,
+            }
+        )
+
+    def quarantine_report(self):
+        """Quarantined raw values with their reason and row count"""
+        rows = [
+            (reason, value, count)
+            for (reason, value), count in self.quarantine.most_common()
+        ]
+        return pd.DataFrame(rows, columns=["reason", "raw_value", "rows"])
+
+    def save(self, path=DIMENSION_FILE):
+        """Persist ids so they stay stable across ingestion runs"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            pickle.dump(self, f)
+
+    @staticmethod
+    def load(path=DIMENSION_FILE):
+        """Load a previously saved dimension"""
+        with open(path, "rb") as f:
+            return pickle.load(f)
+
+
+def main():
+    """Resolve the geography of every dataset and report quarantined keys"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--rebuild", action="store_true")
+    args = parser.parse_args()
+
+    if args.rebuild or not DIMENSION_FILE.exists():
+        geography = GeographyDimension()
+    else:
+        geography = GeographyDimension.load(DIMENSION_FILE)
+    geography.quarantine.clear()
+
+    for dataset in DATASETS:
+        ingest(dataset, [geography])
+    geography.save(DIMENSION_FILE)
+
+    quarantine = geography.quarantine_report()
+    geography.districts().to_csv(REPORT_PATH / "geography_dimension.csv", index=False)
+    quarantine.to_csv(REPORT_PATH / "geography_quarantine.csv", index=False)
+    print(
+        f"✓ {len(geography.state_names)} states, {len(geography.district_names):,} "
+        f"districts, {len(geography.pincode_names):,} pincodes"
+    )
+    print(f"⚠️ Quarantined {quarantine['rows'].sum():,} rows:")
+    print(quarantine.head(20).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
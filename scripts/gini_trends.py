@@ -0,0 +1,238 @@
+"""
+UIDAI Aadhaar Data Analytics - Gini Trends
+===========================================
+Monthly and rolling-window (30/90 day) Gini coefficients per state and
+district. Daily pincode activity is held as a dense pincode x day matrix
+with cumulative sums, so every window of every group is evaluated in one
+vectorized ``grouped_gini`` call. New days only trigger recomputation of
+the months and window ends they fall into.
+
+A pincode takes part in a period when it has at least one record in it.
+
+Usage:
+    python scripts/gini_trends.py [--rebuild] [--step 7]
+
+Author: Data Science Team
+Date: October 2026
+"""
+
+import argparse
+import pickle
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ingest import iter_chunks, list_shards
+from inequality import grouped_gini
+
+# Configuration
+BASE_PATH = Path(__file__).parent.parent
+OUTPUT_PATH = BASE_PATH / "outputs"
+REPORT_PATH = OUTPUT_PATH / "reports"
+SKETCH_PATH = OUTPUT_PATH / "sketches"
+ENGINE_FILE = SKETCH_PATH / "gini_trend_engine.pkl"
+
+WINDOWS = (30, 90)
+DEFAULT_STEP = 7
+LEVELS = {"state": ["state"], "district": ["state", "district"]}
+PINCODE_KEYS = ["state", "district", "pincode"]
+
+
+def daily_aggregates(df, value_col="total_enrollments"):
+    """Collapse records to pincode x day activity and record counts"""
+    return (
+        df.dropna(subset=["date"])
+        .groupby([*PINCODE_KEYS, df["date"].dt.normalize()], as_index=False)
+        .agg(value=(value_col, "sum"), records=(value_col, "size"))
+    )
+
+
+class GiniTrendEngine:
+    """Pincode x day activity matrix with monthly and rolling Gini per group"""
+
+    def __init__(self, windows=WINDOWS, step=DEFAULT_STEP):
+        self.windows = tuple(windows)
+        self.step = step
+        self.pincodes = pd.DataFrame(columns=PINCODE_KEYS)
+        self.start = None
+        self.values = np.zeros((0, 0))
+        self.records = np.zeros((0, 0), dtype=np.int64)
+        self.trends = {level: None for level in LEVELS}
+        self.shards = set()
+
+    @property
+    def dates(self):
+        return pd.date_range(self.start, periods=self.values.shape[1], freq="D")
+
+    def _grow(self, daily):
+        """Add rows for unseen pincodes and columns for unseen days"""
+        keys = daily[PINCODE_KEYS].drop_duplicates()
+        known = keys.merge(self.pincodes, on=PINCODE_KEYS, how="left", indicator=True)
+        new = keys[(known["_merge"] == "left_only").to_numpy()]
+        self.pincodes = pd.concat([self.pincodes, new], ignore_index=True)
+
+        start, end = daily["date"].min(), daily["date"].max()
+        if self.start is not None:
+            start, end = min(start, self.start), max(end, self.dates[-1])
+        offset = 0 if self.start is None else (self.start - start).days
+        n_days = (end - start).days + 1
+
+        for name in ["values", "records"]:
+            old = getattr(self, name)
+            grown = np.zeros((len(self.pincodes), n_days), dtype=old.dtype)
+            grown[: old.shape[0], offset : offset + old.shape[1]] = old
+            setattr(self, name, grown)
+        self.start = start
+
+    def update(self, daily):
+        """Fold in pincode x day aggregates and refresh the touched periods"""
+        self._grow(daily)
+        rows = daily.merge(
+            self.pincodes.assign(row=np.arange(len(self.pincodes))),
+            on=PINCODE_KEYS,
+            how="left",
+        )["row"].to_numpy()
+        cols = (daily["date"] - self.start).dt.days.to_numpy()
+        np.add.at(self.values, (rows, cols), daily["value"].to_numpy(dtype=float))
+        np.add.at(self.records, (rows, cols), daily["records"].to_numpy())
+
+        first_touched = int(cols.min())
+        for level, keys in LEVELS.items():
+            tables = [self._monthly(keys, first_touched)] + [
+                self._rolling(keys, window, first_touched) for window in self.windows
+            ]
+            fresh = pd.concat(
+                [table for table in tables if table is not None], ignore_index=True
+            )
+            self.trends[level] = self._merge(self.trends[level], fresh, keys)
+        return self
+
+    def _merge(self, old, fresh, keys):
+        if old is None:
+            return fresh
+        index = [*keys, "period", "period_end"]
+        old = old.set_index(index)
+        fresh = fresh.set_index(index)
+        return (
+            pd.concat([old.drop(fresh.index, errors="ignore"), fresh])
+            .sort_index()
+            .reset_index()
+        )
+
+    def _gini_table(self, keys, values, active, period, ends):
+        """Gini for every (group, period end) column of a pincode x end matrix"""
+        groups = self.pincodes.groupby(keys, sort=True)
+        group_codes = groups.ngroup().to_numpy()
+        n_groups, n_ends = groups.ngroups, values.shape[1]
+
+        codes = (group_codes[:, None] * n_ends + np.arange(n_ends)[None, :])[active]
+        gini = grouped_gini(codes, values[active], n_groups * n_ends)
+        counts = np.bincount(codes, minlength=n_groups * n_ends)
+
+        table = groups.size().reset_index()[keys]
+        table = table.loc[table.index.repeat(n_ends)].reset_index(drop=True)
+        table["period"] = period
+        table["period_end"] = np.tile(ends, n_groups)
+        table["gini_coefficient"] = gini
+        table["active_pincodes"] = counts
+        return table[table["active_pincodes"] > 0]
+
+    def _monthly(self, keys, first_touched):
+        """Calendar-month Gini for months at or after the first touched day"""
+        dates = self.dates
+        months = dates.to_period("M")
+        starts = np.flatnonzero(np.r_[True, months[1:] != months[:-1]])
+        ends = np.r_[starts[1:] - 1, len(dates) - 1]
+        touched = ends >= first_touched
+        starts, ends = starts[touched], ends[touched]
+
+        values = np.add.reduceat(
+            self.values[:, starts[0] :], starts - starts[0], axis=1
+        )
+        records = np.add.reduceat(
+            self.records[:, starts[0] :], starts - starts[0], axis=1
+        )
+        month_ends = months[ends].to_timestamp(how="end").normalize()
+        return self._gini_table(keys, values, records > 0, "month", month_ends)
+
+    def _rolling(self, keys, window, first_touched):
+        """Trailing-window Gini at step-aligned ends touched by new days"""
+        dates = self.dates
+        day_numbers = dates.to_numpy().astype("datetime64[D]").astype(np.int64)
+        end_cols = np.flatnonzero(
+            (day_numbers % self.step == 0)
+            & (np.arange(len(dates)) >= window - 1)
+            & (np.arange(len(dates)) >= first_touched)
+        )
+        if len(end_cols) == 0:
+            return None
+
+        zeros = np.zeros((len(self.pincodes), 1))
+        value_cs = np.hstack([zeros, np.cumsum(self.values, axis=1)])
+        record_cs = np.hstack([zeros, np.cumsum(self.records, axis=1)])
+        values = value_cs[:, end_cols + 1] - value_cs[:, end_cols + 1 - window]
+        records = record_cs[:, end_cols + 1] - record_cs[:, end_cols + 1 - window]
+        return self._gini_table(
+            keys, values, records > 0, f"rolling_{window}d", dates[end_cols]
+        )
+
+    def trend(self, level, period="month"):
+        """Trend rows of one level and period type"""
+        trends = self.trends[level]
+        return trends[trends["period"] == period].reset_index(drop=True)
+
+    def write_outputs(self, path=REPORT_PATH):
+        """Write state_gini_trends.csv and district_gini_trends.csv"""
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        for level in LEVELS:
+            self.trends[level].to_csv(path / f"{level}_gini_trends.csv", index=False)
+
+    def save(self, path=ENGINE_FILE):
+        """Persist the engine state for the next incremental refresh"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            pickle.dump(self, f)
+
+    @staticmethod
+    def load(path=ENGINE_FILE):
+        """Load a previously saved engine"""
+        with open(path, "rb") as f:
+            return pickle.load(f)
+
+
+def main():
+    """Refresh monthly and rolling Gini trends from new enrolment shards"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--rebuild", action="store_true")
+    parser.add_argument("--step", type=int, default=DEFAULT_STEP)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.rebuild or not ENGINE_FILE.exists():
+        engine = GiniTrendEngine(step=args.step)
+    else:
+        engine = GiniTrendEngine.load(ENGINE_FILE)
+
+    new_shards = [s for s in list_shards("enrolment") if s.name not in engine.shards]
+    if not new_shards:
+        print("✓ Gini trends are up to date")
+        return
+
+    chunks = [chunk for _, chunk in iter_chunks("enrolment", shards=new_shards)]
+    engine.update(daily_aggregates(pd.concat(chunks, ignore_index=True)))
+    engine.shards.update(s.name for s in new_shards)
+
+    engine.save(ENGINE_FILE)
+    engine.write_outputs(REPORT_PATH)
+    print(
+        f"✓ Refreshed Gini trends for {len(engine.pincodes):,} pincodes x "
+        f"{engine.values.shape[1]} days in {time.perf_counter() - start:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
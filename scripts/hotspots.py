@@ -0,0 +1,253 @@
+"""
+UIDAI Aadhaar Data Analytics - Spatial Hotspots
+================================================
+Global Moran's I and local Moran (LISA) clusters of pincode activity on a
+sparse distance-band weight matrix, so the geospatial equity findings
+rest on spatial statistics rather than on state and district averages.
+
+- Weights: pincodes within RADIUS_KM of each other (KD-tree pairs from
+  spatial.py) are neighbours; the CSR matrix is row-standardized.
+  Pincodes without neighbours (islands) are left out of the inference
+- Variables (log1p of pincode totals): enrolments, where Low-Low
+  clusters are enrolment cold spots, and update load (demographic +
+  biometric updates), where High-High clusters mark high need
+- Spatial lags are one sparse matrix-vector product. Inference is by
+  permutation: the global statistic permutes all values, LISA uses
+  conditional permutations (each pincode's neighbour values redrawn from
+  the other pincodes, with replacement). Permutations are drawn in
+  batches as index arrays over the CSR layout and batches run on a
+  process pool
+
+Outputs (outputs/reports/):
+
+- pincode_lisa.csv: local statistic, pseudo p-value and cluster
+  (High-High, Low-Low, High-Low, Low-High, Not significant, Island) per
+  pincode and variable
+- district_hotspots.csv: per district, pincodes in enrolment cold spots
+  and high-need clusters, to read alongside district_clusters.csv
+
+The pincode centroid table is the one spatial.py uses.
+
+Usage:
+    python scripts/hotspots.py [--radius-km 10] [--permutations 999]
+
+Author: Data Science Team
+Date: October 2026
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy.sparse import csr_matrix
+
+from ingest import DATASETS, pincode_totals
+from spatial import CENTROIDS_FILE, PincodeIndex, load_pincode_centroids
+
+# Configuration
+BASE_PATH = Path(__file__).parent.parent
+REPORT_PATH = BASE_PATH / "outputs" / "reports"
+LISA_FILE = REPORT_PATH / "pincode_lisa.csv"
+DISTRICT_HOTSPOTS_FILE = REPORT_PATH / "district_hotspots.csv"
+
+RADIUS_KM = 10
+PERMUTATIONS = 999
+SIGNIFICANCE = 0.05
+BATCH_ELEMENTS = 4_000_000
+DEFAULT_SEED = 42
+
+# Variable -> (datasets summed, cluster that marks underservice)
+VARIABLES = {
+    "enrollments": (["enrolment"], "Low-Low"),
+    "update_load": (["demographic", "biometric"], "High-High"),
+}
+QUADRANTS = np.array(["Low-Low", "Low-High", "High-Low", "High-High"])
+
+# Weights and standardized values shared with pool workers
+_LISA_DATA = None
+
+
+def distance_band_weights(index, radius_km=RADIUS_KM):
+    """Row-standardized CSR weights of pincodes within radius_km"""
+    i, j, _ = index.pairs_within(radius_km)
+    n = len(index)
+    rows, cols = np.r_[i, j], np.r_[j, i]
+    neighbours = np.bincount(rows, minlength=n)
+    values = 1.0 / neighbours[rows]
+    return csr_matrix((values, (rows, cols)), shape=(n, n))
+
+
+def indexed_pincode_totals(index):
+    """Pincode totals per dataset and the pincode's state / district"""
+    totals = pd.DataFrame(0.0, index=index.centroids["pincode"], columns=list(DATASETS))
+    places = []
+    for dataset, config in DATASETS.items():
+        sums = pincode_totals(dataset)
+        totals[dataset] = (
+            sums.groupby("pincode")[config["total_col"]]
+            .sum()
+            .reindex(totals.index, fill_value=0)
+        )
+        places.append(sums[["pincode", "state", "district"]])
+    places = pd.concat(places).drop_duplicates("pincode").set_index("pincode")
+    return totals.join(places)
+
+
+def standardize(values):
+    """z-scores (all zero for a constant variable)"""
+    std = values.std()
+    return (values - values.mean()) / std if std > 0 else np.zeros_like(values)
+
+
+def morans_i(weights, z):
+    """Global Moran's I for one or more standardized columns"""
+    lag = weights @ z
+    scale = weights.shape[0] / weights.sum()
+    return scale * (z * lag).sum(axis=0) / (z**2).sum(axis=0)
+
+
+def _init_worker(data):
+    global _LISA_DATA
+    _LISA_DATA = data
+
+
+def _permutation_batch(n_permutations, seed):
+    """Global statistics and local exceedance counts for one batch"""
+    weights, z, local = _LISA_DATA
+    rng = np.random.default_rng(seed)
+    n = len(z)
+    neighbours = np.diff(weights.indptr)
+    rows = np.repeat(np.arange(n), neighbours)
+    has_neighbours = neighbours > 0
+
+    shuffled = rng.permuted(np.tile(z, (n_permutations, 1)), axis=1)
+    global_stats = morans_i(weights, shuffled.T)
+
+    # Conditional permutation: neighbour values drawn from the other pincodes
+    draws = rng.integers(0, n - 1, (n_permutations, len(rows)))
+    draws += draws >= rows
+    lag = np.zeros((n_permutations, n))
+    lag[:, has_neighbours] = np.add.reduceat(
+        weights.data * z[draws], weights.indptr[:-1][has_neighbours], axis=1
+    )
+    larger = (z * lag >= local).sum(axis=0)
+    return global_stats, larger
+
+
+def lisa(weights, values, permutations=PERMUTATIONS, workers=None, seed=DEFAULT_SEED):
+    """Global Moran's I with its pseudo p-value and local statistics"""
+    z = standardize(np.asarray(values, dtype=float))
+    lag = weights @ z
+    local = z * lag
+    observed = morans_i(weights, z)
+
+    per_task = max(1, min(permutations, BATCH_ELEMENTS // max(weights.nnz, 1)))
+    sizes = [
+        min(per_task, permutations - start)
+        for start in range(0, permutations, per_task)
+    ]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    with ProcessPoolExecutor(
+        max_workers=workers or os.cpu_count(),
+        initializer=_init_worker,
+        initargs=((weights, z, local),),
+    ) as pool:
+        results = list(pool.map(_permutation_batch, sizes, seeds))
+    global_stats = np.concatenate([result[0] for result in results])
+    larger = np.sum([result[1] for result in results], axis=0)
+
+    # Pseudo p-values from the tail the observed value lies in
+    global_larger = (global_stats >= observed).sum()
+    global_larger = min(global_larger, permutations - global_larger)
+    larger = np.minimum(larger, permutations - larger)
+    island = np.diff(weights.indptr) == 0
+    p_values = np.where(island, np.nan, (larger + 1) / (permutations + 1))
+
+    quadrant = QUADRANTS[2 * (z > 0) + (lag > 0)]
+    cluster = np.where(p_values <= SIGNIFICANCE, quadrant, "Not significant")
+    cluster = np.where(island, "Island", cluster)
+    return {
+        "morans_i": observed,
+        "morans_p": (global_larger + 1) / (permutations + 1),
+        "expected_i": -1 / (len(z) - 1),
+        "local_i": local,
+        "p_value": p_values,
+        "cluster": cluster,
+    }
+
+
+def district_hotspots(table):
+    """Pincodes per district in the underserved cluster of each variable"""
+    flags = {
+        f"{variable}_{target.lower().replace('-', '_')}": (
+            table[f"cluster_{variable}"] == target
+        )
+        for variable, (_, target) in VARIABLES.items()
+    }
+    flags["low_enrolment_high_need"] = np.logical_and.reduce(list(flags.values()))
+    summary = (
+        table.assign(**flags)
+        .groupby(["state", "district"])
+        .agg(pincodes=("pincode", "size"), **{name: (name, "sum") for name in flags})
+    )
+    cold_spots = next(iter(flags))
+    summary["cold_spot_share"] = (summary[cold_spots] / summary["pincodes"]).round(3)
+    return summary.sort_values(
+        ["low_enrolment_high_need", "cold_spot_share"], ascending=False
+    ).reset_index()
+
+
+def main():
+    """Compute Moran's I and LISA clusters of pincode activity"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--centroids", default=CENTROIDS_FILE)
+    parser.add_argument("--radius-km", type=float, default=RADIUS_KM)
+    parser.add_argument("--permutations", type=int, default=PERMUTATIONS)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index = PincodeIndex(load_pincode_centroids(args.centroids))
+    weights = distance_band_weights(index, args.radius_km)
+    totals = indexed_pincode_totals(index)
+
+    table = index.centroids[["pincode", "latitude", "longitude"]].join(
+        totals[["state", "district"]], on="pincode"
+    )
+    print(
+        f"✓ {len(index):,} pincodes, {weights.nnz:,} neighbour links within "
+        f"{args.radius_km:g} km"
+    )
+    print(f"\n📊 GLOBAL MORAN'S I ({args.permutations} permutations):")
+    for variable, (datasets, _) in VARIABLES.items():
+        values = np.log1p(totals[datasets].sum(axis=1).to_numpy())
+        result = lisa(weights, values, args.permutations, args.workers, args.seed)
+        table[variable] = np.expm1(values)
+        table[f"local_i_{variable}"] = result["local_i"].round(4)
+        table[f"p_{variable}"] = result["p_value"]
+        table[f"cluster_{variable}"] = result["cluster"]
+        print(
+            f"   {variable:<12} I = {result['morans_i']:.3f} "
+            f"(E[I] = {result['expected_i']:.4f}, p = {result['morans_p']:.3f})"
+        )
+
+    REPORT_PATH.mkdir(parents=True, exist_ok=True)
+    table.to_csv(LISA_FILE, index=False)
+    hotspots = district_hotspots(table.dropna(subset=["district"]))
+    hotspots.to_csv(DISTRICT_HOTSPOTS_FILE, index=False)
+
+    counts = table["cluster_enrollments"].value_counts()
+    print(
+        f"\n   Enrolment cold-spot pincodes: {counts.get('Low-Low', 0):,} across "
+        f"{(hotspots['enrollments_low_low'] > 0).sum():,} districts"
+    )
+    print(f"✓ Done in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
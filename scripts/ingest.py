@@ -0,0 +1,166 @@
+"""
+UIDAI Aadhaar Data Analytics - Shard Ingestion
+===============================================
+Streams the raw API export shards chunk by chunk so that downstream
+summaries (sketches, aggregates, indexes) are built in a single pass
+without holding every shard in memory at once.
+
+Author: Data Science Team
+Date: October 2026
+"""
+
+from pathlib import Path
+
+import pandas as pd
+
+# Configuration
+BASE_PATH = Path(__file__).parent.parent
+RAW_PATH = BASE_PATH / "data" / "raw"
+
+DEFAULT_CHUNKSIZE = 250_000
+
+DATASETS = {
+    "enrolment": {
+        "count_cols": ["age_0_5", "age_5_17", "age_18_greater"],
+        "total_col": "total_enrollments",
+        "activity_col": "enrollments",
+    },
+    "demographic": {
+        "count_cols": ["demo_age_5_17", "demo_age_17_"],
+        "total_col": "total_demo_updates",
+        "activity_col": "demographic_updates",
+    },
+    "biometric": {
+        "count_cols": ["bio_age_5_17", "bio_age_17_"],
+        "total_col": "total_bio_updates",
+        "activity_col": "biometric_updates",
+    },
+}
+
+
+def list_shards(dataset):
+    """List the raw CSV shards of a dataset in a stable order"""
+    if dataset not in DATASETS:
+        raise ValueError(f"Unknown dataset '{dataset}'")
+    return sorted((RAW_PATH / dataset).glob("*.csv"))
+
+
+def prepare_chunk(df, dataset):
+    """Normalize one raw chunk: dates, names, pincodes and totals"""
+    config = DATASETS[dataset]
+    df["date"] = pd.to_datetime(df["date"], dayfirst=True, errors="coerce")
+    for col in ["state", "district"]:
+        df[col] = df[col].astype(str).str.strip()
+    df["pincode"] = df["pincode"].astype(str).str.zfill(6)
+    df[config["count_cols"]] = df[config["count_cols"]].fillna(0)
+    df[config["total_col"]] = df[config["count_cols"]].sum(axis=1)
+    return df
+
+
+def pincode_month_aggregates(df, dataset):
+    """Collapse a prepared chunk to pincode x month activity totals"""
+    config = DATASETS[dataset]
+    return (
+        df.assign(month=df["date"].dt.to_period("M"))
+        .groupby(["state", "district", "pincode", "month"], as_index=False)[
+            config["total_col"]
+        ]
+        .sum()
+        .rename(columns={config["total_col"]: config["activity_col"]})
+    )
+
+
+def pincode_totals(dataset, shards=None):
+    """Total activity per state, district and pincode over every shard"""
+    keys = ["state", "district", "pincode"]
+    total_col = DATASETS[dataset]["total_col"]
+    frames = [
+        chunk.groupby(keys, as_index=False)[total_col].sum()
+        for _, chunk in iter_chunks(dataset, shards=shards)
+    ]
+    if not frames:
+        return pd.DataFrame(columns=[*keys, total_col]).astype({total_col: float})
+    return (
+        pd.concat(frames, ignore_index=True)
+        .groupby(keys, as_index=False)[total_col]
+        .sum()
+    )
+
+
+def iter_chunks(
+    dataset, shards=None, chunksize=DEFAULT_CHUNKSIZE, dedup=True, geography=None
+):
+    """Yield (shard_name, chunk) pairs for every shard of a dataset
+
+    Rows already delivered by another shard or earlier in the same shard
+    are dropped using the dataset's persistent fingerprint store (see
+    dedup.py); pass ``dedup=False`` to read the shards as delivered, or a
+    ``FingerprintStore`` to use a specific store. With a ``geography``
+    dimension (see geography.py), names are canonicalized, integer ids
+    added and invalid keys quarantined.
+    """
+    shards = list_shards(dataset) if shards is None else shards
+    dedup = dedup_store(dataset, dedup, shards)
+    if dedup is not None and dedup.dataset != dataset:
+        raise ValueError(f"Fingerprint store is for '{dedup.dataset}', not '{dataset}'")
+    for shard in shards:
+        offset = 0
+        for chunk in pd.read_csv(shard, chunksize=chunksize, dtype={"pincode": str}):
+            chunk = prepare_chunk(chunk, dataset)
+            if dedup is not None:
+                keep = dedup.filter(chunk, Path(shard).name, offset)
+                offset += len(chunk)
+                chunk = chunk[keep]
+            if geography is not None:
+                chunk = geography.encode(chunk)
+            yield Path(shard).name, chunk
+    if dedup is not None:
+        dedup.flush()
+
+
+def dedup_store(dataset, dedup=True, shards=None):
+    """Fingerprint store for a ``dedup`` argument (None when disabled)
+
+    ``True`` is the dataset's persistent store with every shard recorded,
+    so reading only looks fingerprints up (safe from parallel workers).
+    """
+    if dedup is None or dedup is False:
+        return None
+    if dedup is not True:
+        return dedup
+    # dedup.py builds on this module, so it is imported on first use
+    from dedup import indexed_store
+
+    return indexed_store(dataset, shards)
+
+
+def ingest(
+    dataset,
+    consumers,
+    shards=None,
+    chunksize=DEFAULT_CHUNKSIZE,
+    verbose=True,
+    dedup=True,
+    geography=None,
+):
+    """Feed every chunk of a dataset to each consumer's ``update`` method"""
+    shards = list_shards(dataset) if shards is None else shards
+    dedup = dedup_store(dataset, dedup, shards)
+    rows = 0
+    for _, chunk in iter_chunks(
+        dataset, shards=shards, chunksize=chunksize, dedup=dedup, geography=geography
+    ):
+        for consumer in consumers:
+            consumer.update(chunk)
+        rows += len(chunk)
+
+    if verbose:
+        dropped = (
+            f", {sum(dedup.dropped.values()):,} duplicates dropped"
+            if dedup is not None
+            else ""
+        )
+        print(
+            f"✓ Ingested {rows:,} {dataset} records from {len(shards)} shard(s){dropped}"
+        )
+    return rows
@@ -0,0 +1,261 @@
+"""
+UIDAI Aadhaar Data Analytics - Mobile Enrolment Unit Planner
+=============================================================
+Places mobile enrolment units over the priority intervention districts
+and builds a visit schedule for every unit.
+
+Stages (each one is timed):
+1. Demand     - pincode demand in priority districts: the district
+                priority score, scaled up by the pincode's enrolment
+                shortfall against its district median
+2. Coverage   - KD-tree radius queries: demand reachable from each
+                candidate site within the service radius
+3. Placement  - lazy-greedy maximum-coverage facility location
+4. Assignment - every demand pincode to its nearest unit (KD-tree)
+5. Schedule   - nearest-neighbour visiting order split into day routes
+
+Usage:
+    python scripts/mobile_units.py --units 75 --radius-km 25
+
+Author: Data Science Team
+Date: October 2026
+"""
+
+import argparse
+import heapq
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy.spatial import cKDTree
+
+from ingest import DATASETS, pincode_totals
+from spatial import (
+    CENTROIDS_FILE,
+    PincodeIndex,
+    chord_to_km,
+    km_to_chord,
+    load_pincode_centroids,
+)
+
+# Configuration
+BASE_PATH = Path(__file__).parent.parent
+OUTPUT_PATH = BASE_PATH / "outputs"
+REPORT_PATH = OUTPUT_PATH / "reports"
+PRIORITY_FILE = REPORT_PATH / "priority_intervention_districts.csv"
+
+DEFAULT_UNITS = 75
+DEFAULT_RADIUS_KM = 25
+DEFAULT_STOPS_PER_DAY = 3
+
+PLACEMENT_COLUMNS = [
+    "unit_id",
+    "pincode",
+    "state",
+    "district",
+    "pincodes_assigned",
+    "demand_assigned",
+    "max_distance_km",
+    "schedule_days",
+]
+SCHEDULE_COLUMNS = [
+    "unit_id",
+    "day",
+    "stop",
+    "pincode",
+    "state",
+    "district",
+    "leg_km",
+    "demand",
+]
+
+
+class StageTimer:
+    """Collects wall-clock time per named pipeline stage"""
+
+    def __init__(self):
+        self.timings = {}
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        yield
+        self.timings[name] = time.perf_counter() - start
+        print(f"✓ {name}: {self.timings[name]:.2f}s")
+
+
+def pincode_demand(totals, priority, dataset="enrolment"):
+    """Demand weight for every pincode of the priority districts"""
+    total_col = DATASETS[dataset]["total_col"]
+    demand = totals.merge(
+        priority[["state", "district", "priority_score"]], on=["state", "district"]
+    )
+    median = demand.groupby(["state", "district"])[total_col].transform("median")
+    shortfall = (1 - demand[total_col] / median).clip(lower=0).fillna(1)
+    demand["demand"] = demand["priority_score"] * (1 + shortfall)
+    return demand
+
+
+def greedy_max_coverage(cover, weights, n_units):
+    """Lazy-greedy site selection maximizing covered demand weight"""
+    covered = np.zeros(len(weights), dtype=bool)
+    heap = [(-weights[members].sum(), site) for site, members in enumerate(cover)]
+    heapq.heapify(heap)
+
+    sites = []
+    while heap and len(sites) < n_units:
+        _, site = heapq.heappop(heap)
+        members = np.asarray(cover[site], dtype=int)
+        gain = weights[members][~covered[members]].sum()
+        if heap and gain < -heap[0][0]:
+            heapq.heappush(heap, (-gain, site))
+            continue
+        if gain <= 0:
+            break
+        sites.append(site)
+        covered[members] = True
+    return np.array(sites, dtype=int), covered
+
+
+def nearest_neighbour_route(points, start):
+    """Visiting order over points, always moving to the closest unvisited"""
+    remaining = np.ones(len(points), dtype=bool)
+    order = []
+    current = start
+    for _ in range(len(points)):
+        dist = np.where(remaining, np.linalg.norm(points - current, axis=1), np.inf)
+        nxt = int(np.argmin(dist))
+        order.append(nxt)
+        remaining[nxt] = False
+        current = points[nxt]
+    return np.array(order, dtype=int)
+
+
+def visit_schedule(demand, points, sites, assignment, stops_per_day):
+    """Day-by-day stop list for every unit"""
+    rows = []
+    for unit, site in enumerate(sites):
+        members = np.flatnonzero(assignment == unit)
+        route = members[nearest_neighbour_route(points[members], points[site])]
+        previous = points[site]
+        for stop, member in enumerate(route):
+            rows.append(
+                {
+                    "unit_id": unit + 1,
+                    "day": stop // stops_per_day + 1,
+                    "stop": stop % stops_per_day + 1,
+                    "pincode": demand.at[member, "pincode"],
+                    "state": demand.at[member, "state"],
+                    "district": demand.at[member, "district"],
+                    "leg_km": round(
+                        float(chord_to_km(np.linalg.norm(points[member] - previous))),
+                        2,
+                    ),
+                    "demand": demand.at[member, "demand"],
+                }
+            )
+            previous = points[member]
+    return pd.DataFrame(rows)
+
+
+def empty_plan(message):
+    """Placements and schedule without any unit"""
+    print(message)
+    return pd.DataFrame(columns=PLACEMENT_COLUMNS), pd.DataFrame(
+        columns=SCHEDULE_COLUMNS
+    )
+
+
+def plan_mobile_units(
+    demand,
+    index,
+    n_units=DEFAULT_UNITS,
+    radius_km=DEFAULT_RADIUS_KM,
+    stops_per_day=DEFAULT_STOPS_PER_DAY,
+    timer=None,
+):
+    """Place units over located demand pincodes and schedule their visits"""
+    timer = timer or StageTimer()
+
+    positions = index.locate(demand["pincode"])
+    if (positions < 0).any():
+        print(f"⚠️ {(positions < 0).sum():,} demand pincodes have no centroid")
+    demand = demand[positions >= 0].reset_index(drop=True)
+    points = index.points[positions[positions >= 0]]
+    weights = demand["demand"].to_numpy(dtype=float)
+    if not (weights > 0).any():
+        return empty_plan("⚠️ No located pincodes with demand, no units placed")
+
+    with timer.stage("Coverage"):
+        cover = cKDTree(points).query_ball_point(
+            points, r=float(km_to_chord(radius_km))
+        )
+
+    with timer.stage("Placement"):
+        sites, covered = greedy_max_coverage(cover, weights, n_units)
+    if len(sites) == 0:
+        return empty_plan(f"⚠️ No candidate sites for {n_units} unit(s), none placed")
+
+    with timer.stage("Assignment"):
+        chord, assignment = cKDTree(points[sites]).query(points)
+        distance_km = chord_to_km(chord)
+
+    with timer.stage("Schedule"):
+        schedule = visit_schedule(demand, points, sites, assignment, stops_per_day)
+
+    placements = demand.loc[sites, ["pincode", "state", "district"]].reset_index(
+        drop=True
+    )
+    placements.insert(0, "unit_id", np.arange(1, len(sites) + 1))
+    counts = np.bincount(assignment, minlength=len(sites))
+    placements["pincodes_assigned"] = counts
+    placements["demand_assigned"] = np.bincount(
+        assignment, weights=weights, minlength=len(sites)
+    )
+    placements["max_distance_km"] = [
+        distance_km[assignment == unit].max() if counts[unit] else 0.0
+        for unit in range(len(sites))
+    ]
+    placements["schedule_days"] = np.ceil(counts / stops_per_day).astype(int)
+
+    coverage = weights[covered].sum() / weights.sum() if len(weights) else 0.0
+    print(
+        f"✓ Placed {len(sites)} units covering {coverage:.1%} of demand "
+        f"within {radius_km} km"
+    )
+    return placements, schedule
+
+
+def main():
+    """Plan mobile unit placements and schedules for the priority districts"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--units", type=int, default=DEFAULT_UNITS)
+    parser.add_argument("--radius-km", type=float, default=DEFAULT_RADIUS_KM)
+    parser.add_argument("--stops-per-day", type=int, default=DEFAULT_STOPS_PER_DAY)
+    parser.add_argument("--centroids", default=CENTROIDS_FILE)
+    parser.add_argument("--priority", default=PRIORITY_FILE)
+    args = parser.parse_args()
+
+    timer = StageTimer()
+    with timer.stage("Demand"):
+        priority = pd.read_csv(args.priority)
+        demand = pincode_demand(pincode_totals("enrolment"), priority)
+        index = PincodeIndex(load_pincode_centroids(args.centroids))
+
+    placements, schedule = plan_mobile_units(
+        demand, index, args.units, args.radius_km, args.stops_per_day, timer
+    )
+
+    placements.to_csv(REPORT_PATH / "mobile_unit_placements.csv", index=False)
+    schedule.to_csv(REPORT_PATH / "mobile_unit_schedule.csv", index=False)
+
+    print("\n⏱️ STAGE TIMINGS:")
+    for stage, seconds in timer.timings.items():
+        print(f"   {stage:<12} {seconds:>8.2f}s")
+    print(f"   {'Total':<12} {sum(timer.timings.values()):>8.2f}s")
+
+
+if __name__ == "__main__":
+    main()
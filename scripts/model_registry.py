@@ -0,0 +1,343 @@
+"""
+UIDAI Aadhaar Data Analytics - Model Registry
+==============================================
+Versioned model artifacts under outputs/models/registry/, replacing the
+loose ``gb_model.pkl`` / ``scaler.pkl`` pickles.
+
+Each version directory holds:
+
+- model.joblib: the estimator. With the default ``mmap`` storage its
+  numpy arrays are written uncompressed and memory-mapped read-only on
+  load, so worker processes share one copy through the page cache;
+  ``compressed`` storage trades load time for disk space. Only arrays
+  held as plain attributes are mapped: histogram boosting keeps its
+  nodes and bin thresholds that way, but the Cython ``Tree`` of
+  DecisionTree / RandomForest / GradientBoosting models copies its node
+  arrays when unpickled, so those load into every process. Registering
+  records the mapped bytes (``mmap_bytes``) next to the file size
+- encoders.joblib: whatever is needed to rebuild features (label
+  encoders, scalers, the geography dimension)
+- metadata.json: feature schema, parameters, metrics, the fingerprint of
+  the training data and storage details
+
+manifest.json indexes every version and the pinned aliases (e.g.
+``production``). Registering a version prunes old ones: the newest
+KEEP_VERSIONS per model are kept, plus any pinned version.
+
+Usage:
+    python scripts/model_registry.py list
+    python scripts/model_registry.py pin demand_hgb 3
+    python scripts/model_registry.py prune demand_hgb --keep 3
+    python scripts/model_registry.py import notebook_gb outputs/models/gb_model.pkl \
+        --scaler outputs/models/scaler.pkl
+
+Author: Data Science Team
+Date: October 2026
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import pickle
+import shutil
+from datetime import datetime
+from functools import cached_property
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pandas as pd
+
+# Configuration
+BASE_PATH = Path(__file__).parent.parent
+MODEL_PATH = BASE_PATH / "outputs" / "models"
+REGISTRY_PATH = MODEL_PATH / "registry"
+
+STORAGE = {"mmap": 0, "compressed": ("zlib", 3)}
+KEEP_VERSIONS = 5
+DEFAULT_ALIAS = "production"
+
+
+def data_fingerprint(df):
+    """Short content hash of a training frame (row order matters)"""
+    hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    return hashlib.sha256(hashes.tobytes()).hexdigest()[:16]
+
+
+def mapped_bytes(obj):
+    """Bytes of the arrays reachable from ``obj`` that are memory-mapped"""
+    seen, stack, total = set(), [obj], 0
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        if isinstance(item, np.memmap):
+            total += item.nbytes
+        elif isinstance(item, np.ndarray):
+            if item.dtype == object:
+                stack.extend(item.ravel())
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+        elif hasattr(item, "__dict__"):
+            stack.extend(vars(item).values())
+    return total
+
+
+class ModelArtifact:
+    """One registered model version; model and encoders load on first use"""
+
+    def __init__(self, path, metadata):
+        self.path = Path(path)
+        self.metadata = metadata
+
+    def __repr__(self):
+        return f"ModelArtifact({self.name!r}, version={self.version})"
+
+    @property
+    def name(self):
+        return self.metadata["name"]
+
+    @property
+    def version(self):
+        return self.metadata["version"]
+
+    @property
+    def features(self):
+        return self.metadata["features"]
+
+    @property
+    def metrics(self):
+        return self.metadata.get("metrics", {})
+
+    @cached_property
+    def model(self):
+        mmap_mode = "r" if self.metadata["storage"] == "mmap" else None
+        return joblib.load(self.path / "model.joblib", mmap_mode=mmap_mode)
+
+    @cached_property
+    def encoders(self):
+        encoders_file = self.path / "encoders.joblib"
+        return joblib.load(encoders_file) if encoders_file.exists() else {}
+
+    def predict(self, df):
+        """Predict from a frame holding the schema's feature columns"""
+        missing = set(self.features) - set(df.columns)
+        if missing:
+            raise ValueError(f"Missing feature columns: {sorted(missing)}")
+        X = df[self.features]
+        if not hasattr(self.model, "feature_names_in_"):
+            X = X.to_numpy()
+        return self.model.predict(X)
+
+
+class ModelRegistry:
+    """Directory of versioned model artifacts with a JSON manifest"""
+
+    def __init__(self, path=REGISTRY_PATH, keep=KEEP_VERSIONS):
+        self.path = Path(path)
+        self.keep = keep
+        self.manifest_file = self.path / "manifest.json"
+        if self.manifest_file.exists():
+            with open(self.manifest_file) as f:
+                self.manifest = json.load(f)
+        else:
+            self.manifest = {"models": {}}
+        self.loaded = {}
+
+    def _entry(self, name):
+        if name not in self.manifest["models"]:
+            raise KeyError(f"No model named '{name}' in the registry")
+        return self.manifest["models"][name]
+
+    def _write_manifest(self):
+        # Write then rename so concurrent readers never see a partial file
+        self.path.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.manifest_file.with_suffix(".tmp")
+        with open(tmp_file, "w") as f:
+            json.dump(self.manifest, f, indent=2)
+        os.replace(tmp_file, self.manifest_file)
+
+    def register(self, name, model, metadata, encoders=None, data=None, storage="mmap"):
+        """Store a new version of a model and prune old ones; returns it"""
+        if "features" not in metadata:
+            raise ValueError("Model metadata must list its features")
+        if storage not in STORAGE:
+            raise ValueError(f"Unknown storage {storage!r}, expected {list(STORAGE)}")
+
+        entry = self.manifest["models"].setdefault(name, {"versions": [], "pins": {}})
+        version = max((v["version"] for v in entry["versions"]), default=0) + 1
+        path = self.path / name / f"v{version:04d}"
+        path.mkdir(parents=True, exist_ok=True)
+
+        joblib.dump(model, path / "model.joblib", compress=STORAGE[storage])
+        if encoders:
+            joblib.dump(encoders, path / "encoders.joblib", compress=("zlib", 3))
+        metadata = {
+            **metadata,
+            "name": name,
+            "version": version,
+            "storage": storage,
+            "model_class": type(model).__name__,
+            "registered_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        if data is not None:
+            metadata["data_fingerprint"] = data_fingerprint(data)
+            metadata["data_rows"] = len(data)
+        metadata["size_bytes"] = sum(f.stat().st_size for f in path.iterdir())
+        if storage == "mmap":
+            metadata["mmap_bytes"] = mapped_bytes(
+                joblib.load(path / "model.joblib", mmap_mode="r")
+            )
+        with open(path / "metadata.json", "w") as f:
+            json.dump(metadata, f, indent=2)
+
+        entry["versions"].append(
+            {
+                key: metadata.get(key)
+                for key in [
+                    "version",
+                    "registered_at",
+                    "model_class",
+                    "metrics",
+                    "data_fingerprint",
+                    "size_bytes",
+                    "mmap_bytes",
+                ]
+            }
+        )
+        self.prune(name)
+        return ModelArtifact(path, metadata)
+
+    def resolve(self, name, version="latest"):
+        """Version number for an int, 'latest' or a pinned alias"""
+        entry = self._entry(name)
+        if version == "latest":
+            return entry["versions"][-1]["version"]
+        if version in entry["pins"]:
+            return entry["pins"][version]
+        version = int(version)
+        if version not in [v["version"] for v in entry["versions"]]:
+            raise KeyError(f"Model '{name}' has no version {version}")
+        return version
+
+    def load(self, name, version="latest"):
+        """Artifact for a version; repeated loads return the same object"""
+        version = self.resolve(name, version)
+        if (name, version) not in self.loaded:
+            path = self.path / name / f"v{version:04d}"
+            with open(path / "metadata.json") as f:
+                self.loaded[(name, version)] = ModelArtifact(path, json.load(f))
+        return self.loaded[(name, version)]
+
+    def pin(self, name, version, alias=DEFAULT_ALIAS):
+        """Point an alias at a version; pinned versions are never pruned"""
+        self._entry(name)["pins"][alias] = self.resolve(name, version)
+        self._write_manifest()
+
+    def prune(self, name, keep=None):
+        """Delete all but the newest ``keep`` versions and pinned ones"""
+        entry = self._entry(name)
+        keep = self.keep if keep is None else keep
+        if keep < 1:
+            raise ValueError(
+                f"keep must be at least 1 (the latest version), not {keep}"
+            )
+        pinned = set(entry["pins"].values())
+        newest = {v["version"] for v in entry["versions"][-keep:]}
+
+        removed = []
+        for v in entry["versions"]:
+            if v["version"] not in newest | pinned:
+                shutil.rmtree(self.path / name / f"v{v['version']:04d}", True)
+                self.loaded.pop((name, v["version"]), None)
+                removed.append(v["version"])
+        entry["versions"] = [
+            v for v in entry["versions"] if v["version"] not in removed
+        ]
+        self._write_manifest()
+        return removed
+
+    def versions(self, name=None):
+        """Table of registered versions, optionally for one model"""
+        rows = [
+            {
+                "name": model,
+                **{k: v for k, v in version.items() if k != "metrics"},
+                **(version.get("metrics") or {}),
+                "pins": ", ".join(
+                    alias
+                    for alias, pinned in entry["pins"].items()
+                    if pinned == version["version"]
+                ),
+            }
+            for model, entry in self.manifest["models"].items()
+            if name in (None, model)
+            for version in entry["versions"]
+        ]
+        return pd.DataFrame(rows)
+
+
+def main():
+    """List, pin, prune or import registry models"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list")
+    pin = commands.add_parser("pin")
+    pin.add_argument("name")
+    pin.add_argument("version")
+    pin.add_argument("--alias", default=DEFAULT_ALIAS)
+    prune = commands.add_parser("prune")
+    prune.add_argument("name")
+    prune.add_argument("--keep", type=int, default=KEEP_VERSIONS)
+    legacy = commands.add_parser("import", help="Register a legacy pickle")
+    legacy.add_argument("name")
+    legacy.add_argument("pickle", type=Path)
+    legacy.add_argument("--encoders", type=Path, help="Pickled feature encoders")
+    legacy.add_argument("--scaler", type=Path, help="Pickled feature scaler")
+    legacy.add_argument("--storage", choices=list(STORAGE), default="mmap")
+    args = parser.parse_args()
+
+    registry = ModelRegistry()
+    if args.command == "list":
+        versions = registry.versions()
+        print(versions.to_string(index=False) if len(versions) else "No models")
+    elif args.command == "pin":
+        registry.pin(args.name, args.version, args.alias)
+        print(
+            f"✓ {args.name}@{args.alias} -> v{registry.resolve(args.name, args.alias)}"
+        )
+    elif args.command == "prune":
+        removed = registry.prune(args.name, args.keep)
+        print(f"✓ Removed {len(removed)} version(s) of {args.name}")
+    else:
+        loaded = {}
+        for key in ["pickle", "encoders", "scaler"]:
+            if getattr(args, key) is not None:
+                with open(getattr(args, key), "rb") as f:
+                    loaded[key] = pickle.load(f)
+        model = loaded.pop("pickle")
+        features = list(getattr(model, "feature_names_in_", []))
+        artifact = registry.register(
+            args.name,
+            model,
+            {"features": features, "source": str(args.pickle)},
+            encoders=loaded,
+            storage=args.storage,
+        )
+        print(
+            f"✓ Registered {args.pickle.name} as {args.name} v{artifact.version} "
+            f"({artifact.metadata['size_bytes'] / 1e6:.1f} MB"
+            + (
+                f", {artifact.metadata['mmap_bytes'] / 1e6:.1f} MB memory-mapped)"
+                if args.storage == "mmap"
+                else ")"
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
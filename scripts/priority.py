@@ -0,0 +1,236 @@
+"""
+UIDAI Aadhaar Data Analytics - What-If Priority Scoring
+========================================================
+Scores every district on weighted intervention criteria, replacing the
+fixed notebook formula (1 - enrol/max) x (pincodes/max) that was only
+applied to the "Underserved Region" cluster.
+
+Criteria (each scaled to its percentile rank, oriented so 1 = more urgent):
+
+- low_enrolment   few enrolments
+- coverage        many pincodes to serve
+- gini            unequal enrolment across the district's pincodes
+- low_equity      low equity score (equity.py)
+- demo_ratio      demographic updates per enrolment
+- bio_ratio       biometric updates per enrolment
+- growth          forecast next-month demand growth (forecasting.py)
+- anomalies       outlying district-months (robust z, as /anomalies)
+
+A weight scenario is one weight per criterion; the score is the
+weight-normalized sum of the scaled criteria. Thousands of scenarios are
+scored in one matrix product (scenarios x criteria @ criteria x
+districts), and each scenario's top K districts are selected with a
+partial sort (``argpartition``) instead of a full ranking.
+
+Outputs (outputs/reports/):
+
+- district_priority_scores.csv: criteria and the score / rank under the
+  chosen weights
+- priority_scenarios.csv: for random weightings (Dirichlet draws), how
+  often each district lands in the top K - districts that do under most
+  weightings are robust picks
+
+Usage:
+    python scripts/priority.py --weights gini=2,growth=1,low_equity=1 --top 50
+    python scripts/priority.py --scenarios 10000
+
+Author: Data Science Team
+Date: October 2026
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from aggregate_service import district_anomalies
+from equity import ENGINE_FILE, EquityEngine, refresh
+from forecasting import FORECAST_FILE
+
+# Configuration
+BASE_PATH = Path(__file__).parent.parent
+REPORT_PATH = BASE_PATH / "outputs" / "reports"
+SCORES_FILE = REPORT_PATH / "district_priority_scores.csv"
+SCENARIOS_FILE = REPORT_PATH / "priority_scenarios.csv"
+
+# Criterion -> (source column, +1 if higher values are more urgent)
+CRITERIA = {
+    "low_enrolment": ("enrollments", -1),
+    "coverage": ("pincodes", 1),
+    "gini": ("gini_coefficient", 1),
+    "low_equity": ("equity_score", -1),
+    "demo_ratio": ("demo_to_enrol_ratio", 1),
+    "bio_ratio": ("bio_to_enrol_ratio", 1),
+    "growth": ("forecast_growth", 1),
+    "anomalies": ("anomaly_months", 1),
+}
+DEFAULT_WEIGHTS = {name: 1.0 for name in CRITERIA}
+TOP_K = 50
+DEFAULT_SCENARIOS = 10000
+SCENARIO_CHUNK = 2048
+DEFAULT_SEED = 42
+
+
+def district_criteria(engine, forecasts=None):
+    """Raw criterion columns per district from the engine and forecasts"""
+    keys = ["state", "district"]
+    criteria = engine.scores("district").set_index(keys)
+
+    growth = pd.Series(0.0, index=criteria.index)
+    if forecasts is not None:
+        next_month = forecasts[
+            (forecasts["level"] == "district") & (forecasts["horizon"] == 1)
+        ]
+        totals = next_month.groupby(keys)[["forecast", "last_actual"]].sum()
+        change = totals["forecast"] / totals["last_actual"] - 1
+        growth = change.replace([np.inf, -np.inf], np.nan).reindex(criteria.index)
+    criteria["forecast_growth"] = growth.fillna(0)
+
+    anomalies = district_anomalies(engine=engine).groupby(keys).size()
+    criteria["anomaly_months"] = anomalies.reindex(criteria.index, fill_value=0)
+    return criteria.reset_index()
+
+
+def scaled_criteria(criteria):
+    """(criteria x districts) matrix in [0, 1], 1 = more urgent"""
+    # Percentile ranks: a few extreme update ratios would otherwise squash
+    # every other district towards 0 under min-max scaling
+    rows = [
+        (direction * criteria[column]).rank(pct=True).to_numpy()
+        for column, direction in CRITERIA.values()
+    ]
+    return np.vstack(rows)
+
+
+def weight_matrix(weights):
+    """(scenarios x criteria) weights from dicts or an array, rows sum to 1"""
+    if isinstance(weights, dict):
+        weights = [weights]
+    if not isinstance(weights, np.ndarray):
+        unknown = {name for w in weights for name in w} - set(CRITERIA)
+        if unknown:
+            raise ValueError(
+                f"Unknown criteria {sorted(unknown)}, expected {list(CRITERIA)}"
+            )
+        weights = np.array([[w.get(name, 0.0) for name in CRITERIA] for w in weights])
+    weights = np.atleast_2d(np.asarray(weights, dtype=float))
+    if (weights < 0).any() or not (weights.sum(axis=1) > 0).all():
+        raise ValueError("Weights must be non-negative with a positive sum")
+    return weights / weights.sum(axis=1, keepdims=True)
+
+
+def random_weights(n, seed=DEFAULT_SEED):
+    """Uniform draws from the simplex of criterion weightings"""
+    rng = np.random.default_rng(seed)
+    return rng.dirichlet(np.ones(len(CRITERIA)), size=n)
+
+
+def top_k(scores, k):
+    """Indices of the k highest scores per row, best first"""
+    k = min(k, scores.shape[1])
+    top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    order = np.argsort(-np.take_along_axis(scores, top, axis=1), axis=1)
+    return np.take_along_axis(top, order, axis=1)
+
+
+class PriorityEngine:
+    """Batched what-if priority scores over all districts"""
+
+    def __init__(self, criteria):
+        self.criteria = criteria.reset_index(drop=True)
+        self.scaled = scaled_criteria(self.criteria)
+
+    def score(self, weights):
+        """(scenarios x districts) scores for one or many weightings"""
+        return weight_matrix(weights) @ self.scaled
+
+    def top(self, weights, k=TOP_K):
+        """Top-k district rows for one weighting, with their scores"""
+        scores = self.score(weights)[0]
+        best = top_k(scores[None, :], k)[0]
+        table = self.criteria.loc[best, ["state", "district"]]
+        return table.assign(
+            priority_score=scores[best].round(4), rank=np.arange(1, len(best) + 1)
+        )
+
+    def table(self, weights):
+        """All districts with criteria, score and rank for one weighting"""
+        table = self.criteria.copy()
+        table["priority_score"] = self.score(weights)[0].round(4)
+        table["priority_rank"] = (
+            table["priority_score"].rank(ascending=False, method="min").astype(int)
+        )
+        return table.sort_values("priority_rank")
+
+    def robustness(self, weights, k=TOP_K):
+        """Share of scenarios placing each district in the top k"""
+        weights = weight_matrix(weights)
+        hits = np.zeros(self.scaled.shape[1])
+        score_sum = np.zeros(self.scaled.shape[1])
+        for start in range(0, len(weights), SCENARIO_CHUNK):
+            scores = weights[start : start + SCENARIO_CHUNK] @ self.scaled
+            hits += np.bincount(top_k(scores, k).ravel(), minlength=len(hits))
+            score_sum += scores.sum(axis=0)
+        table = self.criteria[["state", "district"]].assign(
+            top_k_share=(hits / len(weights)).round(4),
+            mean_score=(score_sum / len(weights)).round(4),
+        )
+        return table.sort_values(["top_k_share", "mean_score"], ascending=False)
+
+
+def parse_weights(text):
+    """'gini=2,growth=1' -> {'gini': 2.0, 'growth': 1.0}"""
+    weights = {}
+    for item in text.split(","):
+        name, _, value = item.partition("=")
+        weights[name.strip()] = float(value)
+    return weights
+
+
+def main():
+    """Score districts under a weighting and across random weightings"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--weights", type=parse_weights, default=DEFAULT_WEIGHTS)
+    parser.add_argument("--top", type=int, default=TOP_K)
+    parser.add_argument("--scenarios", type=int, default=DEFAULT_SCENARIOS)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    args = parser.parse_args()
+
+    engine = EquityEngine.load(ENGINE_FILE) if ENGINE_FILE.exists() else EquityEngine()
+    if refresh(engine):
+        engine.save(ENGINE_FILE)
+    forecasts = pd.read_csv(FORECAST_FILE) if FORECAST_FILE.exists() else None
+    if forecasts is None:
+        print("⚠️ No demand forecasts found, growth criterion is 0")
+    priority = PriorityEngine(district_criteria(engine, forecasts))
+
+    start = time.perf_counter()
+    table = priority.table(args.weights)
+    robustness = priority.robustness(
+        random_weights(args.scenarios, args.seed), args.top
+    )
+    elapsed = time.perf_counter() - start
+
+    REPORT_PATH.mkdir(parents=True, exist_ok=True)
+    table.to_csv(SCORES_FILE, index=False)
+    robustness.to_csv(SCENARIOS_FILE, index=False)
+
+    print(
+        f"✓ Scored {len(table):,} districts under {args.scenarios:,} weightings "
+        f"in {elapsed:.2f}s"
+    )
+    print(f"\n📊 TOP 10 UNDER {args.weights}:")
+    for _, row in table.head(10).iterrows():
+        print(
+            f"   {row['priority_rank']:>3}. {row['district']}, {row['state']}: {row['priority_score']:.3f}"
+        )
+    robust = (robustness["top_k_share"] >= 0.5).sum()
+    print(
+        f"\n   {robust} districts are in the top {args.top} under half of all weightings"
+    )
+
+
+if __name__ == "__main__":
+    main()
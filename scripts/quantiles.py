@@ -0,0 +1,324 @@
+"""
+UIDAI Aadhaar Data Analytics - Quantile Engine
+===============================================
+Per-district medians and percentile thresholds in two modes:
+
+- exact:  keeps every value per group and sorts it (reference path)
+- approx: mergeable KLL sketches built shard by shard during ingestion,
+          so thresholds are available without rereading the rows
+
+Usage:
+    python scripts/quantiles.py --dataset enrolment --compare
+
+Author: Data Science Team
+Date: October 2026
+"""
+
+import argparse
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ingest import dedup_store, ingest, list_shards
+
+# Configuration
+BASE_PATH = Path(__file__).parent.parent
+OUTPUT_PATH = BASE_PATH / "outputs"
+REPORT_PATH = OUTPUT_PATH / "reports"
+SKETCH_PATH = OUTPUT_PATH / "sketches"
+
+DEFAULT_K = 200
+DEFAULT_QUANTILES = (0.25, 0.5, 0.75)
+
+
+def quantile_label(q):
+    """Column label for a quantile, e.g. 0.5 -> 'p50'"""
+    return f"p{q * 100:g}".replace(".", "_")
+
+
+class KLLSketch:
+    """Mergeable KLL quantile sketch with rank error of roughly 1.7/k"""
+
+    def __init__(self, k=DEFAULT_K, seed=42):
+        self.k = k
+        self.n = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level):
+        depth = len(self.levels) - level - 1
+        return max(int(np.ceil(self.k * (2 / 3) ** depth)), 2)
+
+    def _compact(self, level):
+        if level + 1 == len(self.levels):
+            self.levels.append(np.empty(0))
+        items = np.sort(self.levels[level])
+        keep = items[:0]
+        if len(items) % 2:
+            keep, items = items[-1:], items[:-1]
+        promoted = items[self._rng.integers(2) :: 2]
+        self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+        self.levels[level] = keep
+
+    def _compress(self):
+        while sum(len(items) for items in self.levels) > sum(
+            self._capacity(level) for level in range(len(self.levels))
+        ):
+            for level, items in enumerate(self.levels):
+                if len(items) > self._capacity(level):
+                    self._compact(level)
+                    break
+
+    def update(self, values):
+        """Add a batch of values to the sketch"""
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+        self.n += len(values)
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other):
+        """Fold another sketch into this one"""
+        for level, items in enumerate(other.levels):
+            if level == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.n += other.n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+        return self
+
+    def quantile(self, qs):
+        """Approximate quantiles for an array of probabilities"""
+        qs = np.atleast_1d(np.asarray(qs, dtype=float))
+        if self.n == 0:
+            return np.full(len(qs), np.nan)
+
+        items = np.concatenate(self.levels)
+        weights = np.concatenate(
+            [np.full(len(lvl), 2.0**h) for h, lvl in enumerate(self.levels)]
+        )
+        order = np.argsort(items, kind="stable")
+        items, cum_weights = items[order], np.cumsum(weights[order])
+
+        idx = np.searchsorted(cum_weights, qs * cum_weights[-1], side="left")
+        result = items[np.minimum(idx, len(items) - 1)]
+        result[qs <= 0] = self.min
+        result[qs >= 1] = self.max
+        return result
+
+
+class QuantileEngine:
+    """Per-group quantiles of one value column, exact or sketch-approximated"""
+
+    def __init__(
+        self,
+        group_cols=("state", "district"),
+        value_col="total_enrollments",
+        mode="approx",
+        k=DEFAULT_K,
+        seed=42,
+    ):
+        if mode not in ("exact", "approx"):
+            raise ValueError(f"Unknown quantile mode '{mode}'")
+        self.group_cols = list(group_cols)
+        self.value_col = value_col
+        self.mode = mode
+        self.k = k
+        self.seed = seed
+        self.groups = {}
+
+    def _key(self, key):
+        return key if isinstance(key, tuple) else (key,)
+
+    def update(self, df):
+        """Add one chunk/shard of rows to the per-group state"""
+        values = df[self.value_col].to_numpy(dtype=float)
+        for key, idx in df.groupby(self.group_cols, sort=False).indices.items():
+            key = self._key(key)
+            if self.mode == "exact":
+                self.groups.setdefault(key, []).append(values[idx])
+            else:
+                if key not in self.groups:
+                    self.groups[key] = KLLSketch(k=self.k, seed=self.seed)
+                self.groups[key].update(values[idx])
+        return self
+
+    def merge(self, other):
+        """Combine the state of an engine built over another shard"""
+        if other.mode != self.mode or other.group_cols != self.group_cols:
+            raise ValueError("Cannot merge engines with different mode or groups")
+        for key, state in other.groups.items():
+            if key not in self.groups:
+                self.groups[key] = state
+            elif self.mode == "exact":
+                self.groups[key].extend(state)
+            else:
+                self.groups[key].merge(state)
+        return self
+
+    def group_values(self, key):
+        """All raw values of a group (exact mode only)"""
+        if self.mode != "exact":
+            raise ValueError("Raw values are only kept in exact mode")
+        return np.concatenate(self.groups[key])
+
+    def quantiles(self, qs=DEFAULT_QUANTILES):
+        """Return one row per group with its count and requested quantiles"""
+        qs = list(qs)
+        rows = []
+        for key, state in self.groups.items():
+            if self.mode == "exact":
+                values = np.concatenate(state)
+                result = np.quantile(values, qs)
+                count = len(values)
+            else:
+                result = state.quantile(qs)
+                count = state.n
+            rows.append([*key, count, *result])
+
+        columns = [*self.group_cols, "count", *[quantile_label(q) for q in qs]]
+        return pd.DataFrame(rows, columns=columns)
+
+    def medians(self):
+        """Per-group medians"""
+        return self.quantiles([0.5]).rename(columns={"p50": "median"})
+
+    def save(self, path):
+        """Persist the engine so thresholds can be read without the rows"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            pickle.dump(self, f)
+
+    @staticmethod
+    def load(path):
+        """Load an engine saved with ``save``"""
+        with open(path, "rb") as f:
+            return pickle.load(f)
+
+
+def compare_to_exact(approx_engine, exact_engine, qs=DEFAULT_QUANTILES):
+    """Value and rank error of approximate quantiles against the exact path"""
+    approx = approx_engine.quantiles(qs).set_index(approx_engine.group_cols)
+
+    rows = []
+    for key in exact_engine.groups:
+        values = np.sort(exact_engine.group_values(key))
+        n = len(values)
+        for q in qs:
+            estimate = approx.loc[key, quantile_label(q)]
+            rank_lo = np.searchsorted(values, estimate, side="left") / n
+            rank_hi = np.searchsorted(values, estimate, side="right") / n
+            rows.append(
+                [
+                    *key,
+                    q,
+                    estimate,
+                    np.quantile(values, q),
+                    max(rank_lo - q, q - rank_hi, 0.0),
+                ]
+            )
+
+    report = pd.DataFrame(
+        rows,
+        columns=[
+            *exact_engine.group_cols,
+            "quantile",
+            "approx_value",
+            "exact_value",
+            "rank_error",
+        ],
+    )
+    report["abs_error"] = (report["approx_value"] - report["exact_value"]).abs()
+    return report
+
+
+def _build_shard_engine(args):
+    """Build an engine over a single shard (runs in a worker process)"""
+    dataset, shard, mode, group_cols, value_col, k = args
+    engine = QuantileEngine(group_cols, value_col, mode=mode, k=k)
+    ingest(dataset, [engine], shards=[shard], verbose=False)
+    return engine
+
+
+def build_engine(
+    dataset="enrolment",
+    mode="approx",
+    group_cols=("state", "district"),
+    value_col="total_enrollments",
+    k=DEFAULT_K,
+    workers=None,
+):
+    """Build per-shard engines in parallel and merge them"""
+    shards = list_shards(dataset)
+    tasks = [(dataset, shard, mode, group_cols, value_col, k) for shard in shards]
+    # Record new shards in the fingerprint store before workers read it
+    dedup_store(dataset)
+    if len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            engines = list(pool.map(_build_shard_engine, tasks))
+    else:
+        engines = [_build_shard_engine(task) for task in tasks]
+
+    engine = QuantileEngine(group_cols, value_col, mode=mode, k=k)
+    for shard_engine in engines:
+        engine.merge(shard_engine)
+    print(f"✓ Built {mode} quantiles for {len(engine.groups):,} groups")
+    return engine
+
+
+def main():
+    """Build district quantile sketches and optionally report their error"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--dataset", default="enrolment")
+    parser.add_argument("--value-col", default="total_enrollments")
+    parser.add_argument("--mode", choices=["exact", "approx"], default="approx")
+    parser.add_argument("--k", type=int, default=DEFAULT_K)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument(
+        "--compare", action="store_true", help="Report error against exact path"
+    )
+    args = parser.parse_args()
+
+    engine = build_engine(
+        args.dataset,
+        args.mode,
+        value_col=args.value_col,
+        k=args.k,
+        workers=args.workers,
+    )
+    engine.save(SKETCH_PATH / f"{args.dataset}_district_quantiles.pkl")
+    engine.quantiles().to_csv(
+        REPORT_PATH / f"{args.dataset}_district_quantiles.csv", index=False
+    )
+
+    if args.compare and args.mode == "approx":
+        exact = build_engine(
+            args.dataset, "exact", value_col=args.value_col, workers=args.workers
+        )
+        report = compare_to_exact(engine, exact)
+        report.to_csv(
+            REPORT_PATH / f"{args.dataset}_quantile_error_report.csv", index=False
+        )
+        print("\n📊 APPROXIMATION ERROR VS EXACT:")
+        print(
+            report.groupby("quantile")[["rank_error", "abs_error"]]
+            .agg(["mean", "max"])
+            .to_string()
+        )
+
+
+if __name__ == "__main__":
+    main()
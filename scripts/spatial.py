@@ -0,0 +1,239 @@
+"""
+UIDAI Aadhaar Data Analytics - Pincode Spatial Index
+=====================================================
+Loads the local pincode centroid table and indexes it with a KD-tree over
+3-D unit vectors, so that chord distances map exactly onto great-circle
+kilometres and nearest-neighbour / radius queries are O(log n).
+
+On top of the index, radius and k-nearest-neighbour aggregation turn
+pincode activity into accessibility indicators (e.g. enrolments within
+25 km of each pincode) and connected underserved pockets, without any
+O(n²) pairwise loops.
+
+The centroid table is a CSV with ``pincode, latitude, longitude`` columns
+at data/reference/pincode_centroids.csv (not shipped with the repository).
+
+Usage:
+    python scripts/spatial.py --radius-km 25 --k 5
+
+Author: Data Science Team
+Date: October 2026
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from scipy.spatial import cKDTree
+
+from ingest import DATASETS, pincode_totals
+
+# Configuration
+BASE_PATH = Path(__file__).parent.parent
+REFERENCE_PATH = BASE_PATH / "data" / "reference"
+CENTROIDS_FILE = REFERENCE_PATH / "pincode_centroids.csv"
+REPORT_PATH = BASE_PATH / "outputs" / "reports"
+
+EARTH_RADIUS_KM = 6371.0088
+DEFAULT_RADIUS_KM = 25
+DEFAULT_K = 5
+POCKET_QUANTILE = 0.1
+
+
+def load_pincode_centroids(path=CENTROIDS_FILE):
+    """Load the pincode centroid table with zero-padded pincodes"""
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(
+            f"Pincode centroid table not found at {path}. "
+            "Expected a CSV with pincode, latitude, longitude columns."
+        )
+    centroids = pd.read_csv(path, dtype={"pincode": str})
+    centroids["pincode"] = centroids["pincode"].str.strip().str.zfill(6)
+    centroids = centroids.dropna(subset=["latitude", "longitude"])
+    return centroids.drop_duplicates("pincode").reset_index(drop=True)
+
+
+def to_unit_vectors(latitude, longitude):
+    """Convert degrees to points on the unit sphere"""
+    lat = np.radians(np.asarray(latitude, dtype=float))
+    lon = np.radians(np.asarray(longitude, dtype=float))
+    return np.column_stack(
+        [np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)]
+    )
+
+
+def km_to_chord(km):
+    """Great-circle distance in km -> chord length on the unit sphere"""
+    return 2 * np.sin(np.asarray(km, dtype=float) / (2 * EARTH_RADIUS_KM))
+
+
+def chord_to_km(chord):
+    """Chord length on the unit sphere -> great-circle distance in km"""
+    chord = np.clip(np.asarray(chord, dtype=float), 0, 2)
+    return 2 * EARTH_RADIUS_KM * np.arcsin(chord / 2)
+
+
+class PincodeIndex:
+    """KD-tree over pincode centroids with distances in kilometres"""
+
+    def __init__(self, centroids):
+        self.centroids = centroids.reset_index(drop=True)
+        self.points = to_unit_vectors(
+            self.centroids["latitude"], self.centroids["longitude"]
+        )
+        self.tree = cKDTree(self.points)
+        self.position = pd.Series(
+            np.arange(len(self.centroids)), index=self.centroids["pincode"]
+        )
+
+    def __len__(self):
+        return len(self.centroids)
+
+    def locate(self, pincodes):
+        """Row positions of pincodes in the index (-1 when unknown)"""
+        positions = self.position.reindex(pd.Index(pincodes).astype(str))
+        return positions.fillna(-1).astype(int).to_numpy()
+
+    def nearest(self, points, k=1):
+        """k nearest indexed pincodes to unit-vector points -> (km, rows)"""
+        chord, rows = self.tree.query(points, k=k)
+        return chord_to_km(chord), rows
+
+    def within(self, points, radius_km):
+        """Rows of indexed pincodes within radius_km of each point"""
+        return self.tree.query_ball_point(points, r=float(km_to_chord(radius_km)))
+
+    def pairs_within(self, radius_km):
+        """All (i, j, km) pairs with i < j closer than radius_km"""
+        pairs = self.tree.query_pairs(
+            r=float(km_to_chord(radius_km)), output_type="ndarray"
+        )
+        i, j = pairs[:, 0], pairs[:, 1]
+        return (
+            i,
+            j,
+            chord_to_km(np.linalg.norm(self.points[i] - self.points[j], axis=1)),
+        )
+
+
+def radius_aggregate(index, values, radius_km=DEFAULT_RADIUS_KM):
+    """Sum of values and pincode count within radius_km of every pincode"""
+    values = np.asarray(values, dtype=float)
+    i, j, _ = index.pairs_within(radius_km)
+    n = len(index)
+    sums = values + np.bincount(i, weights=values[j], minlength=n)
+    sums += np.bincount(j, weights=values[i], minlength=n)
+    counts = 1 + np.bincount(i, minlength=n) + np.bincount(j, minlength=n)
+    return sums, counts
+
+
+def knn_aggregate(index, values, k=DEFAULT_K):
+    """Mean of values over the k nearest other pincodes and distance to the kth"""
+    values = np.asarray(values, dtype=float)
+    n = len(index)
+    # Without k other pincodes the query pads rows with out-of-range indices
+    k = min(k, n - 1)
+    if k < 1:
+        return np.full(n, np.nan), np.full(n, np.nan)
+    distance_km, rows = index.nearest(index.points, k=k + 1)
+
+    # Duplicate centroids tie at 0 km, so self is not always listed first:
+    # drop it by index, and keep k neighbours where it was not listed at all
+    other = rows != np.arange(n)[:, None]
+    other &= np.cumsum(other, axis=1) <= k
+    means = np.where(other, values[rows], 0).sum(axis=1) / k
+    return means, np.where(other, distance_km, 0).max(axis=1)
+
+
+def accessibility_indicators(index, activity, radius_km=DEFAULT_RADIUS_KM, k=DEFAULT_K):
+    """Per-pincode accessibility indicators from radius and kNN aggregation"""
+    activity = np.asarray(activity, dtype=float)
+    indicators = index.centroids[["pincode", "latitude", "longitude"]].copy()
+    indicators["enrollments"] = activity
+
+    sums, counts = radius_aggregate(index, activity, radius_km)
+    indicators[f"enrollments_within_{radius_km:g}km"] = sums
+    indicators[f"pincodes_within_{radius_km:g}km"] = counts
+    indicators["enrollments_per_pincode_nearby"] = sums / counts
+
+    knn_mean, kth_km = knn_aggregate(index, activity, k)
+    indicators[f"knn{k}_mean_enrollments"] = knn_mean
+    indicators[f"knn{k}_distance_km"] = kth_km
+
+    active = activity > 0
+    if active.any():
+        chord, _ = cKDTree(index.points[active]).query(index.points)
+        indicators["nearest_active_km"] = chord_to_km(chord)
+    else:
+        indicators["nearest_active_km"] = np.nan
+    return indicators
+
+
+def underserved_pockets(
+    index, indicators, radius_km=DEFAULT_RADIUS_KM, quantile=POCKET_QUANTILE
+):
+    """Connected groups of low-access pincodes (bottom quantile nearby activity)"""
+    score = indicators["enrollments_per_pincode_nearby"].to_numpy()
+    flagged = score <= np.quantile(score, quantile)
+
+    i, j, _ = index.pairs_within(radius_km)
+    keep = flagged[i] & flagged[j]
+    n = len(index)
+    graph = coo_matrix((np.ones(keep.sum()), (i[keep], j[keep])), shape=(n, n))
+    _, labels = connected_components(graph, directed=False)
+
+    members = indicators[flagged].assign(pocket=labels[flagged])
+    pockets = (
+        members.groupby("pocket")
+        .agg(
+            pincodes=("pincode", "size"),
+            enrollments=("enrollments", "sum"),
+            latitude=("latitude", "mean"),
+            longitude=("longitude", "mean"),
+            sample_pincodes=("pincode", lambda p: ", ".join(p.head(5))),
+        )
+        .sort_values(["pincodes", "enrollments"], ascending=[False, True])
+        .reset_index(drop=True)
+    )
+    pockets.insert(0, "pocket_id", np.arange(1, len(pockets) + 1))
+    return pockets
+
+
+def pincode_activity(index, dataset="enrolment"):
+    """Total activity of every indexed pincode (0 when no records)"""
+    totals = pincode_totals(dataset).groupby("pincode")[DATASETS[dataset]["total_col"]]
+    return (
+        totals.sum().reindex(index.centroids["pincode"], fill_value=0).to_numpy(float)
+    )
+
+
+def main():
+    """Compute pincode accessibility indicators and underserved pockets"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--centroids", default=CENTROIDS_FILE)
+    parser.add_argument("--radius-km", type=float, default=DEFAULT_RADIUS_KM)
+    parser.add_argument("--k", type=int, default=DEFAULT_K)
+    parser.add_argument("--quantile", type=float, default=POCKET_QUANTILE)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index = PincodeIndex(load_pincode_centroids(args.centroids))
+    activity = pincode_activity(index)
+    indicators = accessibility_indicators(index, activity, args.radius_km, args.k)
+    pockets = underserved_pockets(index, indicators, args.radius_km, args.quantile)
+
+    indicators.to_csv(REPORT_PATH / "pincode_accessibility.csv", index=False)
+    pockets.to_csv(REPORT_PATH / "underserved_pockets.csv", index=False)
+    print(
+        f"✓ Accessibility for {len(index):,} pincodes and {len(pockets):,} "
+        f"underserved pockets in {time.perf_counter() - start:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+"""
+UIDAI Aadhaar Data Analytics - Streaming Summary Statistics
+============================================================
+Mergeable accumulators for the univariate and correlation tables:
+
+- moments:     count, mean, M2, M3, M4 per column (Welford / Pébay
+               pairwise updates), giving std, skew and kurtosis
+- co-moments:  the centered cross-product matrix, giving covariance and
+               correlation matrices
+- extremes:    running min / max
+- quantiles:   one KLL sketch per column for medians and percentiles
+
+Each shard or partition is summarized on its own and the partial states
+are merged, so the tables come out of a single streaming pass and can be
+refreshed by merging in the state of new shards only.
+
+Skew and kurtosis use the same bias-adjusted estimators as pandas
+(``DataFrame.skew`` / ``DataFrame.kurt``), so results match the notebooks.
+Rows with a missing value in any tracked column are skipped.
+
+Usage:
+    python scripts/summary_stats.py --dataset enrolment
+
+Author: Data Science Team
+Date: October 2026
+"""
+
+import argparse
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ingest import DATASETS, dedup_store, ingest, list_shards
+from quantiles import DEFAULT_K, KLLSketch
+
+# Configuration
+BASE_PATH = Path(__file__).parent.parent
+OUTPUT_PATH = BASE_PATH / "outputs"
+REPORT_PATH = OUTPUT_PATH / "reports"
+SKETCH_PATH = OUTPUT_PATH / "sketches"
+
+
+class MomentAccumulator:
+    """Running central moments and co-moments of several columns"""
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        m = len(self.columns)
+        self.n = 0
+        self.mean = np.zeros(m)
+        self.m2 = np.zeros(m)
+        self.m3 = np.zeros(m)
+        self.m4 = np.zeros(m)
+        self.comoment = np.zeros((m, m))
+        self.min = np.full(m, np.inf)
+        self.max = np.full(m, -np.inf)
+
+    @classmethod
+    def from_array(cls, columns, values):
+        """Exact moments of one batch (rows x columns array)"""
+        acc = cls(columns)
+        if len(values) == 0:
+            return acc
+        acc.n = len(values)
+        acc.mean = values.mean(axis=0)
+        dev = values - acc.mean
+        acc.m2 = (dev**2).sum(axis=0)
+        acc.m3 = (dev**3).sum(axis=0)
+        acc.m4 = (dev**4).sum(axis=0)
+        acc.comoment = dev.T @ dev
+        acc.min = values.min(axis=0)
+        acc.max = values.max(axis=0)
+        return acc
+
+    def update(self, values):
+        """Fold a batch of rows into the running state"""
+        return self.merge(self.from_array(self.columns, values))
+
+    def merge(self, other):
+        """Pairwise (Pébay) combination with another accumulator"""
+        if other.columns != self.columns:
+            raise ValueError("Cannot merge accumulators over different columns")
+        if other.n == 0:
+            return self
+
+        na, nb = self.n, other.n
+        n = na + nb
+        delta = other.mean - self.mean
+
+        m4 = (
+            self.m4
+            + other.m4
+            + delta**4 * na * nb * (na**2 - na * nb + nb**2) / n**3
+            + 6 * delta**2 * (na**2 * other.m2 + nb**2 * self.m2) / n**2
+            + 4 * delta * (na * other.m3 - nb * self.m3) / n
+        )
+        m3 = (
+            self.m3
+            + other.m3
+            + delta**3 * na * nb * (na - nb) / n**2
+            + 3 * delta * (na * other.m2 - nb * self.m2) / n
+        )
+        self.m2 = self.m2 + other.m2 + delta**2 * na * nb / n
+        self.m3, self.m4 = m3, m4
+        self.comoment = (
+            self.comoment + other.comoment + np.outer(delta, delta) * na * nb / n
+        )
+        self.mean = self.mean + delta * nb / n
+        self.min = np.minimum(self.min, other.min)
+        self.max = np.maximum(self.max, other.max)
+        self.n = n
+        return self
+
+    def variance(self, ddof=1):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self.m2 / (self.n - ddof)
+
+    def skew(self):
+        """Adjusted Fisher-Pearson skewness (as pandas)"""
+        n = self.n
+        with np.errstate(divide="ignore", invalid="ignore"):
+            g1 = np.sqrt(n) * self.m3 / self.m2**1.5
+            skew = np.sqrt(n * (n - 1)) / (n - 2) * g1
+        return np.where(self.m2 > 0, skew, 0.0) if n > 2 else np.full_like(g1, np.nan)
+
+    def kurtosis(self):
+        """Bias-adjusted excess kurtosis (as pandas)"""
+        n = self.n
+        with np.errstate(divide="ignore", invalid="ignore"):
+            g2 = n * self.m4 / self.m2**2 - 3
+            kurt = ((n + 1) * g2 + 6) * (n - 1) / ((n - 2) * (n - 3))
+        return np.where(self.m2 > 0, kurt, 0.0) if n > 3 else np.full_like(g2, np.nan)
+
+    def covariance(self, ddof=1):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cov = self.comoment / (self.n - ddof)
+        return pd.DataFrame(cov, index=self.columns, columns=self.columns)
+
+    def correlation(self):
+        scale = np.sqrt(np.diag(self.comoment))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = self.comoment / np.outer(scale, scale)
+        return pd.DataFrame(corr, index=self.columns, columns=self.columns)
+
+
+class SummaryStatistics:
+    """Moments, extremes, correlations and quantile sketches of columns"""
+
+    def __init__(self, columns, k=DEFAULT_K, seed=42):
+        self.columns = list(columns)
+        self.moments = MomentAccumulator(self.columns)
+        self.sketches = {col: KLLSketch(k=k, seed=seed) for col in self.columns}
+
+    def update(self, df):
+        """Add one chunk/shard of rows"""
+        values = df[self.columns].to_numpy(dtype=float)
+        values = values[~np.isnan(values).any(axis=1)]
+        self.moments.update(values)
+        for i, col in enumerate(self.columns):
+            self.sketches[col].update(values[:, i])
+        return self
+
+    def merge(self, other):
+        """Combine the state built over another shard"""
+        self.moments.merge(other.moments)
+        for col in self.columns:
+            self.sketches[col].merge(other.sketches[col])
+        return self
+
+    @property
+    def n(self):
+        return self.moments.n
+
+    def quantiles(self, qs):
+        """Approximate quantiles per column (rows: qs, columns: columns)"""
+        return pd.DataFrame(
+            {col: self.sketches[col].quantile(qs) for col in self.columns}, index=qs
+        )
+
+    def summary(self):
+        """Univariate table: one row per statistic, one column per column"""
+        m = self.moments
+        return pd.DataFrame(
+            [
+                np.full(len(self.columns), m.n),
+                m.mean,
+                self.quantiles([0.5]).iloc[0].to_numpy(),
+                np.sqrt(m.variance()),
+                m.min,
+                m.max,
+                m.skew(),
+                m.kurtosis(),
+            ],
+            index=["count", "mean", "median", "std", "min", "max", "skew", "kurtosis"],
+            columns=self.columns,
+        )
+
+    def covariance(self):
+        return self.moments.covariance()
+
+    def correlation(self):
+        return self.moments.correlation()
+
+    def save(self, path):
+        """Persist the accumulated state for later merges"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            pickle.dump(self, f)
+
+    @staticmethod
+    def load(path):
+        """Load statistics saved with ``save``"""
+        with open(path, "rb") as f:
+            return pickle.load(f)
+
+
+def dataset_columns(dataset):
+    """Count columns and total of a dataset"""
+    config = DATASETS[dataset]
+    return [*config["count_cols"], config["total_col"]]
+
+
+def _build_shard_statistics(args):
+    """Summarize a single shard (runs in a worker process)"""
+    dataset, shard, k = args
+    stats = SummaryStatistics(dataset_columns(dataset), k=k)
+    ingest(dataset, [stats], shards=[shard], verbose=False)
+    return stats
+
+
+def build_statistics(dataset="enrolment", k=DEFAULT_K, workers=None):
+    """Summarize every shard in parallel and merge the partial states"""
+    tasks = [(dataset, shard, k) for shard in list_shards(dataset)]
+    # Record new shards in the fingerprint store before workers read it
+    dedup_store(dataset)
+    if len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            partials = list(pool.map(_build_shard_statistics, tasks))
+    else:
+        partials = [_build_shard_statistics(task) for task in tasks]
+
+    stats = SummaryStatistics(dataset_columns(dataset), k=k)
+    for partial in partials:
+        stats.merge(partial)
+    print(f"✓ Summarized {stats.n:,} {dataset} records in one pass")
+    return stats
+
+
+def main():
+    """Build streaming summary statistics and correlations for a dataset"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--dataset", choices=list(DATASETS), default="enrolment")
+    parser.add_argument("--k", type=int, default=DEFAULT_K)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    stats = build_statistics(args.dataset, args.k, args.workers)
+    stats.save(SKETCH_PATH / f"{args.dataset}_summary_stats.pkl")
+    stats.summary().to_csv(REPORT_PATH / f"{args.dataset}_summary_statistics.csv")
+    stats.correlation().to_csv(REPORT_PATH / f"{args.dataset}_correlation_matrix.csv")
+
+    print("\n📊 SUMMARY STATISTICS:")
+    print(stats.summary().round(3).to_string())
+    print("\n📊 CORRELATION MATRIX:")
+    print(stats.correlation().round(3).to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,360 @@
+"""
+UIDAI Aadhaar Data Analytics - Model Training
+==============================================
+Histogram-based gradient boosting for enrollment demand, replacing the
+exact-split GradientBoostingRegressor trained once in notebook 04.
+
+- Training rows are built from the raw shards in one chunked pass:
+  pincode x month enrollment totals, rolled up to district x month
+  or kept per pincode for finer models
+- Activity features are the previous month's values (``prev_*``). The
+  same-month age-group counts sum to the target, so they are never
+  features; months without a previous record are left missing, which
+  the boosting model handles natively. With a single month of history
+  the lags are missing everywhere; such columns are dropped and the
+  registered metadata lists the features actually used
+- ``HistGradientBoostingRegressor`` bins every feature once (at most 255
+  bins) and stops adding trees when an internal validation split stops
+  improving, so fits scale to pincode-month rows
+- Hyperparameters are random-searched over a process pool under a
+  wall-clock budget: no new trial starts once the budget is spent,
+  running trials finish. Trials are scored on a validation split of the
+  training rows; the held-out test split is only used for the final model
+- The best model is registered with its geography encoders and training
+  data fingerprint as ``demand_hgb_<grain>`` (see model_registry.py);
+  the search log is appended to outputs/models/hgb_search_log.csv
+
+Usage:
+    python scripts/training.py --grain district --budget 600 --workers 4
+
+Author: Data Science Team
+Date: October 2026
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import HistGradientBoostingRegressor
+from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+from sklearn.model_selection import train_test_split
+
+from geography import DIMENSION_FILE, GeographyDimension
+from ingest import DATASETS, ingest
+from model_registry import ModelRegistry
+
+# Configuration
+BASE_PATH = Path(__file__).parent.parent
+MODEL_PATH = BASE_PATH / "outputs" / "models"
+MODEL_NAME = "demand_hgb_{grain}"
+SEARCH_LOG_FILE = MODEL_PATH / "hgb_search_log.csv"
+
+COUNT_COLS = DATASETS["enrolment"]["count_cols"]
+TARGET = DATASETS["enrolment"]["total_col"]
+PINCODE_KEYS = ["state_id", "district_id", "pincode_id", "period"]
+COMPACT_EVERY = 16
+
+# Grain -> area keys of its rows
+GRAIN_KEYS = {
+    "district": ["state_id", "district_id"],
+    "pincode": ["state_id", "district_id", "pincode_id"],
+}
+# Same-period activity, only ever used lagged by one month
+ACTIVITY_COLS = {
+    "district": [*COUNT_COLS, TARGET, "active_pincodes"],
+    "pincode": [*COUNT_COLS, TARGET],
+}
+GRAINS = {
+    grain: [*keys, "year", "month", "quarter"]
+    + [f"prev_{col}" for col in ACTIVITY_COLS[grain]]
+    for grain, keys in GRAIN_KEYS.items()
+}
+CATEGORICAL_FEATURES = ["state_id"]
+
+MAX_ITER = 2000
+N_ITER_NO_CHANGE = 20
+DEFAULT_BUDGET = 600
+DEFAULT_TRIALS = 40
+DEFAULT_SEED = 42
+
+DEFAULT_PARAMS = {
+    "learning_rate": 0.1,
+    "max_leaf_nodes": 31,
+    "min_samples_leaf": 20,
+    "l2_regularization": 0.0,
+    "max_bins": 255,
+}
+SEARCH_SPACE = {
+    "learning_rate": [0.02, 0.05, 0.1, 0.2],
+    "max_leaf_nodes": [15, 31, 63, 127],
+    "min_samples_leaf": [5, 20, 50, 100],
+    "l2_regularization": [0.0, 0.1, 1.0, 10.0],
+    "max_bins": [63, 127, 255],
+}
+
+# Training arrays shared with pool workers, set once per process
+_TRIAL_DATA = None
+
+
+class ModelFrameBuilder:
+    """Ingestion consumer collecting pincode x month enrollment totals"""
+
+    def __init__(self):
+        self.parts = []
+
+    def update(self, chunk):
+        self.parts.append(
+            chunk.assign(period=chunk["date"].dt.to_period("M"))
+            .groupby(PINCODE_KEYS, as_index=False)[[*COUNT_COLS, TARGET]]
+            .sum()
+        )
+        if len(self.parts) >= COMPACT_EVERY:
+            self.parts = [self._pincode_months()]
+        return self
+
+    def _pincode_months(self):
+        return (
+            pd.concat(self.parts, ignore_index=True)
+            .groupby(PINCODE_KEYS, as_index=False)[[*COUNT_COLS, TARGET]]
+            .sum()
+        )
+
+    def frame(self, grain="district"):
+        """Model rows at a grain with calendar and previous-month features"""
+        rows = self._pincode_months()
+        if grain == "district":
+            rows = rows.groupby(
+                ["state_id", "district_id", "period"], as_index=False
+            ).agg(
+                **{col: (col, "sum") for col in [*COUNT_COLS, TARGET]},
+                active_pincodes=("pincode_id", "size"),
+            )
+        rows["year"] = rows["period"].dt.year
+        rows["month"] = rows["period"].dt.month
+        rows["quarter"] = rows["period"].dt.quarter
+
+        keys, activity = GRAIN_KEYS[grain], ACTIVITY_COLS[grain]
+        previous = (
+            rows[[*keys, "period", *activity]]
+            .assign(period=rows["period"] + 1)
+            .rename(columns={col: f"prev_{col}" for col in activity})
+        )
+        return rows.merge(previous, on=[*keys, "period"], how="left")
+
+
+def make_model(params, categorical, seed, max_iter=MAX_ITER, early_stopping=True):
+    """Histogram gradient boosting regressor for a parameter set"""
+    return HistGradientBoostingRegressor(
+        **params,
+        max_iter=max_iter,
+        early_stopping=early_stopping,
+        n_iter_no_change=N_ITER_NO_CHANGE,
+        categorical_features=categorical,
+        random_state=seed,
+    )
+
+
+def evaluate(y_true, y_pred):
+    """R², RMSE and MAE as in the notebook"""
+    return {
+        "r2": r2_score(y_true, y_pred),
+        "rmse": float(np.sqrt(mean_squared_error(y_true, y_pred))),
+        "mae": mean_absolute_error(y_true, y_pred),
+    }
+
+
+def sample_candidates(n, seed=DEFAULT_SEED):
+    """The default parameters followed by distinct random draws"""
+    rng = np.random.default_rng(seed)
+    candidates = [DEFAULT_PARAMS]
+    seen = {tuple(DEFAULT_PARAMS.values())}
+    space = np.prod([len(values) for values in SEARCH_SPACE.values()])
+    while len(candidates) < min(n, space):
+        params = {
+            name: values[rng.integers(len(values))]
+            for name, values in SEARCH_SPACE.items()
+        }
+        key = tuple(params.values())
+        if key not in seen:
+            seen.add(key)
+            candidates.append(params)
+    return candidates
+
+
+def _init_worker(data):
+    global _TRIAL_DATA
+    _TRIAL_DATA = data
+
+
+def _run_trial(trial, params, seed):
+    X_fit, y_fit, X_valid, y_valid, categorical = _TRIAL_DATA
+    start = time.perf_counter()
+    model = make_model(params, categorical, seed).fit(X_fit, y_fit)
+    return {
+        "trial": trial,
+        **params,
+        "n_iter": model.n_iter_,
+        **evaluate(y_valid, model.predict(X_valid)),
+        "fit_seconds": round(time.perf_counter() - start, 2),
+    }
+
+
+def search(
+    X, y, categorical, budget, workers=None, trials=DEFAULT_TRIALS, seed=DEFAULT_SEED
+):
+    """Random search over SEARCH_SPACE within ``budget`` seconds"""
+    X_fit, X_valid, y_fit, y_valid = train_test_split(
+        X, y, test_size=0.2, random_state=seed
+    )
+    candidates = iter(enumerate(sample_candidates(trials, seed)))
+    workers = workers or os.cpu_count()
+    deadline = time.monotonic() + budget
+    results, running = [], set()
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=((X_fit, y_fit, X_valid, y_valid, categorical),),
+    ) as pool:
+        while True:
+            while len(running) < workers and time.monotonic() < deadline:
+                candidate = next(candidates, None)
+                if candidate is None:
+                    break
+                running.add(pool.submit(_run_trial, *candidate, seed))
+            if not running:
+                break
+            done, running = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                results.append(future.result())
+                print(
+                    f"   trial {results[-1]['trial']:>3}: "
+                    f"RMSE {results[-1]['rmse']:,.2f} "
+                    f"after {results[-1]['n_iter']} trees"
+                )
+
+    if not results:
+        raise RuntimeError(
+            f"No search trial finished within the {budget:g}s budget; "
+            "increase --budget or --trials"
+        )
+    return pd.DataFrame(results).sort_values("rmse", ignore_index=True)
+
+
+def usable_features(rows, grain="district"):
+    """Features of a grain that are not missing in every row"""
+    features = [col for col in GRAINS[grain] if rows[col].notna().any()]
+    dropped = [col for col in GRAINS[grain] if col not in features]
+    if dropped:
+        print(f"⚠️ No values for {', '.join(dropped)} (needs two or more months)")
+    return features
+
+
+def train(
+    rows,
+    grain="district",
+    budget=DEFAULT_BUDGET,
+    workers=None,
+    trials=DEFAULT_TRIALS,
+    seed=DEFAULT_SEED,
+):
+    """Search, refit the best parameters and evaluate on the test split"""
+    features = usable_features(rows, grain)
+    X = rows[features].to_numpy(dtype=np.float64)
+    y = rows[TARGET].to_numpy(dtype=np.float64)
+    categorical = np.isin(features, CATEGORICAL_FEATURES)
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=0.2, random_state=seed
+    )
+
+    log = search(X_train, y_train, categorical, budget, workers, trials, seed)
+    best = log.iloc[0]
+    params = {name: type(value)(best[name]) for name, value in DEFAULT_PARAMS.items()}
+
+    # Refit on all training rows for the tree count early stopping chose
+    model = make_model(
+        params, categorical, seed, max_iter=int(best["n_iter"]), early_stopping=False
+    ).fit(X_train, y_train)
+    metadata = {
+        "grain": grain,
+        "features": features,
+        "params": params,
+        "n_iter": int(best["n_iter"]),
+        "train_rows": len(X_train),
+        "test_rows": len(X_test),
+        "metrics": evaluate(y_test, model.predict(X_test)),
+        "trials": len(log),
+        "trained_at": datetime.now().isoformat(timespec="seconds"),
+    }
+    return model, metadata, log
+
+
+def save(model, metadata, log, encoders, data, registry=None):
+    """Register the model and append the trials to the search log"""
+    registry = registry or ModelRegistry()
+    artifact = registry.register(
+        MODEL_NAME.format(grain=metadata["grain"]),
+        model,
+        metadata,
+        encoders=encoders,
+        data=data,
+    )
+    log.assign(
+        model=artifact.name, version=artifact.version, run=metadata["trained_at"]
+    ).to_csv(
+        SEARCH_LOG_FILE, mode="a", header=not SEARCH_LOG_FILE.exists(), index=False
+    )
+    return artifact
+
+
+def main():
+    """Build training rows, search hyperparameters and save the best model"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--grain", choices=list(GRAINS), default="district")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET, help="Seconds")
+    parser.add_argument("--trials", type=int, default=DEFAULT_TRIALS)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    # Reuse saved geography ids so encoded features stay stable across runs
+    if DIMENSION_FILE.exists():
+        geography = GeographyDimension.load(DIMENSION_FILE)
+    else:
+        geography = GeographyDimension()
+    builder = ModelFrameBuilder()
+    ingest("enrolment", [builder], geography=geography)
+    geography.save(DIMENSION_FILE)
+    rows = builder.frame(args.grain)
+    print(f"✓ {len(rows):,} {args.grain} x month training rows")
+
+    model, metadata, log = train(
+        rows, args.grain, args.budget, args.workers, args.trials, args.seed
+    )
+    artifact = save(
+        model,
+        metadata,
+        log,
+        {"geography": geography},
+        rows[[*metadata["features"], TARGET]],
+    )
+
+    metrics = metadata["metrics"]
+    print(f"\n📊 BEST OF {len(log)} TRIALS ({time.perf_counter() - start:.0f}s):")
+    print(f"   Parameters: {metadata['params']}, {metadata['n_iter']} trees")
+    print(f"   R² Score: {metrics['r2']:.3f}")
+    print(f"   RMSE: {metrics['rmse']:,.2f}")
+    print(f"   MAE: {metrics['mae']:,.2f}")
+    print(
+        f"✓ Registered {artifact.name} v{artifact.version}, search log in {MODEL_PATH}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The analytics modules are scripts importing each other by name
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
@@ -0,0 +1,41 @@
+import asyncio
+
+import aggregate_service
+from aggregate_service import AggregateService
+
+
+async def exchange(request):
+    service = AggregateService()
+    server = await asyncio.start_server(service.handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(request)
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+    return response
+
+
+def test_malformed_request_line_gets_400():
+    response = asyncio.run(exchange(b"GARBAGE\r\n\r\n"))
+    assert response.startswith(b"HTTP/1.1 400 ")
+
+
+def test_loader_failure_gets_500(tmp_path, monkeypatch, capsys):
+    source = tmp_path / "broken.csv"
+    source.write_text("a\n1\n")
+
+    def loader(path):
+        raise RuntimeError("corrupt source")
+
+    monkeypatch.setitem(
+        aggregate_service.ENDPOINTS,
+        "broken",
+        {"source": source, "loader": loader, "description": "Always fails"},
+    )
+    response = asyncio.run(
+        exchange(b"GET /broken HTTP/1.1\r\nConnection: close\r\n\r\n")
+    )
+    assert response.startswith(b"HTTP/1.1 500 ")
+    assert "corrupt source" in capsys.readouterr().err
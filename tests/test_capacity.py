@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+
+from capacity import forecast_weekly_demand, simulate_days
+from geography import GeographyDimension
+
+
+def test_simulated_days_do_not_depend_on_batch_composition():
+    days = 2000
+    counters = np.ones(days, dtype=int)
+    alone = simulate_days(np.full(days, 30.0), counters, np.random.default_rng(1))
+    # The same days next to a much busier day, which sets the padded width
+    mixed = simulate_days(
+        np.r_[np.full(days, 30.0), 400.0],
+        np.r_[counters, 1],
+        np.random.default_rng(2),
+    )
+    for metric in ["wait_mean", "wait_p90", "utilization"]:
+        a = np.nanmean(alone[metric])
+        b = np.nanmean(mixed[metric][:days])
+        assert abs(a - b) <= 0.1 * a, metric
+
+
+def test_forecasts_join_on_canonical_districts():
+    geography = GeographyDimension()
+    geography.encode(
+        pd.DataFrame(
+            {"state": ["Karnataka"], "district": ["Bengaluru"], "pincode": ["560001"]}
+        )
+    )
+    forecasts = pd.DataFrame(
+        {
+            "level": "district",
+            "horizon": 1,
+            "month": "2026-01",
+            "state": ["KARNATAKA"],
+            "district": ["BENGALURU *"],
+            "forecast": [310.0],
+        }
+    )
+    weekly = forecast_weekly_demand(forecasts, geography)
+    assert weekly.to_dict() == {0: 70.0}
@@ -0,0 +1,22 @@
+import numpy as np
+import pytest
+
+from changepoints import segment
+
+
+@pytest.mark.parametrize("rate", [0.2, 0.5, 2.0])
+def test_stationary_sparse_series_have_few_false_shifts(rate):
+    rng = np.random.default_rng(0)
+    trials = 200
+    flagged = sum(
+        bool(segment(rng.poisson(rate, 120).astype(float))) for _ in range(trials)
+    )
+    assert flagged / trials <= 0.05
+
+
+def test_level_shift_is_found():
+    rng = np.random.default_rng(0)
+    values = np.r_[rng.poisson(5, 60), rng.poisson(20, 60)].astype(float)
+    changes = segment(values)
+    assert len(changes) == 1
+    assert abs(changes[0]["position"] - 60) <= 3
@@ -0,0 +1,64 @@
+import pandas as pd
+import pytest
+
+import dedup
+import ingest
+
+ROWS = pd.DataFrame(
+    {
+        "date": ["01-12-2025", "02-12-2025"],
+        "state": ["Karnataka", "Karnataka"],
+        "district": ["Bengaluru", "Bengaluru"],
+        "pincode": ["560001", "560002"],
+        "age_0_5": [3, 1],
+        "age_5_17": [2, 0],
+        "age_18_greater": [1, 4],
+    }
+)
+
+
+class Total:
+    def __init__(self):
+        self.total = 0
+
+    def update(self, chunk):
+        self.total += chunk["total_enrollments"].sum()
+        return self
+
+
+@pytest.fixture
+def shards(tmp_path, monkeypatch):
+    raw = tmp_path / "raw"
+    (raw / "enrolment").mkdir(parents=True)
+    ROWS.to_csv(raw / "enrolment" / "a.csv", index=False)
+    # Shard b re-delivers the first row of shard a next to a new row
+    pd.concat([ROWS.iloc[:1], ROWS.iloc[1:].assign(pincode="560003")]).to_csv(
+        raw / "enrolment" / "b.csv", index=False
+    )
+    monkeypatch.setattr(ingest, "RAW_PATH", raw)
+    monkeypatch.setattr(dedup, "DEDUP_PATH", tmp_path / "fingerprints")
+
+
+def test_redelivered_row_is_counted_once(shards):
+    expected = 6 + 5 + 5
+    for _ in range(2):  # reruns see the same rows
+        total = Total()
+        ingest.ingest("enrolment", [total], verbose=False)
+        assert total.total == expected
+
+    # Reading a single shard keeps only the rows that shard owns
+    total = Total()
+    ingest.ingest("enrolment", [total], shards=ingest.list_shards("enrolment")[1:])
+    assert total.total == 5
+
+    total = Total()
+    ingest.ingest("enrolment", [total], dedup=False, verbose=False)
+    assert total.total == expected + 6
+
+
+def test_bloom_filter_is_sized_from_the_shards(shards, monkeypatch):
+    assert dedup.shard_rows(ingest.list_shards("enrolment")) == 4
+    monkeypatch.setattr(dedup, "MIN_CAPACITY", 1)
+    store = dedup.indexed_store("enrolment")
+    assert store.meta["capacity"] == dedup.GROWTH_FACTOR * 4
+    assert store.false_positive_rate() < dedup.DEFAULT_ERROR_RATE
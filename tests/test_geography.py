@@ -0,0 +1,25 @@
+import pandas as pd
+
+from geography import GeographyDimension
+
+
+def _chunk(districts, state="Karnataka"):
+    return pd.DataFrame(
+        {"state": state, "district": districts, "pincode": "560001"}, dtype=str
+    )
+
+
+def test_district_names_do_not_depend_on_shard_order():
+    shards = [
+        _chunk(["Bangalore", "Mysore", "Chikka Ballapur"]),
+        _chunk(["BENGALURU", "Mysuru", "Chikkaballapur", "Chikkaballapur"]),
+    ]
+    names = []
+    for order in [shards, shards[::-1]]:
+        geography = GeographyDimension()
+        for shard in order:
+            geography.update(shard)
+        names.append(sorted(geography.districts()["district"]))
+
+    # Alias targets win; otherwise the most frequent spelling
+    assert names[0] == names[1] == ["Bengaluru", "Chikkaballapur", "Mysuru"]
@@ -0,0 +1,17 @@
+import numpy as np
+
+from inequality import _weighted_metrics
+
+
+def test_atkinson_ignores_zero_values_left_out_of_a_replicate():
+    x = np.array([0.0, 1.0, 2.0, 5.0])
+    replicate = _weighted_metrics(x, np.array([0, 1, 2, 1]), np.array([0]))
+    without_zero = _weighted_metrics(x[1:], np.array([1, 2, 1]), np.array([0]))
+    for eps in ["0.5", "1", "2"]:
+        name = f"atkinson_{eps}"
+        assert np.isfinite(replicate[name]).all()
+        np.testing.assert_allclose(replicate[name], without_zero[name])
+
+    # A zero value that is present makes the eps >= 1 indices 1
+    point = _weighted_metrics(x, np.ones(4), np.array([0]))
+    assert point["atkinson_1"][0, 0] == point["atkinson_2"][0, 0] == 1
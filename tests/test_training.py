@@ -0,0 +1,27 @@
+import numpy as np
+import pandas as pd
+
+from training import TARGET, ModelFrameBuilder, train
+
+
+def test_trains_on_a_single_month_without_lag_features():
+    rng = np.random.default_rng(0)
+    n = 400
+    counts = rng.poisson([3, 2, 1], (n, 3))
+    chunk = pd.DataFrame(
+        {
+            "state_id": rng.integers(0, 4, n),
+            "district_id": rng.integers(0, 40, n),
+            "pincode_id": np.arange(n),
+            "date": pd.Timestamp("2025-12-31"),
+            "age_0_5": counts[:, 0],
+            "age_5_17": counts[:, 1],
+            "age_18_greater": counts[:, 2],
+        }
+    )
+    chunk[TARGET] = counts.sum(axis=1)
+    rows = ModelFrameBuilder().update(chunk).frame("pincode")
+
+    model, metadata, log = train(rows, "pincode", budget=30, workers=1, trials=1)
+    assert not any(col.startswith("prev_") for col in metadata["features"])
+    assert len(model.predict(rows[metadata["features"]].to_numpy(float))) == n